@@ -0,0 +1,99 @@
+import os
+import time
+import argparse
+
+from src.database.logics import PostgresConnector
+
+
+def create_synthetic_table(db, schema_name, table_name, n_rows):
+    """
+    --------------------
+    Description
+    --------------------
+    -> create_synthetic_table (function): Function that creates a synthetic table mixing numeric, text, date and timestamp columns with generate_series()
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor
+    -> schema_name (str): Name of the schema in which the table is created
+    -> table_name (str): Name of the table to be created
+    -> n_rows (int): Number of rows of the table
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    db.cursor.execute(f"DROP TABLE IF EXISTS {schema_name}.{table_name}")
+    db.cursor.execute(f"""CREATE TABLE {schema_name}.{table_name} AS
+        SELECT i AS id,
+               (i % 1000)::integer AS small_int,
+               random() * 1000 AS amount,
+               round((random() * 100)::numeric, 2) AS price,
+               'label_' || (i % 97) AS label,
+               md5(i::text) AS hash,
+               date '2000-01-01' + (i % 9000) AS day,
+               timestamptz '2000-01-01' + i * interval '1 minute' AS created_at
+        FROM generate_series(1, {n_rows}) AS i""")
+    db.conn.commit()
+
+
+def time_load(db, schema_name, table_name, engine):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_load (function): Function that loads a table with the requested extraction backend and measures its throughput
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table to be loaded
+    -> engine (str): Extraction backend passed to load_table() ('fetchall' or 'copy')
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Number of rows loaded and elapsed time in seconds
+
+    """
+    start = time.perf_counter()
+    df = db.load_table(schema_name, table_name, engine=engine)
+    elapsed = time.perf_counter() - start
+    return df.shape[0], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the rows/sec of the fetchall and COPY extraction backends of PostgresConnector.load_table")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--schema", default="public")
+    parser.add_argument("--table", default="benchmark_extraction")
+    args = parser.parse_args()
+
+    db = PostgresConnector(database=os.getenv('POSTGRES_DB', 'postgres'),
+                           user=os.getenv('POSTGRES_USER', 'postgres'),
+                           password=os.getenv('POSTGRES_PASSWORD', 'password'),
+                           host=os.getenv('POSTGRES_HOST', '127.0.0.1'),
+                           port=os.getenv('POSTGRES_PORT', '5432'))
+    db.open_connection()
+    db.open_cursor()
+    create_synthetic_table(db, args.schema, args.table, args.rows)
+    try:
+        for engine in ['fetchall', 'copy']:
+            timings = [time_load(db, args.schema, args.table, engine) for _ in range(args.repeat)]
+            n_rows, best = min(timings, key=lambda timing: timing[1])
+            print(f"{engine:>8}: {n_rows:,} rows in {best:.2f}s -> {n_rows / best:,.0f} rows/sec (best of {args.repeat})")
+    finally:
+        db.cursor.execute(f"DROP TABLE IF EXISTS {args.schema}.{args.table}")
+        db.conn.commit()
+        db.close_cursor()
+        db.close_connection()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from src.dataframe.logics import Dataset, ProcessProfiler, profile_series
+
+
+def create_synthetic_dataset(n_rows, n_cols, seed=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> create_synthetic_dataset (function): Function that creates a Dataset loaded in pandas whose columns cycle through floats, integers, dates and low-cardinality text, with some missing values
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows of the dataframe
+    -> n_cols (int): Number of columns of the dataframe
+    -> seed (int): Seed of the random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (Dataset): Dataset with its dataframe and its lists of numeric, text and date columns
+
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    data = Dataset(table_name='benchmark_local_profiling')
+    data.num_cols, data.text_cols, data.date_cols = [], [], []
+    labels = np.array([f"label_{i}" for i in range(500)], dtype=object)
+    for i in range(n_cols):
+        name = f"col_{i}"
+        if i % 4 == 0:
+            values = rng.normal(size=n_rows)
+            values[rng.random(n_rows) < 0.01] = np.nan
+            data.num_cols.append(name)
+        elif i % 4 == 1:
+            values = rng.integers(-1000, 1000, size=n_rows)
+            data.num_cols.append(name)
+        elif i % 4 == 2:
+            values = np.datetime64('2000-01-01') + rng.integers(0, 9000, size=n_rows).astype('timedelta64[D]')
+            data.date_cols.append(name)
+        else:
+            values = labels[rng.integers(0, labels.shape[0], size=n_rows)]
+            data.text_cols.append(name)
+        columns[name] = values
+    data.df = pd.DataFrame(columns)
+    return data
+
+
+def time_sequential(data):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_sequential (function): Function that profiles every column of the Dataset one after the other in the current process
+
+    --------------------
+    Parameters
+    --------------------
+    -> data (Dataset): Dataset loaded in pandas
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Elapsed time in seconds
+
+    """
+    start = time.perf_counter()
+    for kind, col_name in ProcessProfiler(data).get_columns():
+        profile_series(data.df[col_name], kind)
+    return time.perf_counter() - start
+
+
+def time_processes(data, max_workers):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_processes (function): Function that profiles every column of the Dataset on a pool of worker processes through shared memory (ProcessProfiler)
+
+    --------------------
+    Parameters
+    --------------------
+    -> data (Dataset): Dataset loaded in pandas
+    -> max_workers (int): Number of worker processes
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Elapsed time in seconds
+
+    """
+    start = time.perf_counter()
+    for _ in ProcessProfiler(data, max_workers=max_workers).run():
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare profiling the columns of a dataframe sequentially and on a process pool sharing the columns through shared memory")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    data = create_synthetic_dataset(args.rows, args.cols)
+    print(f"{args.rows:,} rows x {args.cols} columns, {data.df.memory_usage(deep=False).sum() / 1024 ** 3:.1f} GiB, {os.cpu_count()} CPUs")
+    sequential = time_sequential(data)
+    print(f"sequential: {sequential:.2f}s")
+    processes = time_processes(data, args.workers)
+    print(f" processes: {processes:.2f}s with {args.workers} workers -> {sequential / processes:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+import os
+import time
+import argparse
+
+from src.database.logics import PostgresConnector
+from src.database.queries import get_table_schema_query
+
+
+def get_correlated_schema_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_correlated_schema_query (function): Function that returns the previous information_schema version of get_table_schema_query(), which checks every column with a correlated EXISTS on constraint_column_usage, as the baseline of the benchmark
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): The correlated schema query
+
+    """
+    return f"SELECT c.table_name, c.column_name, c.data_type, CASE WHEN EXISTS(SELECT 1 FROM INFORMATION_SCHEMA.constraint_column_usage k WHERE c.table_name = k.table_name and k.column_name = c.column_name) THEN true ELSE false END as primary_key, c.is_nullable, c.character_maximum_length, c.numeric_precision FROM INFORMATION_SCHEMA.COLUMNS c WHERE c.table_schema='{schema_name}' AND c.table_name='{table_name}'"
+
+
+def create_synthetic_catalog(db, schema_name, n_tables, batch_size=500):
+    """
+    --------------------
+    Description
+    --------------------
+    -> create_synthetic_catalog (function): Function that creates a schema with many small tables, each with a primary key, a unique column, a foreign key to the previous table and an index, committing every batch of tables to keep the number of locks held by a transaction bounded
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor
+    -> schema_name (str): Name of the schema in which the tables are created
+    -> n_tables (int): Number of tables to create
+    -> batch_size (int): Number of tables created per transaction
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    db.cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+    db.conn.commit()
+    for i in range(n_tables):
+        parent = f" REFERENCES {schema_name}.table_{i - 1}" if i else ""
+        db.cursor.execute(f"""CREATE TABLE {schema_name}.table_{i} (
+            id integer PRIMARY KEY,
+            code varchar(20) UNIQUE,
+            parent_id integer{parent},
+            amount numeric(12, 2),
+            created date)""")
+        db.cursor.execute(f"CREATE INDEX ON {schema_name}.table_{i} (created)")
+        if (i + 1) % batch_size == 0:
+            db.conn.commit()
+    db.conn.commit()
+    db.cursor.execute("ANALYZE pg_catalog.pg_class, pg_catalog.pg_attribute, pg_catalog.pg_constraint, pg_catalog.pg_index, pg_catalog.pg_type")
+    db.conn.commit()
+
+
+def drop_synthetic_catalog(db, schema_name, n_tables, batch_size=500):
+    """
+    --------------------
+    Description
+    --------------------
+    -> drop_synthetic_catalog (function): Function that drops the tables created by create_synthetic_catalog() in batches, so that no transaction locks the whole catalog at once, and then drops the schema
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor
+    -> schema_name (str): Name of the schema of the tables
+    -> n_tables (int): Number of tables to drop
+    -> batch_size (int): Number of tables dropped per transaction
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    db.conn.rollback()
+    for start in range(0, n_tables, batch_size):
+        tables = ", ".join(f"{schema_name}.table_{i}" for i in range(start, min(start + batch_size, n_tables)))
+        db.cursor.execute(f"DROP TABLE IF EXISTS {tables} CASCADE")
+        db.conn.commit()
+    db.cursor.execute(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
+    db.conn.commit()
+
+
+def time_query(db, query, repeat):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_query (function): Function that runs a query several times and returns its best elapsed time
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor
+    -> query (str): SQL query to be timed
+    -> repeat (int): Number of runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Number of rows returned and best elapsed time in seconds
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db.cursor.execute(query)
+        n_rows = len(db.cursor.fetchall())
+        timings.append(time.perf_counter() - start)
+    return n_rows, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the correlated information_schema query and the set-based pg_catalog query used by PostgresConnector.get_table_schema on a catalog with many tables")
+    parser.add_argument("--tables", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--schema", default="benchmark_catalog")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated schema after the benchmark")
+    args = parser.parse_args()
+
+    db = PostgresConnector(database=os.getenv('POSTGRES_DB', 'postgres'),
+                           user=os.getenv('POSTGRES_USER', 'postgres'),
+                           password=os.getenv('POSTGRES_PASSWORD', 'password'),
+                           host=os.getenv('POSTGRES_HOST', '127.0.0.1'),
+                           port=os.getenv('POSTGRES_PORT', '5432'))
+    db.open_connection()
+    db.open_cursor()
+    drop_synthetic_catalog(db, args.schema, args.tables)
+    table_name = f"table_{args.tables // 2}"
+    try:
+        start = time.perf_counter()
+        create_synthetic_catalog(db, args.schema, args.tables)
+        print(f"created {args.tables:,} tables in {time.perf_counter() - start:.1f}s")
+        for name, get_query in [('correlated', get_correlated_schema_query), ('set-based', get_table_schema_query)]:
+            n_rows, best = time_query(db, get_query(args.schema, table_name), args.repeat)
+            print(f"{name:>10}: {n_rows} columns in {best * 1000:,.1f}ms (best of {args.repeat})")
+    finally:
+        if not args.keep:
+            drop_synthetic_catalog(db, args.schema, args.tables)
+        db.close_cursor()
+        db.close_connection()
+
+
+if __name__ == '__main__':
+    main()
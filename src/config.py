@@ -1,5 +1,10 @@
+import os
 import streamlit as st
 
+from src.dataframe.logics import DatasetCache
+
+PROFILES_MAX_BYTES = int(os.getenv('PROFILES_MAX_BYTES', 256 * 1024 ** 2))
+
 def set_app_config():
     """
     --------------------
@@ -128,5 +133,182 @@ def display_session_state():
     """
     st.write(st.session_state)
 
+def get_profile_key(kind, col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_profile_key (function): Function that builds the key under which the profile of a column of the selected table is memoized in the Streamlit session state
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Type of the profiled column ('numeric', 'text' or 'date')
+    -> col_name (str): Name of the profiled column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return a tuple made of the selected schema and table, the version token of the loaded Dataset, the sampling percentage, the precision of the distinct counts and the number of counters of the frequent values used for profiling, the type of the column and its name
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Key of the memoized profile
+
+    """
+    data = st.session_state['data']
+    version = data.version if data is not None else None
+    return (st.session_state['schema_selected'], st.session_state['table_selected'], version, st.session_state.get('sample_percent'), st.session_state.get('distinct_precision'), st.session_state.get('frequent_capacity'), kind, col_name)
+
+def get_column_profile(kind, col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_column_profile (function): Function that returns the memoized profile of a column of the selected table
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Type of the profiled column ('numeric', 'text' or 'date')
+    -> col_name (str): Name of the profiled column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Retrieve the cache of memoized profiles from the session state
+    -> Return the profile stored for the key of the column (get_profile_key()) and mark it as the most recently used, or None if the column has not been profiled yet or its profile has been evicted
+
+    --------------------
+    Returns
+    --------------------
+    -> (NumericColumn, TextColumn or DateColumn): The profiled column object, or None
+
+    """
+    profiles = st.session_state.get('profiles')
+    if profiles is None:
+        return None
+    return profiles.get(get_profile_key(kind, col_name))
+
+def set_column_profile(kind, col_name, profile):
+    """
+    --------------------
+    Description
+    --------------------
+    -> set_column_profile (function): Function that memoizes the profile of a column of the selected table in the Streamlit session state, in a cache holding at most PROFILES_MAX_BYTES bytes of series and dataframes (set by the PROFILES_MAX_BYTES environment variable)
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Type of the profiled column ('numeric', 'text' or 'date')
+    -> col_name (str): Name of the profiled column
+    -> profile (NumericColumn, TextColumn or DateColumn): The profiled column object
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Create the cache of memoized profiles (DatasetCache) in the session state if it does not exist
+    -> Store the profile under the key of the column (get_profile_key()), which evicts the least recently used profiles above the memory cap
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    if st.session_state.get('profiles') is None:
+        st.session_state['profiles'] = DatasetCache(max_bytes=PROFILES_MAX_BYTES)
+    st.session_state['profiles'].put(get_profile_key(kind, col_name), profile)
+
+def clear_column_profiles(schema_name=None, table_name=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> clear_column_profiles (function): Function that forgets the memoized profiles of the columns of a table or, if no names are given, of every table
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table (optional)
+    -> table_name (str): Name of the table (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> For every key of the memoized profiles:
+        -> Remove its profile if its schema and table match the given names (names that are None match everything)
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    profiles = st.session_state.get('profiles')
+    if profiles is None:
+        return
+    for key in list(profiles.entries):
+        if (schema_name is None or key[0] == schema_name) and (table_name is None or key[1] == table_name):
+            profiles.remove(key)
+
+def get_refresh_note(state):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_refresh_note (function): Function that describes the last scan of an incremental refresh
+
+    --------------------
+    Parameters
+    --------------------
+    -> state (IncrementalState): Position of the last scan of the refresh
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return the number of appended rows merged by the last scan if it was incremental
+    -> Otherwise return the number of rows of the table counted by the scan, and why the whole table was read
 
+    --------------------
+    Returns
+    --------------------
+    -> (str): Note on the last refresh
+
+    """
+    if state.incremental:
+        return f"Refreshed with the {state.n_scanned:,} rows appended since the previous refresh."
+    return f"Counted the {state.n_scanned:,} rows of the whole table (first refresh, or rows were updated, deleted or truncated since); the next refresh only counts the appended rows."
+
+def display_refresh_profile(profile, key):
+    """
+    --------------------
+    Description
+    --------------------
+    -> display_refresh_profile (function): Function that displays a button refreshing the profile of a column with the rows appended since its previous refresh, and a note on the last refresh
 
+    --------------------
+    Parameters
+    --------------------
+    -> profile (NumericColumn, TextColumn or DateColumn): The profiled column object
+    -> key (str): Key of the button
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Display a button that sets the watermark column selected in the session state on the profile and refreshes it (refresh())
+    -> If the profile has been refreshed, display a note on its last refresh (get_refresh_note())
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    if st.button('Refresh profile', key=key):
+        profile.watermark_column = st.session_state.get('watermark_column')
+        with st.spinner('Refreshing profile...'):
+            profile.refresh()
+    if profile.state is not None:
+        st.caption(get_refresh_note(profile.state))
@@ -1,9 +1,13 @@
 import streamlit as st
 import os
 import pandas as pd
-from src.database.logics import PostgresConnector
-from src.dataframe.display import read_data
-from src.config import set_session_states, display_session_state
+from src.database.logics import PostgresConnector, CatalogCache
+from src.dataframe.display import read_data, get_dataset_cache
+from src.config import set_session_states, display_session_state, clear_column_profiles
+
+SAMPLE_PERCENTS = {'the whole table': None, 'a 10% sample of the table': 10, 'a 1% sample of the table': 1, 'a 0.1% sample of the table': 0.1}
+DISTINCT_PRECISIONS = {'exactly': None, 'approximately (HyperLogLog, ±0.4%)': 16, 'approximately (HyperLogLog, ±1.6%)': 12}
+FREQUENT_CAPACITIES = {'exactly in Postgres': None, 'approximately (Space-Saving, 1,000 counters)': 1000}
 
 def display_db_connection_menu():
     """
@@ -64,14 +68,16 @@ def connect_db():
     --------------------
     Pseudo-Code
     --------------------
-    -> Instantiate a PostgresConnector() class by passing the database name, user, password, host and port from the streamlit session states
+    -> If a PostgresConnector object is already stored in the streamlit session states, close the connections held by its pool
+    -> Instantiate a PostgresConnector() class by passing the database name, user, password, host and port from the streamlit session states and enabling its connection pool
     -> Open an active database connection by calling the open_connection() function
     -> If connection object returned from open_connection() function is None:
         -> Show an error message stating that the connection failed
     -> Else if the status of the connection is 1:
         -> Show a successful message stating that a database connection has been established
         -> Set the session states for database connection status and PostgresConnector object
-    -> Close the active database connection by calling close_connection() function
+        -> Instantiate a CatalogCache() class for the PostgresConnector object, shared by all the tabs, and store it in the session states
+    -> Close the active database connection by calling close_connection() function, which returns it to the pool
 
     --------------------
     Returns
@@ -79,11 +85,14 @@ def connect_db():
     -> None
 
     """
+    if st.session_state['db'] is not None:
+        st.session_state['db'].close_pool()
     postgresConnector = PostgresConnector(database=st.session_state['db_name'], 
                                           user=st.session_state['db_user'], 
                                           password=st.session_state['db_pass'], 
                                           host=st.session_state['db_host'], 
-                                          port=st.session_state['db_port'])
+                                          port=st.session_state['db_port'],
+                                          use_pool=True)
     conn_object = postgresConnector.open_connection()
     if conn_object is None:
         st.error(f"connection to server at \"{st.session_state['db_host']}\", port {st.session_state['db_port']} failed: FATAL: password authentication failed for user \"{st.session_state['db_user']}\"")
@@ -91,6 +100,7 @@ def connect_db():
     elif conn_object.status == 1:
         st.success('Connection to database established', icon="ℹ️")
         set_session_states(['db_status', 'db'], [conn_object.status, postgresConnector])
+        st.session_state['catalog'] = CatalogCache(postgresConnector)
     postgresConnector.close_connection()
 
 def display_table_selection():
@@ -108,15 +118,15 @@ def display_table_selection():
     --------------------
     Pseudo-Code
     --------------------
-    -> Open an active database connection by calling the open_connection() function for the PostgresConnector object stored in streamlit session states
-    -> Open an active cursor by calling the open_cursor() function for the PostgresConnector object stored in streamlit session states
-    -> Retrieve the list of tables from the database by calling the list_tables() function
-    -> Create a streamlit selectbox widget by passing the list of tables as the options for the selectbox
+    -> Retrieve the list of tables from the CatalogCache object stored in streamlit session states (get_tables()), which only queries the database when it is not cached or expired
+    -> Create a streamlit selectbox widget by passing the list of tables as the options for the selectbox, labelled with their estimated number of rows and size (format_table_option())
     -> Retrieve the selected table and from it retrieve the selected schema and table
     -> Set the streamlit session states for schema selected and table selected
-    -> Close the active cursor
-    -> Close the active database connection
-    -> Call the read_data() function to retrieve the Dataset() object for the selected schema and table
+    -> Create a streamlit selectbox widget for profiling the columns on the whole table or on a TABLESAMPLE sample of it and set the session state for the sampling percentage
+    -> Create a streamlit selectbox widget for counting the unique values of the columns exactly or with a HyperLogLog sketch and set the session state for its precision
+    -> Create a streamlit selectbox widget for counting the most frequent values of the columns exactly or with a SpaceSaving summary and set the session state for its number of counters
+    -> Create a Reload button that, when clicked, removes the selected table from the Dataset cache and forgets its column profiles, the cached catalog of its schema and the loaded Dataset() object
+    -> Call the read_data() function to retrieve the Dataset() object for the selected schema and table (reused from the session state or the cache when possible)
     -> Set the session state for the Dataset() object
 
     --------------------
@@ -124,15 +134,57 @@ def display_table_selection():
     --------------------
     -> None
     """
-    st.session_state['db'].open_connection()
-    st.session_state['db'].open_cursor()
-    list_schema_tables = st.session_state['db'].list_tables()
-    selected_schema_table = st.selectbox(label='Select a table name', options=list_schema_tables)
+    list_schema_tables, _ = st.session_state['catalog'].get_tables()
+    selected_schema_table = st.selectbox(label='Select a table name', options=list_schema_tables, format_func=format_table_option)
     split_schema_table = selected_schema_table.split(".")
     selected_schema = split_schema_table[0]
     selected_table = split_schema_table[1]
     set_session_states(['schema_selected', 'table_selected'], [selected_schema, selected_table])
-    st.session_state['db'].close_cursor()
-    st.session_state['db'].close_connection()
+    st.session_state['sample_percent'] = SAMPLE_PERCENTS[st.selectbox(label='Profile columns on', options=list(SAMPLE_PERCENTS))]
+    st.session_state['distinct_precision'] = DISTINCT_PRECISIONS[st.selectbox(label='Count unique values', options=list(DISTINCT_PRECISIONS))]
+    st.session_state['frequent_capacity'] = FREQUENT_CAPACITIES[st.selectbox(label='Count most frequent values', options=list(FREQUENT_CAPACITIES))]
+    if st.button("Reload table"):
+        get_dataset_cache().invalidate(selected_schema, selected_table)
+        clear_column_profiles(selected_schema, selected_table)
+        st.session_state['catalog'].reload(selected_schema)
+        st.session_state['data'] = None
     data = read_data()
-    set_session_states(['data'], [data])
\ No newline at end of file
+    set_session_states(['data'], [data])
+
+def format_table_option(schema_table):
+    """
+    --------------------
+    Description
+    --------------------
+    -> format_table_option (function): Function that formats the label of a table in the table selection box with its estimated number of rows and size
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_table (str): Name of the table in the form of schema.table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Retrieve the estimated number of rows and size of the table from the CatalogCache object stored in the streamlit session states
+    -> If they are not available, return the name of the table
+    -> Convert the size in bytes to the largest unit that keeps it above 1
+    -> Return the name of the table followed by the estimated number of rows and the size
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the label of the table
+    """
+    sizes = st.session_state['catalog'].get_tables()[1]
+    if schema_table not in sizes:
+        return schema_table
+    n_rows, n_bytes = sizes[schema_table]
+    size = float(n_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            break
+        size /= 1024
+    else:
+        unit = 'TB'
+    return f"{schema_table} (~{n_rows:,} rows, {size:.1f} {unit})"
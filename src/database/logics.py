@@ -1,94 +1,2089 @@
+import io
+import time
+import uuid
+import asyncio
+import threading
 import psycopg2
-from psycopg2 import OperationalError
+from psycopg2 import OperationalError, InterfaceError
+from psycopg2.extensions import POLL_OK, POLL_READ, POLL_WRITE
+import numpy as np
 import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
 
-from src.database.queries import get_tables_list_query, get_table_data_query, get_table_schema_query
+from src.database.queries import get_catalog_columns_query, get_tables_list_query, get_table_sizes_query, get_table_data_query, get_table_schema_query, get_copy_query, get_query_columns_query, get_table_sample_query, get_table_estimate_query, get_table_changes_query, get_new_rows_condition, get_scan_query, get_hll_registers_query, get_top_values_query, get_extension_query, get_distinct_count_query, get_non_missing_query
+
+BOOL_TYPE_OIDS = [16]
+TEXT_TYPE_OIDS = [18, 19, 25, 1042, 1043]
+DATE_TYPE_OIDS = [1082, 1114]
+DATETZ_TYPE_OIDS = [1184]
+NUMERIC_TYPE_OIDS = [20, 21, 23, 700, 701, 1700]
+COLUMN_ENGINE = 'arrow' if pa is not None else 'fetchall'
+COLUMN_KIND_TYPE_OIDS = {
+    'numeric': NUMERIC_TYPE_OIDS + [790],
+    'text': TEXT_TYPE_OIDS + [17],
+    'date': DATE_TYPE_OIDS + DATETZ_TYPE_OIDS + [1083, 1186, 1266]
+}
+HLL_PRECISIONS = range(4, 19)
+MAX_SEEN_XIDS = 10000
+MIN_SAMPLE_PERCENT = 0.0001
+
+def get_arrow_type(type_code):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_arrow_type (function): Function that returns the Arrow type into which the values of a Postgres type are parsed by arrow_query(): booleans, integers, floats, numeric (as float64), dates and timestamps keep a typed representation and every other type is read as a string
+
+    --------------------
+    Parameters
+    --------------------
+    -> type_code (int): Type OID of the column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return the Arrow type mapped to the type OID, or string if there is none
+
+    --------------------
+    Returns
+    --------------------
+    -> (pyarrow.DataType): Arrow type of the column
+
+    """
+    arrow_types = {16: pa.bool_(), 21: pa.int16(), 23: pa.int32(), 20: pa.int64(), 700: pa.float32(), 701: pa.float64(), 1700: pa.float64(),
+                   1082: pa.date32(), 1114: pa.timestamp('us'), 1184: pa.timestamp('us', tz='UTC')}
+    return arrow_types.get(type_code, pa.string())
+
+
+def is_arrow_serie(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> is_arrow_serie (function): Function that checks whether the values of a Pandas series are backed by an Arrow array (loaded with the 'arrow' engine)
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Pandas series to be checked
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return whether pyarrow is installed and the dtype of the series is an ArrowDtype
+
+    --------------------
+    Returns
+    --------------------
+    -> (boolean): True if the series is backed by an Arrow array
+
+    """
+    return pa is not None and isinstance(getattr(serie, 'dtype', None), pd.ArrowDtype)
+
+
+def count_arrow_values(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_arrow_values (function): Function that counts the occurrences of every non-missing value of an Arrow-backed Pandas series with pyarrow.compute, without converting its values to Python objects
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Arrow-backed Pandas series (is_arrow_serie())
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Drop the missing values of the Arrow array of the series and count the occurrences of every value (pyarrow.compute.value_counts())
+    -> Sort the values by descending number of occurrences
+    -> Return them as a Pandas dataframe with a value and an occurrence column
+
+    --------------------
+    Returns
+    --------------------
+    -> (pandas.core.frame.DataFrame): Returns the values and their number of occurrences, from the most to the least frequent
+
+    """
+    counts = pc.value_counts(pc.drop_null(pa.array(serie.array)))
+    counts = counts.take(pc.array_sort_indices(counts.field('counts'), order='descending'))
+    return pd.DataFrame({'value': counts.field('values').to_pandas(), 'occurrence': counts.field('counts').to_numpy()})
+
+def merge_totals(totals, delta, rules):
+    """
+    --------------------
+    Description
+    --------------------
+    -> merge_totals (function): Function that merges the aggregates of the rows appended to a table into the aggregates of its previous rows, so that a refreshed profile keeps a fixed number of values whatever the number of rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> totals (dict): Aggregates of the previous rows by name, None if there are none
+    -> delta (dict): Aggregates of the appended rows by name
+    -> rules (dict): How every aggregate is merged, 'sum', 'min', 'max' or None when the caller merges it
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If there are no previous aggregates, return the ones of the appended rows
+    -> Add the aggregates merged with 'sum'
+    -> Keep the smallest or largest non-missing value of the aggregates merged with 'min' or 'max', NaN being larger than any number like in Postgres
+    -> Keep the value of the appended rows for the other aggregates, which the caller merges itself
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Aggregates of all the rows
+
+    """
+    if totals is None:
+        return dict(delta)
+    merged = dict(delta)
+    for name, rule in rules.items():
+        values = [value for value in (totals[name], delta[name]) if value is not None]
+        numbers = [value for value in values if value == value]
+        if rule == 'sum':
+            merged[name] = totals[name] + delta[name]
+        elif rule == 'min':
+            merged[name] = min(numbers) if numbers else next(iter(values), None)
+        elif rule == 'max':
+            merged[name] = max(numbers) if numbers and len(numbers) == len(values) else next((value for value in values if value != value), None)
+    return merged
+
+def read_registers(result, precision=14):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_registers (function): Function that converts the result of the query of get_hll_registers_query() into a HyperLogLog sketch, which can then be merged with the sketches of other rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> result (pd.DataFrame): Result of the query of get_hll_registers_query(), with the index and value of every register that was hit
+    -> precision (int): Base-2 logarithm of the number of registers of the query (default: 14)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Create an empty HyperLogLog sketch and set the registers that were hit
+
+    --------------------
+    Returns
+    --------------------
+    -> (HyperLogLog): Sketch of the values of the query
+
+    """
+    sketch = HyperLogLog(precision)
+    if not result.empty:
+        sketch.registers[result[0].to_numpy(dtype=np.intp)] = result[1].to_numpy(dtype=np.uint8)
+    return sketch
+
+def get_bit_length(values):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_bit_length (function): Function that returns the number of bits needed to write every value of an array of unsigned 64-bit integers, i.e. the position of its leftmost 1-bit (0 for 0), with a vectorised binary search
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (np.ndarray): Array of unsigned 64-bit integers
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> For shifts of 32, 16, 8, 4, 2 and 1 bits:
+        -> Where the value shifted to the right is not 0, add the shift to the length and keep the shifted value
+    -> Add 1 to the length of the values that are not 0 after the last shift
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): Number of bits of every value
+
+    """
+    length = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >> np.uint64(shift)
+        has_high = high > 0
+        length[has_high] += shift
+        values = np.where(has_high, high, values)
+    return length + (values > 0)
+
+def sketch_serie(serie, precision=14, chunk_size=100000):
+    """
+    --------------------
+    Description
+    --------------------
+    -> sketch_serie (function): Function that adds the values of a Pandas series to a HyperLogLog sketch chunk by chunk, so that only the hashes of one chunk are held in memory at a time
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Values of the column
+    -> precision (int): Base-2 logarithm of the number of registers of the sketch (default: 14)
+    -> chunk_size (int): Number of values hashed at once (default: 100000)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Create an empty HyperLogLog sketch
+    -> Add every chunk of chunk_size values of the series to the sketch (HyperLogLog.update())
+    -> Return the sketch
+
+    --------------------
+    Returns
+    --------------------
+    -> (HyperLogLog): Sketch of the values of the series
+
+    """
+    sketch = HyperLogLog(precision)
+    for start in range(0, serie.shape[0], chunk_size):
+        sketch.update(serie.iloc[start:start + chunk_size])
+    return sketch
+
+def format_distinct_count(n_unique, error=None, value_format='{}'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> format_distinct_count (function): Function that formats the number of unique values of a column for the summary tables, followed by its relative standard error when it is estimated with a HyperLogLog sketch
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_unique (int): Number of unique values
+    -> error (float): Relative standard error of the estimate, None if the count is exact (default: None)
+    -> value_format (str): Format of an exact count (default: '{}')
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If the count is exact, format it with value_format
+    -> Otherwise format it with thousands separators, followed by its standard error as a percentage
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): The formatted number of unique values
+
+    """
+    if error is None:
+        return value_format.format(n_unique)
+    return f"{n_unique:,.0f} ± {error:.1%} (HyperLogLog)"
+
+def read_top_values(result):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_top_values (function): Function that converts the result of the query of get_top_values_query() into the dataframe of the most frequent values displayed by the column profiles
+
+    --------------------
+    Parameters
+    --------------------
+    -> result (pd.DataFrame): Result of the query of get_top_values_query(), with the value, occurrence and percentage of every row
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return a Pandas dataframe with a value, an integer occurrence and a float percentage column
+
+    --------------------
+    Returns
+    --------------------
+    -> (pandas.core.frame.DataFrame): Returns the most frequent values with their occurrence and percentage
+
+    """
+    if result.empty:
+        return pd.DataFrame({'value': pd.Series(dtype=object), 'occurrence': pd.Series(dtype='int64'), 'percentage': pd.Series(dtype='float64')})
+    return pd.DataFrame({'value': result[0].to_numpy(), 'occurrence': result[1].to_numpy(dtype='int64'), 'percentage': result[2].to_numpy(dtype='float64')})
+
+def sketch_top_values(serie, capacity=1000, chunk_size=100000):
+    """
+    --------------------
+    Description
+    --------------------
+    -> sketch_top_values (function): Function that adds the values of a Pandas series to a SpaceSaving summary chunk by chunk, so that only the counts of one chunk and of the tracked values are held in memory at a time
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Values of the column
+    -> capacity (int): Number of values tracked by the summary (default: 1000)
+    -> chunk_size (int): Number of values counted at once (default: 100000)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Create an empty SpaceSaving summary
+    -> Add every chunk of chunk_size values of the series to the summary (SpaceSaving.update())
+    -> Return the summary
+
+    --------------------
+    Returns
+    --------------------
+    -> (SpaceSaving): Summary of the most frequent values of the series
+
+    """
+    summary = SpaceSaving(capacity)
+    for start in range(0, serie.shape[0], chunk_size):
+        summary.update(serie.iloc[start:start + chunk_size])
+    return summary
+
+def read_top_summary(result, capacity=1000, n_values=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_top_summary (function): Function that converts the capacity most frequent values counted by the query of get_top_values_query() into a SpaceSaving summary, which can then be merged with the summaries of other rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> result (pd.DataFrame): Result of the query of get_top_values_query() limited to capacity values
+    -> capacity (int): Number of values tracked by the summary (default: 1000)
+    -> n_values (int): Number of non-missing values counted by the query (default: 0)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Create an empty SpaceSaving summary
+    -> Add the exact counts of the query, any other value occurring at most as often as the last one if the query returned capacity values (SpaceSaving.add_counts())
+    -> Return the summary
+
+    --------------------
+    Returns
+    --------------------
+    -> (SpaceSaving): Summary of the most frequent values of the query
+
+    """
+    summary = SpaceSaving(capacity)
+    counts = pd.Series(result[1].to_numpy(dtype='int64'), index=pd.Index(result[0].to_numpy(), dtype=object)) if not result.empty else pd.Series(dtype='int64')
+    max_error = int(counts.iloc[-1]) if len(counts) >= capacity else 0
+    summary.add_counts(counts, pd.Series(0, index=counts.index, dtype='int64'), max_error, int(n_values))
+    return summary
+
+
+def scan_column(db, schema_name, table_name, col_name, aggregates, condition=None, watermark_column=None, precision=14, capacity=1000):
+    """
+    --------------------
+    Description
+    --------------------
+    -> scan_column (function): Function that computes the mergeable state of a column on the rows of a table matching a condition, whose size does not grow with the number of rows or unique values: its aggregates, the registers of a HyperLogLog sketch and the counts of its most frequent values, together with the position of the scan
+
+    --------------------
+    Parameters
+    --------------------
+    -> db (PostgresConnector): Connector with an active connection and cursor, in the transaction of the refresh (IncrementalState.refresh())
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+    -> col_name (str): Name of the column
+    -> aggregates (list): SQL aggregates of the column computed after its number of non-missing values
+    -> condition (str): WHERE condition selecting the rows to be scanned, every row if None (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed (optional)
+    -> precision (int): Base-2 logarithm of the number of registers of the sketch (default: 14)
+    -> capacity (int): Number of values tracked by the summary of the most frequent values (default: 1000)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Compute the position of the scan, the number of non-missing values and the aggregates in one statement (get_scan_query())
+    -> Compute the registers of the sketch (get_hll_registers_query(), read_registers())
+    -> Count the capacity most frequent values (get_top_values_query(), read_top_summary())
+    -> Return the position, the number of non-missing values followed by the aggregates, the sketch and the summary
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Position of the scan (snapshot, watermark, number of scanned rows and seen xmin), values of the aggregates, HyperLogLog sketch and SpaceSaving summary
+
+    """
+    row = db.run_query(get_scan_query(schema_name, table_name, [f"count({col_name})"] + aggregates, condition, watermark_column)).iloc[0].tolist()
+    sketch = read_registers(db.run_query(get_hll_registers_query(schema_name, table_name, col_name, precision, condition)), precision)
+    top = read_top_summary(db.run_query(get_top_values_query(schema_name, table_name, col_name, capacity, condition)), capacity, row[4])
+    return row[:4], row[4:], sketch, top
+
+
+class ConnectionPool:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ConnectionPool (class): Class that keeps a bounded, thread-safe pool of open Postgres connections so that they can be reused instead of reconnecting for every query
+
+    --------------------
+    Attributes
+    --------------------
+    -> connection_args (dict): Keyword arguments passed to psycopg2.connect() when a new connection has to be created (mandatory)
+    -> min_size (int): Number of connections that are kept open even when they are idle (optional)
+    -> max_size (int): Maximum number of connections (checked out and idle) that can be open at the same time (optional)
+    -> idle_timeout (int): Number of seconds after which an idle connection above min_size is closed (optional)
+    -> checkout_timeout (int): Number of seconds to wait for a connection to be returned when the pool is exhausted (optional)
+    -> idle (list): List of (connection, time of return) tuples for the connections that are currently available in the pool
+    -> n_open (int): Number of connections currently opened by the pool (checked out and idle)
+    -> lock (threading.Condition): Condition used for synchronising the threads that check out and return connections
+    """
+    def __init__(self, connection_args, min_size=1, max_size=5, idle_timeout=300, checkout_timeout=30):
+        self.connection_args = connection_args
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.idle = []
+        self.n_open = 0
+        self.lock = threading.Condition()
+
+    def get_connection(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_connection (method): Class method that checks out a healthy connection from the pool, creating a new one if none is idle and the pool is not full
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Loop:
+            -> Under the lock of the pool:
+                -> Close the idle connections that exceeded the idle timeout while keeping at least min_size connections open
+                -> If there is an idle connection, take the most recently returned one
+                -> Else if fewer than max_size connections are open, reserve a slot for a new connection
+                -> Else wait for another thread to return a connection, return None if the checkout timeout is reached
+            -> Outside the lock, so that other threads can check out connections meanwhile:
+                -> If an idle connection was taken, return it if it is healthy (is_healthy()), otherwise discard it and try again
+                -> Otherwise create a new connection by calling the connect() function of psycopg2 and return it
+                -> If the connection fails, release the reserved slot and return None
+
+        --------------------
+        Returns
+        --------------------
+        -> (psycopg2.extensions.connection): Returns an active connection object if a connection is available, otherwise returns None
+
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            conn = None
+            with self.lock:
+                self.prune_idle()
+                while True:
+                    if self.idle:
+                        conn, _ = self.idle.pop()
+                        break
+                    if self.n_open < self.max_size:
+                        self.n_open += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self.lock.wait(remaining)
+            if conn is None:
+                try:
+                    return psycopg2.connect(**self.connection_args)
+                except OperationalError:
+                    with self.lock:
+                        self.n_open -= 1
+                        self.lock.notify()
+                    return None
+            if self.is_healthy(conn):
+                return conn
+            with self.lock:
+                self.discard(conn)
+                self.lock.notify()
+
+    def put_connection(self, conn):
+        """
+        --------------------
+        Description
+        --------------------
+        -> put_connection (method): Class method that returns a checked out connection to the pool
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> conn (psycopg2.extensions.connection): Connection previously returned by get_connection()
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Rollback any transaction left open on the connection so that it goes back to the pool in an idle state
+        -> Acquire the lock of the pool
+        -> If the connection is still open, add it to the list of idle connections with the current time, otherwise discard it
+        -> Notify one of the threads waiting for a connection
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if conn is None:
+            return
+        try:
+            if not conn.closed:
+                conn.rollback()
+        except (OperationalError, InterfaceError):
+            pass
+        with self.lock:
+            if conn.closed:
+                self.n_open -= 1
+            else:
+                self.idle.append((conn, time.monotonic()))
+            self.lock.notify()
+
+    def is_healthy(self, conn):
+        """
+        --------------------
+        Description
+        --------------------
+        -> is_healthy (method): Class method that checks that a pooled connection can still be used for running queries
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> conn (psycopg2.extensions.connection): Connection to be checked
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the connection is closed, return False
+        -> try:
+            -> Execute a "SELECT 1" query on the connection and rollback, then return True
+        -> except:
+            -> Return False
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): True if the connection is usable, otherwise False
+
+        """
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (OperationalError, InterfaceError):
+            return False
+
+    def discard(self, conn):
+        """
+        --------------------
+        Description
+        --------------------
+        -> discard (method): Class method that closes a connection and removes it from the count of open connections (the lock of the pool must be held)
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> conn (psycopg2.extensions.connection): Connection to be discarded
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Close the connection if it is not already closed
+        -> Decrement the number of open connections
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        try:
+            if not conn.closed:
+                conn.close()
+        except (OperationalError, InterfaceError):
+            pass
+        self.n_open -= 1
+
+    def prune_idle(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> prune_idle (method): Class method that closes the idle connections that have not been used for longer than idle_timeout, keeping at least min_size connections open (the lock of the pool must be held)
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> For every idle connection, starting from the oldest one:
+            -> If it has been idle for longer than idle_timeout and more than min_size connections are open, discard it
+            -> Otherwise keep it in the list of idle connections
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        now = time.monotonic()
+        kept = []
+        for conn, returned_at in self.idle:
+            if now - returned_at > self.idle_timeout and self.n_open > self.min_size:
+                self.discard(conn)
+            else:
+                kept.append((conn, returned_at))
+        self.idle = kept
+
+    def close_all(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> close_all (method): Class method that closes all the idle connections of the pool
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Acquire the lock of the pool
+        -> Discard every idle connection and empty the list of idle connections
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        with self.lock:
+            for conn, _ in self.idle:
+                self.discard(conn)
+            self.idle = []
 
 class PostgresConnector:
     """
     --------------------
     Description
     --------------------
-    -> PostgresConnector (class): Class that manages the connection to a Postgres database
+    -> PostgresConnector (class): Class that manages the connection to a Postgres database
+
+    --------------------
+    Attributes
+    --------------------
+    -> database (str): Name of Postgres database (mandatory)
+    -> user (str): Username used for connecting to Postgres database (mandatory)
+    -> password (str): Password used for connecting to Postgres database (mandatory)
+    -> host (str): URL of Postgres database (mandatory)
+    -> port (str): Port number of Postgres database (mandatory)
+    -> conn (psycopg2._psycopg.connection): Postgres connection object (optional)
+    -> cursor (psycopg2._psycopg.connection.cursor): Postgres cursor for executing query (optional)
+    -> excluded_schemas (list): List containing the names of internal Postgres schemas to be excluded from selection (information_schema, pg_catalog)
+    -> use_pool (bool): Whether connections are checked out from a shared ConnectionPool instead of being created for every open_connection() call (optional)
+    -> pool_min_size (int): Minimum number of connections kept open by the pool (optional)
+    -> pool_max_size (int): Maximum number of connections opened by the pool (optional)
+    -> pool_idle_timeout (int): Number of seconds after which an idle pooled connection is closed (optional)
+    -> pool (ConnectionPool): Pool of connections, created on the first call of open_connection() when use_pool is True (optional)
+    """
+    def __init__(self, database="postgres", user='postgres', password='password', host='127.0.0.1', port='5432', use_pool=False, pool_min_size=1, pool_max_size=5, pool_idle_timeout=300):
+        self.database = database
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.excluded_schemas = ['information_schema', 'pg_catalog']
+        self.conn = None
+        self.cursor = None
+        self.use_pool = use_pool
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.pool = None
+
+    def get_pool(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_pool (method): Class method that returns the ConnectionPool of the connector, creating it on the first call
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the pool has not been created yet:
+            -> Instantiate a ConnectionPool class by passing the connection details and the pool sizes and idle timeout
+        -> Return the pool
+
+        --------------------
+        Returns
+        --------------------
+        -> (ConnectionPool): Returns the pool of connections of the connector
+
+        """
+        if self.pool is None:
+            connection_args = {
+                'user': self.user,
+                'password': self.password,
+                'host': self.host,
+                'port': self.port,
+                'database': self.database
+            }
+            self.pool = ConnectionPool(connection_args, min_size=self.pool_min_size, max_size=self.pool_max_size, idle_timeout=self.pool_idle_timeout)
+        return self.pool
+
+    def close_pool(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> close_pool (method): Class method that closes all the idle connections held by the pool of the connector
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the pool exists, call its close_all() method
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.pool is not None:
+            self.pool.close_all()
+    
+    def open_connection(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> open_connection (method): Class method that creates an active connection to a Postgres database
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If use_pool is True:
+            -> Check out a connection from the pool of the connector (get_pool()) and return it, or None if no connection could be obtained
+        -> try:
+            -> Create an active connection to the Postgres database by calling the connect() function of psycopg2 class and passing the user, password, host, port and name of database
+            -> Return the active connection object
+        -> except:
+            -> Return None
+
+        --------------------
+        Returns
+        --------------------
+        -> (psycopg2.extensions.connection) Returns an active connection object if connection successful, otherwise returns None
+
+        """
+        if self.use_pool:
+            self.conn = self.get_pool().get_connection()
+            return self.conn
+        try:
+            self.conn = psycopg2.connect(
+            user=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database)
+            return self.conn
+        except OperationalError:
+            self.conn = None
+            return self.conn
+
+    def close_connection(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> close_connection (method): Class method that closes an active connection to a Postgres database
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If use_pool is True:
+            -> Return the active connection to the pool of the connector so that it can be reused
+        -> Else:
+            -> Close an active connection to the Postgres database by calling the close method of the connection class in psycopg2 package
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.conn:
+            if self.use_pool:
+                self.get_pool().put_connection(self.conn)
+                self.conn = None
+            else:
+                self.conn.close()
+
+    def open_cursor(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> open_cursor (method): Class method that creates an active cursor to a Postgres database
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Create an active cursor to the Postgres database by calling the cursor method of the connection class in psycopg2 package
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.conn:
+            self.cursor = self.conn.cursor()
+        else:
+            self.cursor = None
+
+    def close_cursor(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> close_cursor (method): Class method that closes an active cursor to a Postgres database
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Close an active cursor to the Postgres database by calling the close method of the connection class in pyscopg2 package
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.cursor:
+            self.cursor.close()
+
+    def run_query(self, sql_query, engine='fetchall'):
+        """
+        --------------------
+        Description
+        --------------------
+        -> run_query (method): Class method that executes a SQL query and returns the result as a Pandas dataframe
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be executed on the database
+        -> engine (str): Extraction backend, 'fetchall' to fetch the rows as tuples, 'copy' to stream them with COPY and parse them with copy_query() or 'arrow' to parse them into Arrow columns with arrow_query() (default: 'fetchall')
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the engine is 'copy' or 'arrow':
+            -> Extract the result with copy_query(), or with arrow_query() converted to a Pandas dataframe with Arrow-backed dtypes, and name its columns with their position, like the fetchall engine
+            -> Return the Pandas dataframe
+        -> Execute the SQL query by passing the sql_query parameter to the execute() method of the cursor class in psycopg2 package
+        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method of the cursor class and store them in a variable
+        -> Convert the results of the SQL query to a Pandas dataframe
+        -> Return the Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the result of a SQL query as a Pandas dataframe
+
+        """
+        if self.cursor and sql_query:
+            if engine in ('copy', 'arrow'):
+                query_result_df = self.copy_query(sql_query) if engine == 'copy' else self.arrow_query(sql_query).to_pandas(types_mapper=pd.ArrowDtype)
+                query_result_df.columns = range(query_result_df.shape[1])
+                return query_result_df
+            self.cursor.execute(sql_query)
+            query_result = self.cursor.fetchall()
+            query_result_df = pd.DataFrame(query_result)
+            return query_result_df
+        return None
+        
+    def copy_query(self, sql_query):
+        """
+        --------------------
+        Description
+        --------------------
+        -> copy_query (method): Class method that extracts the result of a SQL query with COPY ... TO STDOUT in CSV format and parses it into typed columns with the vectorized CSV parser of Pandas
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be executed on the database
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Execute the query returned by get_query_columns_query() to retrieve the names and type OIDs of the columns of the result without fetching any row
+        -> Stream the result of the query returned by get_copy_query() into an in-memory buffer by calling the copy_expert() method of the cursor
+        -> Parse the buffer with the read_csv() function of Pandas, keeping the text columns as strings, mapping 't'/'f' to booleans and only treating \\N as missing
+        -> Convert the date and timestamp columns with the to_datetime() function of Pandas (UTC for timestamps with time zone)
+        -> Return the Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the result of a SQL query as a Pandas dataframe with the column names of the query
+
+        """
+        self.cursor.execute(get_query_columns_query(sql_query))
+        columns = [desc[0] for desc in self.cursor.description]
+        type_codes = [desc[1] for desc in self.cursor.description]
+        buffer = io.BytesIO()
+        self.cursor.copy_expert(get_copy_query(sql_query), buffer)
+        buffer.seek(0)
+        dtypes = {idx: object for idx, type_code in enumerate(type_codes) if type_code not in NUMERIC_TYPE_OIDS + BOOL_TYPE_OIDS}
+        df = pd.read_csv(buffer, header=None, names=range(len(columns)), dtype=dtypes, keep_default_na=False, na_values=['\\N'], true_values=['t'], false_values=['f'])
+        for idx, type_code in enumerate(type_codes):
+            if type_code in DATE_TYPE_OIDS:
+                df[idx] = pd.to_datetime(df[idx])
+            elif type_code in DATETZ_TYPE_OIDS:
+                df[idx] = pd.to_datetime(df[idx], utc=True)
+        df.columns = columns
+        return df
+
+    def arrow_query(self, sql_query):
+        """
+        --------------------
+        Description
+        --------------------
+        -> arrow_query (method): Class method that extracts the result of a SQL query with COPY ... TO STDOUT in CSV format and parses it with the multithreaded CSV reader of Apache Arrow into typed Arrow columns, without creating a Python object per value (requires the optional pyarrow package)
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be executed on the database
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Raise an ImportError if pyarrow is not installed
+        -> Execute the query returned by get_query_columns_query() to retrieve the names and type OIDs of the columns of the result without fetching any row
+        -> Map every type OID to its Arrow type (get_arrow_type())
+        -> Stream the result of the query returned by get_copy_query() into an in-memory buffer by calling the copy_expert() method of the cursor
+        -> Parse the buffer with the CSV reader of pyarrow with the Arrow types of the columns, only treating \\N as missing and mapping 't'/'f' to booleans, or return an empty table of those types if there is no row
+
+        --------------------
+        Returns
+        --------------------
+        -> (pyarrow.Table): Returns the result of a SQL query as an Arrow table with the column names of the query
+
+        """
+        if pa is None:
+            raise ImportError("The 'arrow' engine requires the pyarrow package")
+        self.cursor.execute(get_query_columns_query(sql_query))
+        schema = pa.schema([(desc[0], get_arrow_type(desc[1])) for desc in self.cursor.description])
+        buffer = io.BytesIO()
+        self.cursor.copy_expert(get_copy_query(sql_query), buffer)
+        if buffer.tell() == 0:
+            return schema.empty_table()
+        buffer.seek(0)
+        read_options = pa_csv.ReadOptions(column_names=schema.names)
+        convert_options = pa_csv.ConvertOptions(column_types=schema, null_values=['\\N'], strings_can_be_null=True, quoted_strings_can_be_null=False, true_values=['t'], false_values=['f'])
+        return pa_csv.read_csv(buffer, read_options=read_options, convert_options=convert_options)
+
+    def list_tables(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> list_tables (method): Class method that extracts the list of available tables using a SQL query (get_tables_list_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the SQL query from get_tables_list_query() function that retrieves the list of tables and their schema name from a Postgres database
+        -> Execute the SQL query by calling the execute() method of the cursor class
+        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and store them in a variable called query_result
+        -> Declare an empty list for the list of tables
+        -> For all the tables and their schema names in the SQL query result:
+            -> Check that the schema name for the table is not same as the excluded schemas (information_schema, pg_catalog)
+            -> If the schema name is not the same as the excluded schemas:
+                -> Take the table name and append it to the list of tables
+        -> Return the list of tables (which are not part of the excluded schemas)
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Returns a list of available tables from a database by exeuting a SQL query 
+
+        """
+        sql_query = get_tables_list_query()
+        if self.cursor:
+            self.cursor.execute(sql_query)
+            query_result = self.cursor.fetchall()
+            list_tables = []
+            for results in query_result:
+                result_after_split = results[0].split(".")
+                if result_after_split[0] not in self.excluded_schemas:
+                    list_tables.append(results[0])
+            return list_tables
+        return None
+
+    def list_table_sizes(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> list_table_sizes (method): Class method that extracts the estimated number of rows and the size on disk of the available tables from the catalog using a SQL query (get_table_sizes_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the SQL query from get_table_sizes_query() function that retrieves the estimated number of rows and the size of every table
+        -> Execute the SQL query by calling the execute() method of the cursor class and retrieve all the rows with the fetchall() method
+        -> Return a dictionary with the tables (which are not part of the excluded schemas) as keys and their estimated number of rows and size in bytes as values
+
+        --------------------
+        Returns
+        --------------------
+        -> (dict): Returns the estimated number of rows and the size in bytes of each available table, keyed by schema.table
+
+        """
+        sql_query = get_table_sizes_query()
+        if self.cursor:
+            self.cursor.execute(sql_query)
+            query_result = self.cursor.fetchall()
+            return {table_name: (n_rows, n_bytes) for table_name, n_rows, n_bytes in query_result if table_name.split(".")[0] not in self.excluded_schemas}
+        return None
+
+    def load_table(self, schema_name, table_name, engine='fetchall'):
+        """
+        --------------------
+        Description
+        --------------------
+        -> load_table (method): Class method that load the content of a table using a SQL query (get_table_data_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
+        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+        -> engine (str): Extraction backend, 'fetchall' to fetch the rows as tuples, 'copy' to stream them with COPY and parse them with copy_query() or 'arrow' to parse them into Arrow columns with arrow_query() (default: 'fetchall')
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the SQL query from the get_table_data_query() function by passing the schema name and the table name
+        -> If the engine is 'copy', return the Pandas dataframe returned by copy_query()
+        -> If the engine is 'arrow', return the Arrow table returned by arrow_query() converted to a Pandas dataframe with Arrow-backed dtypes
+        -> Execute the SQL query by calling the execute() method of the cursor class
+        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and the column names of the table and store it as a Pandas dataframe
+        -> Return the Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the content of a table as a Pandas dataframe by passing the name of the schema and the table to a SQL query
+
+        """
+        query = get_table_data_query(schema_name, table_name)
+        if self.cursor:
+            if engine == 'copy':
+                return self.copy_query(query)
+            if engine == 'arrow':
+                return self.arrow_query(query).to_pandas(types_mapper=pd.ArrowDtype)
+            self.cursor.execute(query)
+            df = pd.DataFrame(self.cursor.fetchall(), columns=[desc[0] for desc in self.cursor.description])
+            return df
+        return None
+
+    def load_table_chunks(self, schema_name, table_name, itersize=10000):
+        """
+        --------------------
+        Description
+        --------------------
+        -> load_table_chunks (method): Class method that streams the content of a table using a server-side cursor and a SQL query (get_table_data_query()) so that the whole table is never held as a list of tuples
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
+        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+        -> itersize (int): Number of rows fetched from the server for every chunk (default: 10000)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the SQL query from the get_table_data_query() function by passing the schema name and the table name
+        -> If there is an active connection:
+            -> Return the generator of Pandas dataframes returned by iter_query_chunks()
+        -> Return None
+
+        --------------------
+        Returns
+        --------------------
+        -> (generator): Returns a generator of Pandas dataframes holding at most itersize rows of the table each, or None if there is no active connection
+
+        """
+        query = get_table_data_query(schema_name, table_name)
+        if self.conn and query:
+            return self.iter_query_chunks(query, itersize)
+        return None
+
+    def iter_query_chunks(self, sql_query, itersize=10000):
+        """
+        --------------------
+        Description
+        --------------------
+        -> iter_query_chunks (method): Class method that executes a SQL query on a named (server-side) cursor and yields the result as Pandas dataframes of at most itersize rows
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be executed on the database
+        -> itersize (int): Number of rows fetched from the server for every chunk (default: 10000)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Create a cursor with a unique name on the active connection so that the result of the query stays on the server, without colliding with other streams open on the same connection, and set its itersize
+        -> Execute the SQL query on the named cursor
+        -> Loop:
+            -> Retrieve the next itersize rows by calling the fetchmany() method of the cursor
+            -> If no rows were retrieved and at least one chunk has been yielded, stop
+            -> Yield the rows as a Pandas dataframe with the column names of the query (an empty table yields one empty dataframe)
+        -> Close the named cursor
+
+        --------------------
+        Returns
+        --------------------
+        -> (generator): Yields Pandas dataframes of at most itersize rows
+
+        """
+        cursor = self.conn.cursor(name=f"data_explorer_stream_{uuid.uuid4().hex}")
+        cursor.itersize = itersize
+        try:
+            cursor.execute(sql_query)
+            n_chunks = 0
+            while True:
+                rows = cursor.fetchmany(itersize)
+                if not rows and n_chunks > 0:
+                    break
+                columns = [desc[0] for desc in cursor.description]
+                yield pd.DataFrame(rows, columns=columns)
+                n_chunks += 1
+                if not rows:
+                    break
+        finally:
+            cursor.close()
+
+    def load_query(self, sql_query):
+        """
+        --------------------
+        Description
+        --------------------
+        -> load_query (method): Class method that executes a SQL query and returns the result as a Pandas dataframe named after the columns of the query
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be executed on the database
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Execute the SQL query by calling the execute() method of the cursor class
+        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and the column names of the query and store it as a Pandas dataframe
+        -> Return the Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the result of a SQL query as a Pandas dataframe with the column names of the query
+
+        """
+        if self.cursor and sql_query:
+            self.cursor.execute(sql_query)
+            return pd.DataFrame(self.cursor.fetchall(), columns=[desc[0] for desc in self.cursor.description])
+        return None
+
+    def sample_table(self, schema_name, table_name, n_rows, n_table_rows=None, method='BERNOULLI', seed=0):
+        """
+        --------------------
+        Description
+        --------------------
+        -> sample_table (method): Class method that extracts a repeatable random sample of n_rows rows of a table with TABLESAMPLE (get_table_sample_query()), so that the cost depends on the size of the sample and not on the size of the table
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
+        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+        -> n_rows (int): Number of rows of the sample
+        -> n_table_rows (int): Exact or estimated number of rows of the table, used to choose the sampling percentage, read from the table statistics if None (default: None)
+        -> method (str): Sampling method, SYSTEM (random pages) or BERNOULLI (random rows) (default: BERNOULLI)
+        -> seed (int): Seed of the sample so that the same rows are returned on every call (default: 0)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the number of rows of the table is not given, read its estimate from the table statistics (get_table_estimate_query())
+        -> If the number of rows of the table is known, sample twice the requested share of the table (capped at 100% and at least MIN_SAMPLE_PERCENT, as a share rounded to 0% would read the whole table) so that the sample very likely holds n_rows rows
+        -> Execute the sampling query by calling the run_query() method with the column names of the table
+        -> If the sample holds fewer than n_rows rows although the table was not fully read, draw a reservoir sample over a server-side cursor instead (reservoir_sample())
+        -> Return the sample
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns at most n_rows rows sampled from the table
+
+        """
+        if n_table_rows is None and self.cursor:
+            estimate = self.run_query(get_table_estimate_query(schema_name, table_name))
+            n_table_rows = int(estimate[0][0]) if estimate is not None and not estimate.empty else None
+        percent = min(100.0, max(MIN_SAMPLE_PERCENT, round(200.0 * n_rows / n_table_rows, 4))) if n_table_rows else 100.0
+        query = get_table_sample_query(schema_name, table_name, percent, n_rows, method, seed)
+        if self.cursor and query:
+            df = self.load_query(query)
+            if df.shape[0] < n_rows and percent < 100.0:
+                df = self.reservoir_sample(get_table_data_query(schema_name, table_name), n_rows, seed)
+            return df
+        return None
+
+    def reservoir_sample(self, sql_query, n_rows, seed=0, itersize=10000):
+        """
+        --------------------
+        Description
+        --------------------
+        -> reservoir_sample (method): Class method that draws a uniform random sample of n_rows rows from the result of a SQL query streamed over a server-side cursor (iter_query_chunks()), holding at most n_rows rows and one chunk in memory
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> sql_query (str): The SQL query that is going to be sampled
+        -> n_rows (int): Number of rows of the sample
+        -> seed (int): Seed of the random generator so that the same rows are returned on every call (default: 0)
+        -> itersize (int): Number of rows fetched from the server for every chunk (default: 10000)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Create a NumPy random generator from the seed
+        -> For every chunk of the query result:
+            -> Fill the reservoir with the first n_rows rows
+            -> For every next row of global position i, draw a position between 0 and i and replace the row of the reservoir at that position if it is lower than n_rows
+        -> Return the reservoir as a Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns at most n_rows rows sampled uniformly from the result of the query
+
+        """
+        rng = np.random.default_rng(seed)
+        reservoir = None
+        n_seen = 0
+        for chunk in self.iter_query_chunks(sql_query, itersize):
+            if reservoir is None:
+                reservoir = chunk.head(0)
+            n_fill = max(min(n_rows - reservoir.shape[0], chunk.shape[0]), 0)
+            if n_fill:
+                reservoir = pd.concat([reservoir, chunk.iloc[:n_fill]], ignore_index=True)
+            positions = np.arange(n_seen + n_fill, n_seen + chunk.shape[0])
+            draws = rng.integers(0, positions + 1) if positions.size else positions
+            for row, draw in zip(np.flatnonzero(draws < n_rows) + n_fill, draws[draws < n_rows]):
+                reservoir.iloc[draw] = chunk.iloc[row]
+            n_seen += chunk.shape[0]
+        return reservoir
+
+    def get_table_schema(self, schema_name, table_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_table_schema (method): Class method that extracts the schema information of a table using a SQL query (get_table_schema_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
+        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the SQL query from the get_table_schema_query() function by passing the schema name and the table name
+        -> Execute the SQL query by calling the execute() method of the cursor class
+        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and the column names of the table and store it as a Pandas dataframe
+        -> Return the Pandas dataframe
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the schema information of a table as a Pandas dataframe by passing the name of the schema and the table as a SQL query
+
+        """
+        query = get_table_schema_query(schema_name, table_name)
+        if self.cursor:
+            self.cursor.execute(query)
+            df = pd.DataFrame(self.cursor.fetchall(), columns=[desc[0] for desc in self.cursor.description])
+            return df
+        return None
+
+    def has_extension(self, extension_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> has_extension (method): Class method that checks whether an extension is installed in the database using a SQL query (get_extension_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> extension_name (str): Name of the extension
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Execute the SQL query counting the installed extensions with this name
+        -> Return whether the count is not 0
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): Returns True if the extension is installed, False otherwise or without an active cursor
+
+        """
+        if self.cursor:
+            self.cursor.execute(get_extension_query(extension_name))
+            return self.cursor.fetchone()[0] > 0
+        return False
+
+    def count_distinct(self, schema_name, table_name, col_name, precision=None, itersize=100000):
+        """
+        --------------------
+        Description
+        --------------------
+        -> count_distinct (method): Class method that counts the unique values of a column, exactly or approximately with a HyperLogLog sketch built in the database by the hll extension when it is installed, or from the values streamed by chunks otherwise
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema of the table
+        -> table_name (str): Name of the table (in the schema), possibly followed by a TABLESAMPLE clause
+        -> col_name (str): Name of the column
+        -> precision (int): Base-2 logarithm of the number of registers of the sketch, None for an exact count (default: None)
+        -> itersize (int): Number of values fetched from the server for every chunk added to the sketch (default: 100000)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the count is approximate, check whether the hll extension is installed (has_extension())
+        -> If the count is exact or the hll extension is installed, return the count of get_distinct_count_query() and its relative standard error (None for an exact count)
+        -> Otherwise add every chunk of non-missing values streamed from a server-side cursor (iter_query_chunks()) to a HyperLogLog sketch and return its estimate and relative standard error
+
+        --------------------
+        Returns
+        --------------------
+        -> (tuple): Returns the number of unique values and its relative standard error, None if it is exact
+
+        """
+        server_hll = precision is not None and self.has_extension('hll')
+        query = get_distinct_count_query(schema_name, table_name, col_name, precision, server_hll)
+        if precision is None or server_hll:
+            self.cursor.execute(query)
+            return int(self.cursor.fetchone()[0]), HyperLogLog.get_error(precision) if precision is not None else None
+        sketch = HyperLogLog(precision)
+        for chunk in self.iter_query_chunks(query, itersize):
+            sketch.update(chunk.iloc[:, 0])
+        return sketch.count(), sketch.error
+
+    def count_top_values(self, schema_name, table_name, col_name, capacity=1000, itersize=100000):
+        """
+        --------------------
+        Description
+        --------------------
+        -> count_top_values (method): Class method that approximates the most frequent values of a column with a SpaceSaving summary of capacity counters fed by the chunks of non-missing values streamed from a server-side cursor, so that neither the column nor the count of every unique value is held in memory
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema of the table
+        -> table_name (str): Name of the table (in the schema), possibly followed by a TABLESAMPLE clause
+        -> col_name (str): Name of the column
+        -> capacity (int): Number of values tracked by the summary (default: 1000)
+        -> itersize (int): Number of values fetched from the server for every chunk added to the summary (default: 100000)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Create an empty SpaceSaving summary
+        -> Add every chunk of non-missing values streamed from a server-side cursor (get_non_missing_query(), iter_query_chunks()) to the summary
+        -> Return the summary
+
+        --------------------
+        Returns
+        --------------------
+        -> (SpaceSaving): Summary of the most frequent values of the column
+
+        """
+        summary = SpaceSaving(capacity)
+        for chunk in self.iter_query_chunks(get_non_missing_query(schema_name, table_name, col_name), itersize):
+            summary.update(chunk.iloc[:, 0])
+        return summary
+
+
+class CatalogCache:
+    """
+    --------------------
+    Description
+    --------------------
+    -> CatalogCache (class): Class that keeps the columns and types of the tables, and the list and sizes of the tables, read from the Postgres catalogs so that every tab reuses them instead of querying information_schema again, refreshing them after a time to live or on an explicit reload
+
+    --------------------
+    Attributes
+    --------------------
+    -> db (PostgresConnector): Instantation of PostgresConnector class for handling Postgres connection (mandatory)
+    -> ttl (int): Number of seconds after which the cached catalog information is read again (optional)
+    -> schemas (dict): Dataframe of the columns of every table of a schema, with their kind ('numeric', 'text', 'date' or None), and its time of loading, keyed by schema name
+    -> tables (tuple): List of the available tables, their estimated number of rows and sizes, and the time of loading (optional)
+    """
+    def __init__(self, db, ttl=300):
+        self.db = db
+        self.ttl = ttl
+        self.schemas = {}
+        self.tables = None
+
+    def is_expired(self, loaded_at):
+        """
+        --------------------
+        Description
+        --------------------
+        -> is_expired (method): Class method that checks whether cached catalog information loaded at a given time has outlived the time to live
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> loaded_at (float): Monotonic time at which the information was loaded
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Return True if more than ttl seconds have elapsed since the information was loaded
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): Whether the information has to be read again
+
+        """
+        return time.monotonic() - loaded_at > self.ttl
+
+    def get_schema_columns(self, schema_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_schema_columns (method): Class method that returns the columns of all the tables of a schema, reading them from pg_attribute and pg_type in a single query (get_catalog_columns_query()) when they are not cached or expired
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the columns of the schema are cached and not expired, return them
+        -> Open an active database connection and cursor, extract the columns of the schema and close the cursor and connection
+        -> Classify every column as numeric, text or date from the oid of its type (COLUMN_KIND_TYPE_OIDS)
+        -> Cache the columns with the current time and return them
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the columns of the tables of the schema with their position, type and kind
+
+        """
+        cached = self.schemas.get(schema_name)
+        if cached is not None and not self.is_expired(cached[1]):
+            return cached[0]
+        self.db.open_connection()
+        self.db.open_cursor()
+        columns = self.db.load_query(get_catalog_columns_query(schema_name))
+        self.db.close_cursor()
+        self.db.close_connection()
+        kinds = {type_oid: kind for kind, type_oids in COLUMN_KIND_TYPE_OIDS.items() for type_oid in type_oids}
+        columns['kind'] = [kinds.get(int(type_oid)) for type_oid in columns['type_oid']]
+        self.schemas[schema_name] = (columns, time.monotonic())
+        return columns
+
+    def get_columns(self, schema_name, table_name, kind=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_columns (method): Class method that returns the names of the columns of a table in table order, optionally only those of a given kind, from the cached columns of its schema (get_schema_columns())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema of the table
+        -> table_name (str): Name of the table
+        -> kind (str): Kind of the returned columns, 'numeric', 'text' or 'date', or all the columns if None (default: None)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the cached columns of the schema and keep those of the table, and of the kind if one is passed
+        -> Return their names
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Returns the names of the columns
+
+        """
+        columns = self.get_schema_columns(schema_name)
+        mask = columns['table_name'] == table_name
+        if kind is not None:
+            mask &= columns['kind'] == kind
+        return list(columns.loc[mask, 'column_name'])
+
+    def get_column_types(self, schema_name, table_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_column_types (method): Class method that returns the type OID and the formatted type (with its precision and scale, e.g. numeric(10,2)) of every column of a table from the cached columns of its schema (get_schema_columns())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema of the table
+        -> table_name (str): Name of the table
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Get the cached columns of the schema and keep those of the table
+        -> Return their type OID and formatted type keyed by column name
+
+        --------------------
+        Returns
+        --------------------
+        -> (dict): Returns a (type OID, formatted type) tuple for every column name
+
+        """
+        columns = self.get_schema_columns(schema_name)
+        columns = columns[columns['table_name'] == table_name]
+        return {column_name: (int(type_oid), data_type) for column_name, type_oid, data_type in zip(columns['column_name'], columns['type_oid'], columns['data_type'])}
+
+    def get_tables(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_tables (method): Class method that returns the list of available tables and their estimated number of rows and sizes (list_tables() and list_table_sizes()), reading them again only when they are not cached or expired
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the tables are not cached or expired, open an active database connection and cursor, extract the list of tables and their sizes, close the cursor and connection and cache them with the current time
+        -> Return the list of tables and their sizes
+
+        --------------------
+        Returns
+        --------------------
+        -> (list, dict): Returns the list of tables and the estimated number of rows and size in bytes of each of them
+
+        """
+        if self.tables is None or self.is_expired(self.tables[2]):
+            self.db.open_connection()
+            self.db.open_cursor()
+            self.tables = (self.db.list_tables(), self.db.list_table_sizes(), time.monotonic())
+            self.db.close_cursor()
+            self.db.close_connection()
+        return self.tables[0], self.tables[1]
+
+    def reload(self, schema_name=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> reload (method): Class method that forgets the cached catalog information so that it is read again on the next call
+
+        --------------------
+        Parameters
+        --------------------
+        -> self (class object): Reference to the current instance of the class
+        -> schema_name (str): Name of the schema whose columns are forgotten, or every schema if None (default: None)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Forget the cached columns of the schema (or of every schema) and the cached list of tables
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if schema_name is None:
+            self.schemas = {}
+        else:
+            self.schemas.pop(schema_name, None)
+        self.tables = None
+
+
+class IncrementalState:
+    """
+    --------------------
+    Description
+    --------------------
+    -> IncrementalState (class): Class that remembers the position of the last scan of a table, so that a profile only scans the rows appended since then and merges them into its state, as long as no row has been updated or deleted and the table has not been truncated
+
+    --------------------
+    Attributes
+    --------------------
+    -> schema_name (str): Name of the schema of the table (mandatory)
+    -> table_name (str): Name of the table (mandatory)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, e.g. a commit timestamp, used to select the new rows instead of their xmin; a sequence does not qualify, as a row can be committed after a row with a larger value and then never be scanned (optional)
+    -> snapshot (str): Text of the txid_current_snapshot() of the last scan (optional)
+    -> seen_xids (list): xmin of the rows seen by the scans that follow or equal the xmin of the last snapshot, None if there were more than MAX_SEEN_XIDS (optional)
+    -> watermark (object): Maximum value of the watermark column seen by the scans (optional)
+    -> changes (tuple): Number of updated and deleted rows, file node and time of the last reset of the statistics of the table read before the last scan (optional)
+    -> incremental (bool): Whether the last scan only read the new rows (optional)
+    -> n_scanned (int): Number of rows counted by the last scan (optional)
+    """
+    def __init__(self, schema_name, table_name, watermark_column=None):
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.watermark_column = watermark_column
+        self.snapshot = None
+        self.seen_xids = None
+        self.watermark = None
+        self.changes = None
+        self.incremental = False
+        self.n_scanned = None
+
+    def get_condition(self, db):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_condition (method): Class method that returns the WHERE condition selecting the rows appended since the last scan (get_new_rows_condition()), or None when the next scan has to read the whole table
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> db (PostgresConnector): Connector with an active connection and cursor
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Read the number of updated and deleted rows, the file node and the time of the last reset of the statistics of the table and the current transaction ID (get_table_changes_query())
+        -> The scan is incremental if there was a previous scan, the table has statistics, no row has been updated or deleted, the table has not been truncated or rewritten and its statistics have not been reset since, and, without a watermark column, the xmin of the rows seen by the previous scan are known and fewer than 2^31 transactions have started since its snapshot, so that the 32-bit xmin of the new rows can still be compared
+        -> Store the changes and whether the scan is incremental
+        -> Return the condition selecting the new rows, or None
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): The condition selecting the new rows, or None
+
+        """
+        *changes, next_xid = db.run_query(get_table_changes_query(self.schema_name, self.table_name)).iloc[0]
+        changes = None if pd.isna(changes[0]) else tuple(None if pd.isna(value) else int(value) for value in changes)
+        if self.watermark_column:
+            self.incremental = self.watermark is not None
+        else:
+            self.incremental = self.snapshot is not None and self.seen_xids is not None and int(next_xid) - int(self.snapshot.split(':')[0]) < 2 ** 31
+        self.incremental = self.incremental and changes is not None and changes == self.changes
+        self.changes = changes
+        if not self.incremental:
+            return None
+        return get_new_rows_condition(self.snapshot, self.watermark_column, self.watermark, self.seen_xids)
+
+    def set_position(self, snapshot, watermark, n_scanned, seen_xids=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_position (method): Class method that stores the position of a scan that has just been merged, as returned by the query of get_scan_query()
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> snapshot (str): Text of the txid_current_snapshot() of the scan
+        -> watermark (object): Maximum value of the watermark column among the scanned rows, None if there were none
+        -> n_scanned (int): Number of scanned rows
+        -> seen_xids (list): xmin of the scanned rows that follow or equal the xmin of the snapshot, None if there were none (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Store the snapshot and the number of scanned rows
+        -> If the scan was incremental, add the xmin seen by the previous scans that still follow or equal the xmin of the snapshot to the ones of the scan
+        -> Forget them if there are more than MAX_SEEN_XIDS, so that the next scan reads the whole table instead of sending them all back
+        -> Keep the previous watermark if the scan did not read any row
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        seen_xids = set(int(xid) for xid in seen_xids or [])
+        if self.incremental and self.seen_xids:
+            xmin = int(snapshot.split(':')[0]) % 2 ** 32
+            seen_xids.update(xid for xid in self.seen_xids if (xid - xmin) % 2 ** 32 < 2 ** 31)
+        self.seen_xids = sorted(seen_xids) if len(seen_xids) <= MAX_SEEN_XIDS else None
+        self.snapshot = snapshot
+        self.n_scanned = int(n_scanned)
+        if watermark is not None and not pd.isna(watermark):
+            self.watermark = watermark
+
+    def refresh(self, db, scan):
+        """
+        --------------------
+        Description
+        --------------------
+        -> refresh (method): Class method that runs the queries of a profile on the rows appended since the last scan, or on the whole table when they cannot be merged, all in the same snapshot
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> db (PostgresConnector): Instantation of PostgresConnector class for handling Postgres connection
+        -> scan (function): Function running the queries of the profile on db for a WHERE condition (None for the whole table) and merging their results into the profile if the scan is incremental
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Open a connection and a cursor for the passed database
+        -> Start a REPEATABLE READ transaction, so that the condition and every query of the profile see the same snapshot
+        -> Get the condition selecting the new rows (get_condition()) and run the queries of the profile with it
+        -> Close the cursor and connection to the database, which ends the transaction
+        -> Return the result of the scan, whose position the caller stores (set_position())
+
+        --------------------
+        Returns
+        --------------------
+        -> (object): Result of the scan
+
+        """
+        db.open_connection()
+        db.open_cursor()
+        if db.cursor:
+            db.cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        result = scan(self.get_condition(db))
+        db.close_cursor()
+        db.close_connection()
+        return result
+
+
+class HyperLogLog:
+    """
+    --------------------
+    Description
+    --------------------
+    -> HyperLogLog (class): Class that estimates the number of unique values of a column in a fixed amount of memory (2^precision bytes) without sorting or storing its values, from the longest runs of leading zeros of their 64-bit hashes, with a relative standard error of 1.04 / sqrt(2^precision). Sketches built on chunks or partitions of a column with the same precision can be merged into the sketch of the whole column
+
+    --------------------
+    Attributes
+    --------------------
+    -> precision (int): Base-2 logarithm of the number of registers, between 4 and 18 (mandatory)
+    -> n_registers (int): Number of registers (mandatory)
+    -> registers (np.ndarray): Longest run of leading zeros plus one seen by every register (mandatory)
+    -> error (float): Relative standard error of the estimates (mandatory)
+    """
+    def __init__(self, precision=14):
+        if precision not in HLL_PRECISIONS:
+            raise ValueError(f"The precision of a HyperLogLog sketch must be between {HLL_PRECISIONS.start} and {HLL_PRECISIONS.stop - 1}, not {precision}")
+        self.precision = precision
+        self.n_registers = 2 ** precision
+        self.registers = np.zeros(self.n_registers, dtype=np.uint8)
+        self.error = HyperLogLog.get_error(precision)
+
+    @staticmethod
+    def get_error(precision):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_error (method): Static method that returns the relative standard error of the estimates of a sketch with 2^precision registers, which is also the one of the hll extension
+
+        --------------------
+        Parameters
+        --------------------
+        -> precision (int): Base-2 logarithm of the number of registers
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Return 1.04 / sqrt(2^precision)
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Relative standard error of the estimates
+
+        """
+        return 1.04 / np.sqrt(2 ** precision)
+
+    def update(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds the non-missing values of a chunk of a column to the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> values (pd.Series): Chunk of values of the column (any iterable accepted by pd.Series)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Hash the non-missing values to unsigned 64-bit integers (pd.util.hash_pandas_object())
+        -> Use the first precision bits of every hash as the index of its register
+        -> Compute the rank of every hash as the position of the leftmost 1-bit in its remaining bits (get_bit_length())
+        -> Keep in every register the maximum of its value and the ranks of its hashes
+
+        --------------------
+        Returns
+        --------------------
+        -> (HyperLogLog): The updated sketch
+
+        """
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return self
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+        n_bits = 64 - self.precision
+        index = (hashes >> np.uint64(n_bits)).astype(np.intp)
+        rank = n_bits + 1 - get_bit_length(hashes & np.uint64(2 ** n_bits - 1))
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges the sketch of another chunk or partition of the column into the sketch, which then estimates the number of unique values of their union
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> other (HyperLogLog): Sketch with the same precision
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Raise a ValueError if the precisions of the sketches are different
+        -> Keep in every register the maximum of both sketches
+
+        --------------------
+        Returns
+        --------------------
+        -> (HyperLogLog): The merged sketch
+
+        """
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge HyperLogLog sketches of precision {self.precision} and {other.precision}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> count (method): Class method that estimates the number of unique values added to the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Compute the raw estimate as the bias-corrected harmonic mean of 2^register over the registers
+        -> If the raw estimate is below 2.5 times the number of registers and some registers are still empty, use linear counting on the number of empty registers instead
+        -> The 64-bit hashes make a correction for large cardinalities unnecessary
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Estimated number of unique values
+
+        """
+        m = self.n_registers
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        n_empty = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and n_empty:
+            estimate = m * np.log(m / n_empty)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """
+    --------------------
+    Description
+    --------------------
+    -> SpaceSaving (class): Class that tracks the most frequent values of a column with a fixed number of counters (Space-Saving), so that the memory used for finding them does not grow with the number of unique values. A value missing from the counters replaces the least frequent one and inherits its count, so that every count overestimates the true one by at most the smallest count, itself at most the number of values divided by the capacity. Summaries of chunks or partitions of a column can be merged into the summary of the whole column
 
     --------------------
     Attributes
     --------------------
-    -> database (str): Name of Postgres database (mandatory)
-    -> user (str): Username used for connecting to Postgres database (mandatory)
-    -> password (str): Password used for connecting to Postgres database (mandatory)
-    -> host (str): URL of Postgres database (mandatory)
-    -> port (str): Port number of Postgres database (mandatory)
-    -> conn (psycopg2._psycopg.connection): Postgres connection object (optional)
-    -> cursor (psycopg2._psycopg.connection.cursor): Postgres cursor for executing query (optional)
-    -> excluded_schemas (list): List containing the names of internal Postgres schemas to be excluded from selection (information_schema, pg_catalog)
+    -> capacity (int): Maximum number of tracked values (mandatory)
+    -> counts (pd.Series): Estimated number of occurrences of every tracked value (mandatory)
+    -> errors (pd.Series): Maximum overestimation of the count of every tracked value (mandatory)
+    -> n_values (int): Number of non-missing values added to the summary (mandatory)
     """
-    def __init__(self, database="postgres", user='postgres', password='password', host='127.0.0.1', port='5432'):
-        self.database = database
-        self.user = user
-        self.password = password
-        self.host = host
-        self.port = port
-        self.excluded_schemas = ['information_schema', 'pg_catalog']
-        self.cursor = None
-    
-    def open_connection(self):
+    def __init__(self, capacity=1000):
+        if capacity < 1:
+            raise ValueError(f"The capacity of a SpaceSaving summary must be at least 1, not {capacity}")
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.errors = pd.Series(dtype='int64')
+        self.n_values = 0
+
+    def get_max_error(self):
         """
         --------------------
         Description
         --------------------
-        -> open_connection (method): Class method that creates an active connection to a Postgres database
+        -> get_max_error (method): Class method that returns the maximum overestimation of any count of the summary, which is also the maximum number of occurrences of an untracked value
 
         --------------------
         Parameters
         --------------------
-        -> self (class object): Reference to the current instance of the class
+        -> self: Reference to the current instance of the class
 
         --------------------
         Pseudo-Code
         --------------------
-        => To be filled by student
-        -> pseudo-code
-        -> try:
-            -> Create an active connection to the Postgres database by calling the connect() function of psycopg2 class and passing the user, password, host, port and name of database
-            -> Return the active connection object
-        -> except:
-            -> Return None
+        -> Return the smallest count if every counter is used, 0 otherwise as the counts are then exact
 
         --------------------
         Returns
         --------------------
-        -> (psycopg2.extensions.connection) Returns an active connection object if connection successful, otherwise returns None
+        -> (int): Maximum overestimation of the counts
 
         """
-        try:
-            self.conn = psycopg2.connect(
-            user=self.user,
-            password=self.password,
-            host=self.host,
-            port=self.port,
-            database=self.database)
-            return self.conn
-        except OperationalError:
-            self.conn = None
-            return self.conn
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
 
-    def close_connection(self):
+    def add_counts(self, counts, errors, max_error, n_values):
         """
         --------------------
         Description
         --------------------
-        -> close_connection (method): Class method that closes an active connection to a Postgres database
+        -> add_counts (method): Class method that merges the counts of another summary into the summary and keeps the capacity largest ones
 
         --------------------
         Parameters
         --------------------
-        -> self (class object): Reference to the current instance of the class
+        -> self: Reference to the current instance of the class
+        -> counts (pd.Series): Number of occurrences of the values of the other summary
+        -> errors (pd.Series): Maximum overestimation of these numbers of occurrences
+        -> max_error (int): Maximum number of occurrences of a value untracked by the other summary
+        -> n_values (int): Number of values added to the other summary
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Close an active connection to the Postgres database by calling the close method of the connection class in psycopg2 package
+        -> Align the counts and errors of both summaries on the union of their values, a value untracked by a summary taking its maximum error as count and error
+        -> Add the counts and errors of both summaries
+        -> Keep the capacity largest counts and their errors
+        -> Add the number of values of the other summary
 
         --------------------
         Returns
@@ -96,103 +2091,187 @@ class PostgresConnector:
         -> None
 
         """
-        if self.conn:
-            self.conn.close()
+        values = self.counts.index.union(counts.index)
+        own_max_error = self.get_max_error()
+        merged = self.counts.reindex(values, fill_value=own_max_error) + counts.reindex(values, fill_value=max_error)
+        merged = merged.sort_values(ascending=False, kind='stable').head(self.capacity)
+        self.errors = (self.errors.reindex(merged.index, fill_value=own_max_error) + errors.reindex(merged.index, fill_value=max_error)).astype('int64')
+        self.counts = merged.astype('int64')
+        self.n_values += n_values
 
-    def open_cursor(self):
+    def update(self, values):
         """
         --------------------
         Description
         --------------------
-        -> open_cursor (method): Class method that creates an active cursor to a Postgres database
+        -> update (method): Class method that adds the non-missing values of a chunk of a column to the summary
 
         --------------------
         Parameters
         --------------------
-        -> self (class object): Reference to the current instance of the class
+        -> self: Reference to the current instance of the class
+        -> values (pd.Series): Chunk of values of the column (any iterable accepted by pd.Series)
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Create an active cursor to the Postgres database by calling the cursor method of the connection class in psycopg2 package
+        -> Count the occurrences of the non-missing values of the chunk exactly
+        -> Merge them into the summary as a summary without error (add_counts())
 
         --------------------
         Returns
         --------------------
-        -> None
+        -> (SpaceSaving): The updated summary
 
         """
-        if self.conn:
-            self.cursor = self.conn.cursor()
-        else:
-            self.cursor = None
+        counts = pd.Series(values).value_counts()
+        if not counts.empty:
+            self.add_counts(counts, pd.Series(0, index=counts.index), 0, int(counts.sum()))
+        return self
 
-    def close_cursor(self):
+    def merge(self, other):
         """
         --------------------
         Description
         --------------------
-        -> close_cursor (method): Class method that closes an active cursor to a Postgres database
+        -> merge (method): Class method that merges the summary of another chunk or partition of the column into the summary
 
         --------------------
         Parameters
         --------------------
-        -> self (class object): Reference to the current instance of the class
+        -> self: Reference to the current instance of the class
+        -> other (SpaceSaving): Summary of another chunk or partition of the column
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Close an active cursor to the Postgres database by calling the close method of the connection class in pyscopg2 package
+        -> Merge the counts, errors, maximum error and number of values of the other summary (add_counts())
 
         --------------------
         Returns
         --------------------
-        -> None
+        -> (SpaceSaving): The merged summary
 
         """
-        if self.cursor:
-            self.cursor.close()
+        self.add_counts(other.counts, other.errors, other.get_max_error(), other.n_values)
+        return self
 
-    def run_query(self, sql_query):
+    def get_top(self, n_values=20):
         """
         --------------------
         Description
         --------------------
-        -> run_query (method): Class method that executes a SQL query and returns the result as a Pandas dataframe
+        -> get_top (method): Class method that returns the most frequent values of the summary in the format of the column profiles, with their percentage of the values added to the summary
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> n_values (int): Number of values returned (default: 20)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Keep the n_values largest counts, ties being ordered by value as in get_top_values_query()
+        -> Return a Pandas dataframe with the values, their estimated occurrences and their percentage of the number of values of the summary
+
+        --------------------
+        Returns
+        --------------------
+        -> (pandas.core.frame.DataFrame): Returns the most frequent values with their occurrence and percentage
+
+        """
+        top = pd.DataFrame({'value': self.counts.index.to_numpy(), 'occurrence': self.counts.to_numpy(dtype='int64')})
+        top = top.sort_values(['occurrence', 'value'], ascending=[False, True], kind='stable').head(n_values).reset_index(drop=True)
+        top['percentage'] = np.round(top['occurrence'] / max(self.n_values, 1), 4)
+        return top
+
+
+class AsyncPostgresConnector:
+    """
+    --------------------
+    Description
+    --------------------
+    -> AsyncPostgresConnector (class): Class that runs SQL queries from asyncio coroutines on asynchronous psycopg2 connections (async_=1), waiting for their sockets with the event loop, so that several queries can be in flight at the same time on up to max_connections connections
+
+    --------------------
+    Attributes
+    --------------------
+    -> database (str): Name of the database (mandatory)
+    -> user (str): Username for connecting to the database (mandatory)
+    -> password (str): Password for the user (mandatory)
+    -> host (str): Host for connecting to the database (mandatory)
+    -> port (str): Port for connecting to the database (mandatory)
+    -> max_connections (int): Maximum number of queries (and connections) in flight at the same time (optional)
+    -> idle (list): List of the open connections that are not running a query
+    -> semaphore (asyncio.Semaphore): Semaphore limiting the number of queries in flight, created in the running event loop on the first query
+    """
+    def __init__(self, database="postgres", user='postgres', password='password', host='127.0.0.1', port='5432', max_connections=8):
+        self.database = database
+        self.user = user
+        self.password = password
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.idle = []
+        self.semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close_connections()
+
+    async def wait(self, conn):
+        """
+        --------------------
+        Description
+        --------------------
+        -> wait (method): Class method that waits, without blocking the event loop, until the pending operation of an asynchronous connection is completed
 
         --------------------
         Parameters
         --------------------
         -> self (class object): Reference to the current instance of the class
-        -> sql_query (str): The SQL query that is going to be executed on the database
+        -> conn (psycopg2.extensions.connection): Asynchronous connection with a pending operation
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Execute the SQL query by passing the sql_query parameter to the execute() method of the cursor class in psycopg2 package
-        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method of the cursor class and store them in a variable
-        -> Convert the results of the SQL query to a Pandas dataframe
-        -> Return the Pandas dataframe
+        -> Poll the connection until it reports that the operation is completed (psycopg2 raises the error of the operation if it failed)
+        -> Whenever it needs to read or write, wait for its socket to be ready using the reader or writer callbacks of the running event loop
 
         --------------------
         Returns
         --------------------
-        -> (pandas.core.frame.DataFrame): Returns the result of a SQL query as a Pandas dataframe
+        -> None
 
         """
-        if self.cursor and sql_query:
-            self.cursor.execute(sql_query)
-            query_result = self.cursor.fetchall()
-            query_result_df = pd.DataFrame(query_result)
-            return query_result_df
-        return None
-        
-    def list_tables(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            state = conn.poll()
+            if state == POLL_OK:
+                return
+            ready = loop.create_future()
+            if state == POLL_READ:
+                loop.add_reader(conn.fileno(), lambda: ready.done() or ready.set_result(None))
+                remove = loop.remove_reader
+            elif state == POLL_WRITE:
+                loop.add_writer(conn.fileno(), lambda: ready.done() or ready.set_result(None))
+                remove = loop.remove_writer
+            else:
+                raise OperationalError(f"unexpected poll state: {state}")
+            try:
+                await ready
+            finally:
+                remove(conn.fileno())
+
+    async def open_connection(self):
         """
         --------------------
         Description
         --------------------
-        -> list_tables (method): Class method that extracts the list of available tables using a SQL query (get_tables_list_query())
+        -> open_connection (method): Class method that opens a new asynchronous connection to the database
 
         --------------------
         Parameters
@@ -202,100 +2281,136 @@ class PostgresConnector:
         --------------------
         Pseudo-Code
         --------------------
-        -> Get the SQL query from get_tables_list_query() function that retrieves the list of tables and their schema name from a Postgres database
-        -> Execute the SQL query by calling the execute() method of the cursor class
-        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and store them in a variable called query_result
-        -> Declare an empty list for the list of tables
-        -> For all the tables and their schema names in the SQL query result:
-            -> Check that the schema name for the table is not same as the excluded schemas (information_schema, pg_catalog)
-            -> If the schema name is not the same as the excluded schemas:
-                -> Take the table name and append it to the list of tables
-        -> Return the list of tables (which are not part of the excluded schemas)
+        -> Start an asynchronous connection with the connection details and wait for it to be established (wait())
+        -> If the connection fails, return None
 
         --------------------
         Returns
         --------------------
-        -> (list): Returns a list of available tables from a database by exeuting a SQL query 
+        -> (psycopg2.extensions.connection) Returns an active asynchronous connection object if connection successful, otherwise returns None
 
         """
-        sql_query = get_tables_list_query()
-        if self.cursor:
-            self.cursor.execute(sql_query)
-            query_result = self.cursor.fetchall()
-            list_tables = []
-            for results in query_result:
-                result_after_split = results[0].split(".")
-                if result_after_split[0] not in self.excluded_schemas:
-                    list_tables.append(results[0])
-            return list_tables
-        return None
+        try:
+            conn = psycopg2.connect(user=self.user, password=self.password, host=self.host, port=self.port, database=self.database, async_=1)
+            await self.wait(conn)
+            return conn
+        except OperationalError:
+            return None
 
-    def load_table(self, schema_name, table_name):
+    async def run_query(self, sql_query):
         """
         --------------------
         Description
         --------------------
-        -> load_table (method): Class method that load the content of a table using a SQL query (get_table_data_query())
+        -> run_query (method): Class method that executes a SQL query on an idle (or new) asynchronous connection once fewer than max_connections queries are in flight, and returns its result like PostgresConnector.run_query()
 
         --------------------
         Parameters
         --------------------
         -> self (class object): Reference to the current instance of the class
-        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
-        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+        -> sql_query (str): SQL query to be executed
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Get the SQL query from the get_table_data_query() function by passing the schema name and the table name
-        -> Execute the SQL query by calling the execute() method of the cursor class
-        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and the column names of the table and store it as a Pandas dataframe
-        -> Return the Pandas dataframe
+        -> Wait for the semaphore limiting the number of queries in flight
+        -> Take an idle connection, or open a new one if there is none (raise an OperationalError if it cannot be opened)
+        -> Execute the SQL query, wait for its result (wait()) and fetch all its rows
+        -> Put the connection back in the idle list, or close it if the query failed
+        -> Return the rows as a Pandas dataframe
 
         --------------------
         Returns
         --------------------
-        -> (pandas.core.frame.DataFrame): Returns the content of a table as a Pandas dataframe by passing the name of the schema and the table to a SQL query
+        -> (pandas.core.frame.DataFrame): Returns the result of a SQL query as a Pandas dataframe
 
         """
-        query = get_table_data_query(schema_name, table_name)
-        if self.cursor:
-            self.cursor.execute(query)
-            df = pd.DataFrame(self.cursor.fetchall(), columns=[desc[0] for desc in self.cursor.description])
-            return df
-        return None
+        if not sql_query:
+            return None
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_connections)
+        async with self.semaphore:
+            conn = self.idle.pop() if self.idle else await self.open_connection()
+            if conn is None:
+                raise OperationalError(f'could not connect to the database "{self.database}" at {self.host}:{self.port}')
+            try:
+                cursor = conn.cursor()
+                cursor.execute(sql_query)
+                await self.wait(conn)
+                query_result = cursor.fetchall()
+                cursor.close()
+            except BaseException:
+                conn.close()
+                raise
+            self.idle.append(conn)
+        return pd.DataFrame(query_result)
 
-    def get_table_schema(self, schema_name, table_name):
+    def close_connections(self):
         """
         --------------------
         Description
         --------------------
-        -> get_table_schema (method): Class method that extracts the schema information of a table using a SQL query (get_table_schema_query())
+        -> close_connections (method): Class method that closes all the idle connections
 
         --------------------
         Parameters
         --------------------
         -> self (class object): Reference to the current instance of the class
-        -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
-        -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Get the SQL query from the get_table_schema_query() function by passing the schema name and the table name
-        -> Execute the SQL query by calling the execute() method of the cursor class
-        -> Retrieve all the rows from the result of the SQL query by calling the fetchall() method and the column names of the table and store it as a Pandas dataframe
-        -> Return the Pandas dataframe
+        -> Close every idle connection and empty the idle list
 
         --------------------
         Returns
         --------------------
-        -> (pandas.core.frame.DataFrame): Returns the schema information of a table as a Pandas dataframe by passing the name of the schema and the table as a SQL query
+        -> None
 
         """
-        query = get_table_schema_query(schema_name, table_name)
-        if self.cursor:
-            self.cursor.execute(query)
-            df = pd.DataFrame(self.cursor.fetchall(), columns=[desc[0] for desc in self.cursor.description])
-            return df
-        return None
\ No newline at end of file
+        for conn in self.idle:
+            conn.close()
+        self.idle = []
+
+
+def profile_columns(columns, db, max_concurrency=8, errors=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_columns (function): Function that computes the information of several NumericColumn, TextColumn or DateColumn objects concurrently (set_data_async()), with at most max_concurrency queries in flight, so that profiling a table takes about the time of its slowest column instead of the sum of all its columns
+
+    --------------------
+    Parameters
+    --------------------
+    -> columns (list): List of NumericColumn, TextColumn or DateColumn objects to be profiled
+    -> db (PostgresConnector): Instantation of PostgresConnector class whose connection details are used for the asynchronous connections
+    -> max_concurrency (int): Maximum number of queries in flight at the same time (default: 8)
+    -> errors (list): List to which the (column, exception) pair of every column whose profile failed is appended, the first exception being raised instead if None (default: None)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Open an AsyncPostgresConnector with the connection details of db, limited to max_concurrency connections
+    -> Run the set_data_async() coroutines of all the columns concurrently in a new event loop, collecting their exceptions instead of cancelling the other columns, and close the connections
+    -> If a column failed, append it with its exception to errors, or raise the first exception if errors is None
+    -> Return the list of the columns that were profiled
+
+    --------------------
+    Returns
+    --------------------
+    -> (list): The list of profiled columns
+
+    """
+    async def run_profiles():
+        async with AsyncPostgresConnector(db.database, db.user, db.password, db.host, db.port, max_connections=max_concurrency) as adb:
+            return await asyncio.gather(*[column.set_data_async(adb) for column in columns], return_exceptions=True)
+    if not columns:
+        return columns
+    results = asyncio.run(run_profiles())
+    failed = [(column, result) for column, result in zip(columns, results) if isinstance(result, Exception)]
+    if failed and errors is None:
+        raise failed[0][1]
+    if failed:
+        errors.extend(failed)
+    return [column for column, result in zip(columns, results) if not isinstance(result, Exception)]
@@ -25,6 +25,62 @@ def get_tables_list_query():
     query = "SELECT table_schema || '.' || table_name AS table_name FROM information_schema.tables;"
     return query
 
+def get_table_sizes_query():
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_table_sizes_query (method): Function that returns the query used for extracting the estimated number of rows and the size on disk of every table of a Postgres database from the catalog
+
+    --------------------
+    Parameters
+    --------------------
+    -> None
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query to extract, for every table (in the form of schema.table), the number of live rows from pg_stat_user_tables (or pg_class.reltuples when there are no statistics) and the total size from pg_total_relation_size() in a variable called query
+    -> Return that variable
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query that is used to extract the estimated number of rows and the size of the tables from a Postgres database
+    """
+    query = "SELECT n.nspname || '.' || c.relname AS table_name, COALESCE(s.n_live_tup, GREATEST(c.reltuples, 0))::bigint AS n_rows, pg_total_relation_size(c.oid) AS n_bytes FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid WHERE c.relkind IN ('r', 'p', 'm', 'f');"
+    return query
+
+def get_catalog_columns_query(schema_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_catalog_columns_query (method): Function that returns the query used for extracting all the columns of all the tables of a Postgres schema with their types in a single round trip to the system catalogs (pg_attribute and pg_type)
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema whose columns are extracted
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If schema_name has a value, i.e., it is not empty or None:
+        -> Set the query to extract, for every live column of every table, view or materialized view of the schema, the name of its table, its name and position, the oid of its type (of the base type for a domain), the formatted type and whether it is nullable in a variable called query
+        -> Return that variable
+    -> Return None
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): If schema_name exists, returns the query that is used to extract the columns of a Postgres schema. Otherwise, returns None
+    """
+    if schema_name:
+        query = f"SELECT c.relname AS table_name, a.attname AS column_name, a.attnum AS ordinal_position, CASE WHEN t.typtype = 'd' THEN t.typbasetype ELSE t.oid END AS type_oid, format_type(a.atttypid, a.atttypmod) AS data_type, NOT a.attnotnull AS is_nullable FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_namespace n ON n.oid = c.relnamespace JOIN pg_type t ON t.oid = a.atttypid WHERE n.nspname = '{schema_name}' AND c.relkind IN ('r', 'p', 'v', 'm', 'f') AND a.attnum > 0 AND NOT a.attisdropped ORDER BY c.relname, a.attnum"
+        return query
+    return None
+
 def get_table_data_query(schema_name, table_name):
     """
     --------------------
@@ -56,12 +112,77 @@ def get_table_data_query(schema_name, table_name):
         return query
     return None
 
+def get_sampled_table_name(table_name, percent, method='SYSTEM', seed=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_sampled_table_name (method): Function that returns the name of a table followed by a TABLESAMPLE clause, so that any query reading FROM schema.table only reads a repeatable sample of it
+
+    --------------------
+    Parameters
+    --------------------
+    -> table_name (str): Name of the table that is going to be sampled
+    -> percent (float): Percentage of the table to be sampled
+    -> method (str): Sampling method, SYSTEM (random pages) or BERNOULLI (random rows) (default: SYSTEM)
+    -> seed (int): Seed of the REPEATABLE clause so that the same rows are sampled on every call (default: 0)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If percent is None, return the name of the table unchanged
+    -> Otherwise return the name of the table followed by the TABLESAMPLE clause with the sampling method, the percentage and the seed
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the name of the table with its TABLESAMPLE clause
+    """
+    if percent is None:
+        return table_name
+    return f"{table_name} TABLESAMPLE {method} ({percent}) REPEATABLE ({seed})"
+
+def get_table_sample_query(schema_name, table_name, percent, n_rows, method='BERNOULLI', seed=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_table_sample_query (method): Function that returns the query used for extracting a repeatable random sample of at most n_rows rows of a Postgres table with TABLESAMPLE
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema on which the SQL query is going to be executed on
+    -> table_name (str): Name of the table (in the schema) on which the SQL query is going to be executed on
+    -> percent (float): Percentage of the table to be sampled
+    -> n_rows (int): Maximum number of rows returned
+    -> method (str): Sampling method, SYSTEM (random pages) or BERNOULLI (random rows) (default: BERNOULLI)
+    -> seed (int): Seed of the REPEATABLE clause so that the same rows are sampled on every call (default: 0)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If schema_name and table_name has values, i.e., they are not empty or None:
+        -> Set the query to sample the table (get_sampled_table_name()), shuffle the sampled rows on a hash of their physical location so that the limit does not favour the first pages, and keep n_rows of them in a variable called query
+        -> Return that variable
+    -> Return None
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): If schema_name and table_name exists, returns the query that is used to sample a Postgres table. Otherwise, returns None
+    """
+    if schema_name and table_name:
+        query = f"SELECT * FROM {schema_name}.{get_sampled_table_name(table_name, percent, method, seed)} ORDER BY md5(ctid::text || '{seed}') LIMIT {n_rows}"
+        return query
+    return None
+
 def get_table_schema_query(schema_name, table_name):
     """
     --------------------
     Description
     --------------------
-    -> get_table_schema_query (method): Function that returns the query used for extracting the list of columns from a Postgres table and their information
+    -> get_table_schema_query (method): Function that returns the query used for extracting the list of columns from a Postgres table and their information, including whether each column is part of the primary key, a unique constraint, a foreign key or an index. The constraints and indexes of the table are read once from pg_constraint and pg_index, looked up by the table's oid, and joined to its columns instead of checking every column with a correlated subquery
 
     --------------------
     Parameters
@@ -83,6 +204,378 @@ def get_table_schema_query(schema_name, table_name):
     -> (str): If schema_name and table_name exists, returns the query that is used to extract a list of columns and their information from a Postgres table. Otherwise returns None
     """
     if schema_name and table_name:
-        query = f"SELECT c.table_name, c.column_name, c.data_type, CASE WHEN EXISTS(SELECT 1 FROM INFORMATION_SCHEMA.constraint_column_usage k WHERE c.table_name = k.table_name and k.column_name = c.column_name) THEN true ELSE false END as primary_key, c.is_nullable, c.character_maximum_length, c.numeric_precision FROM INFORMATION_SCHEMA.COLUMNS c WHERE c.table_schema='{schema_name}' AND c.table_name='{table_name}'"
+        table_oid = f"to_regclass('\"{schema_name}\".\"{table_name}\"')"
+        query = f"SELECT c.relname AS table_name, a.attname AS column_name, format_type(a.atttypid, NULL) AS data_type, coalesce(k.primary_key, false) AS primary_key, CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable, information_schema._pg_char_max_length(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS character_maximum_length, information_schema._pg_numeric_precision(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS numeric_precision, coalesce(k.unique_key, false) AS unique_key, coalesce(k.foreign_key, false) AS foreign_key, i.attnum IS NOT NULL AS indexed FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_type t ON t.oid = a.atttypid LEFT JOIN (SELECT key.attnum, bool_or(con.contype = 'p') AS primary_key, bool_or(con.contype = 'u') AS unique_key, bool_or(con.contype = 'f') AS foreign_key FROM pg_constraint con CROSS JOIN unnest(con.conkey) AS key(attnum) WHERE con.conrelid = {table_oid} GROUP BY key.attnum) k ON k.attnum = a.attnum LEFT JOIN (SELECT DISTINCT unnest(ix.indkey::int2[]) AS attnum FROM pg_index ix WHERE ix.indrelid = {table_oid}) i ON i.attnum = a.attnum WHERE a.attrelid = {table_oid} AND a.attnum > 0 AND NOT a.attisdropped ORDER BY a.attnum"
+        return query
+    return None
+
+
+def get_copy_query(sql_query):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_copy_query (method): Function that returns the COPY statement used for streaming the result of a SQL query in CSV format
+
+    --------------------
+    Parameters
+    --------------------
+    -> sql_query (str): The SQL query whose result is going to be streamed
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If sql_query has a value, i.e., it is not empty or None:
+        -> Remove the trailing semicolon of the query and wrap it in a COPY ... TO STDOUT statement using the CSV format and \\N as the NULL marker (so that empty strings and missing values can be told apart)
+        -> Return the statement
+    -> Return None
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): If sql_query exists, returns the COPY statement streaming its result. Otherwise, returns None
+    """
+    if sql_query:
+        query = f"COPY ({sql_query.strip().rstrip(';')}) TO STDOUT WITH (FORMAT csv, NULL '\\N')"
         return query
     return None
+
+def get_query_columns_query(sql_query):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_query_columns_query (method): Function that returns the query used for retrieving the column names and types of the result of a SQL query without fetching any row
+
+    --------------------
+    Parameters
+    --------------------
+    -> sql_query (str): The SQL query whose columns are going to be described
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If sql_query has a value, i.e., it is not empty or None:
+        -> Remove the trailing semicolon of the query and wrap it in a subquery limited to 0 rows
+        -> Return the query
+    -> Return None
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): If sql_query exists, returns the query that describes the columns of its result. Otherwise, returns None
+    """
+    if sql_query:
+        query = f"SELECT * FROM ({sql_query.strip().rstrip(';')}) AS query_columns LIMIT 0"
+        return query
+    return None
+
+def get_table_estimate_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_table_estimate_query (method): Function that returns the query used for retrieving the estimated number of rows of a Postgres table from its statistics, without scanning it
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query returning the number of live rows from pg_stat_user_tables, or pg_class.reltuples when there are no statistics or they have been reset (n_live_tup of 0)
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query retrieving the estimated number of rows of the table
+    """
+    query = f"SELECT COALESCE(NULLIF(s.n_live_tup, 0), GREATEST(c.reltuples, 0))::bigint FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid WHERE n.nspname = '{schema_name}' AND c.relname = '{table_name}'"
+    return query
+
+def get_table_changes_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_table_changes_query (method): Function that returns the query used for retrieving the number of updated and deleted rows of a Postgres table since its statistics were reset, its file node and the time its statistics were reset, along with the next transaction ID, which tell whether the rows appended since a profile can be merged into it
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query returning in one row the n_tup_upd and n_tup_del counters of pg_stat_user_tables (null if the table has no statistics), the file node of the table, which TRUNCATE changes without moving these counters, the time the statistics of the database were last reset in microseconds (0 if never), which resetting them also changes, and the 64-bit xmax of the current snapshot
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query retrieving the changes of the table
+    """
+    query = f"SELECT s.n_tup_upd, s.n_tup_del, pg_relation_filenode(s.relid), coalesce((extract(epoch from d.stats_reset) * 1000000)::bigint, 0), txid_snapshot_xmax(txid_current_snapshot()) FROM (SELECT 1) AS one LEFT JOIN pg_stat_user_tables s ON s.schemaname = '{schema_name}' AND s.relname = '{table_name}' LEFT JOIN pg_stat_database d ON d.datname = current_database()"
+    return query
+
+def get_new_rows_condition(snapshot=None, watermark_column=None, watermark=None, seen_xids=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_new_rows_condition (method): Function that returns the WHERE condition selecting the rows of a table that were not visible to a previous scan, either the rows past the last value of a monotonic column or the rows whose xmin was not seen by the snapshot of that scan
+
+    --------------------
+    Parameters
+    --------------------
+    -> snapshot (str): Text of the txid_current_snapshot() of the previous scan, 'xmin:xmax:xip,...' (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, e.g. a commit timestamp, but not a sequence whose values can be committed out of order (optional)
+    -> watermark (object): Maximum value of the watermark column seen by the previous scan (optional)
+    -> seen_xids (list): xmin of the rows seen by the previous scan that follow or equal the xmin of its snapshot (get_scan_query()) (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If a watermark column is set, return the condition selecting the rows whose value is greater than the watermark
+    -> Otherwise reduce the xmin of the snapshot, i.e. the oldest transaction still in progress, to the 32-bit transaction IDs stored in xmin
+    -> Every transaction before it, subtransactions included, had ended before the previous scan, which therefore saw all their rows; the transactions after it (whose subtransactions are not listed in the snapshot) may not have
+    -> Return the condition selecting the rows whose xmin is a normal transaction ID (frozen rows read as 2) that follows or equals the xmin of the snapshot in the circular order of transaction IDs, except the ones seen by the previous scan
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the condition selecting the new rows of the table
+    """
+    if watermark_column:
+        watermark = str(watermark).replace("'", "''")
+        return f"{watermark_column} > '{watermark}'"
+    xmin = int(snapshot.split(':')[0])
+    condition = f"xmin::text::bigint >= 3 AND (xmin::text::bigint - {xmin % 2 ** 32} + {2 ** 32}) % {2 ** 32} < {2 ** 31}"
+    if seen_xids:
+        condition += f" AND xmin::text::bigint NOT IN ({', '.join(str(int(xid)) for xid in seen_xids)})"
+    return f"({condition})"
+
+def get_scan_query(schema_name, table_name, aggregates, condition=None, watermark_column=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_scan_query (method): Function that returns the query used for computing aggregates of a table, on the whole table or only on the rows matching a condition, together with the position of the scan needed to select the rows appended after it (get_new_rows_condition())
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+    -> aggregates (list): SQL aggregates computed on the scanned rows
+    -> condition (str): WHERE condition selecting the rows to be scanned, every row if None (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, whose maximum is returned (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Select the snapshot of the statement and the maximum of the watermark column as text, the number of scanned rows and, without a watermark column, the distinct xmin of the scanned rows that follow or equal the xmin of the snapshot, followed by the aggregates
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query returning the position of the scan and the aggregates in one row
+    """
+    if watermark_column:
+        position = f"max({watermark_column})::text, count(*), NULL"
+    else:
+        position = f"NULL, count(*), array_agg(DISTINCT xmin::text::bigint) FILTER (WHERE xmin::text::bigint >= 3 AND (xmin::text::bigint - txid_snapshot_xmin(txid_current_snapshot()) % {2 ** 32} + {2 ** 32}) % {2 ** 32} < {2 ** 31})"
+    where = f" WHERE {condition}" if condition else ""
+    query = f"SELECT txid_current_snapshot()::text, {position}{''.join(', ' + aggregate for aggregate in aggregates)} FROM {schema_name}.{table_name}{where}"
+    return query
+
+def get_hll_registers_query(schema_name, table_name, col_name, precision=14, condition=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_hll_registers_query (method): Function that returns the query used for computing the registers of a HyperLogLog sketch of a column in Postgres, so that only 2^precision rows at most are sent to the application whatever the number of unique values
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+    -> col_name (str): Name of the column
+    -> precision (int): Base-2 logarithm of the number of registers (default: 14)
+    -> condition (str): WHERE condition selecting the rows to be sketched, every row if None (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Hash the text of the non-missing values of the column to 64-bit integers (hashtextextended())
+    -> Use the first precision bits of every hash as the index of its register and the position of the leftmost 1-bit in its remaining bits as its rank, like HyperLogLog.update()
+    -> Return the query keeping the maximum rank of every register that was hit
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query retrieving the index and value of the registers
+    """
+    n_bits = 64 - precision
+    where = f" AND {condition}" if condition else ""
+    query = f"SELECT (h >> {n_bits}) & {2 ** precision - 1}, max({n_bits + 1} - length(ltrim((h & {2 ** n_bits - 1})::bit(64)::text, '0'))) FROM (SELECT hashtextextended({col_name}::text, 0) AS h FROM {schema_name}.{table_name} WHERE {col_name} IS NOT NULL{where}) AS hashes GROUP BY 1"
+    return query
+
+def get_extension_query(extension_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_extension_query (method): Function that returns the query used for checking whether an extension is installed in the current Postgres database
+
+    --------------------
+    Parameters
+    --------------------
+    -> extension_name (str): Name of the extension
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query counting the rows of pg_extension with the name of the extension
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query returning 1 if the extension is installed and 0 otherwise
+    """
+    query = f"SELECT count(*) FROM pg_extension WHERE extname = '{extension_name}'"
+    return query
+
+def get_distinct_count(col_name, precision=None, server_hll=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_distinct_count (method): Function that returns the aggregate used by the summary queries for counting the unique values of a column, either exactly, with a HyperLogLog sketch of the hll extension or not at all when the sketch is built from the loaded values (HyperLogLog)
+
+    --------------------
+    Parameters
+    --------------------
+    -> col_name (str): Name of the column
+    -> precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch, None for an exact count (optional)
+    -> server_hll (bool): Whether the hll extension is installed in the database (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If there is no precision, return count(distinct) on the column, which sorts or hashes every value
+    -> If the hll extension is installed, return the cardinality of the hll_add_agg() sketch of the hashed values with 2^precision registers (0 for an empty column)
+    -> Otherwise return NULL, the number of unique values being estimated from the loaded values
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the SQL expression of the number of unique values
+    """
+    if precision is None:
+        return f"count(distinct {col_name})"
+    if server_hll:
+        return f"coalesce(hll_cardinality(hll_add_agg(hll_hash_any({col_name}), {precision})), 0)::bigint"
+    return "NULL"
+
+def get_distinct_count_query(schema_name, table_name, col_name, precision=None, server_hll=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_distinct_count_query (method): Function that returns the query used for counting the unique values of a column of a Postgres table when they are counted in the database, or for streaming its non-missing values into a HyperLogLog sketch otherwise
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+    -> col_name (str): Name of the column
+    -> precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch, None for an exact count (optional)
+    -> server_hll (bool): Whether the hll extension is installed in the database (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> If the count is exact or computed by the hll extension, set the query returning the aggregate of get_distinct_count()
+    -> Otherwise set the query selecting the non-missing values of the column
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query counting or selecting the values of the column
+    """
+    if precision is None or server_hll:
+        query = f"SELECT {get_distinct_count(col_name, precision, server_hll)} FROM {schema_name}.{table_name}"
+    else:
+        query = get_non_missing_query(schema_name, table_name, col_name)
+    return query
+
+def get_non_missing_query(schema_name, table_name, col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_non_missing_query (method): Function that returns the query used for streaming the non-missing values of a column of a Postgres table into a sketch or summary chunk by chunk
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table
+    -> col_name (str): Name of the column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query selecting the non-missing values of the column
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query selecting the non-missing values of the column
+    """
+    query = f"SELECT {col_name} FROM {schema_name}.{table_name} WHERE {col_name} IS NOT NULL"
+    return query
+
+def get_top_values_query(schema_name, table_name, col_name, n_values=20, condition=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_top_values_query (method): Function that returns the query used for retrieving the most frequent values of a column of a Postgres table with their number of occurrences and their percentage of the non-missing values in a single scan, so that only these rows are sent to the application
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): Name of the schema of the table
+    -> table_name (str): Name of the table, possibly followed by a TABLESAMPLE clause
+    -> col_name (str): Name of the column
+    -> n_values (int): Number of values returned (default: 20)
+    -> condition (str): WHERE condition selecting the rows to be counted, every row if None (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Set the query grouping the non-missing values of the column (of the rows matching the condition), computing the share of every group in the total of all the groups with a window sum evaluated before the LIMIT, and keeping the n_values largest groups (ties ordered by value)
+    -> Return the query
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Returns the query retrieving the value, occurrence and percentage of the most frequent values
+    """
+    where = f" AND {condition}" if condition else ""
+    query = f"SELECT {col_name}, count(*), round(count(*) / sum(count(*)) OVER (), 4) FROM {schema_name}.{table_name} WHERE {col_name} IS NOT NULL{where} GROUP BY {col_name} ORDER BY count(*) DESC, {col_name} LIMIT {n_values}"
+    return query
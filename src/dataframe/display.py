@@ -1,6 +1,69 @@
 import streamlit as st
 
-from src.dataframe.logics import Dataset
+from src.config import get_column_profile, set_column_profile, get_refresh_note
+from src.dataframe.logics import Dataset, DatasetCache, SnapshotStore, ProfileExecutor, ProcessProfiler, pa
+
+ESTIMATE_ROWS_THRESHOLD = 1000000
+PROFILE_MAX_IN_FLIGHT = 4
+
+def get_dataset_cache():
+    """
+    --------------------
+    Description
+    --------------------
+    get_dataset_cache (function): Function that returns the DatasetCache stored in the streamlit session state, creating it on the first call
+
+    --------------------
+    Parameters
+    --------------------
+    none
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    if there is no cache in the session state, instantiate a DatasetCache class and store it in the session state
+    return the cache from the session state
+
+    --------------------
+    Returns
+    --------------------
+    DatasetCache
+
+    """
+    if st.session_state.get('dataset_cache') is None:
+        st.session_state['dataset_cache'] = DatasetCache()
+    return st.session_state['dataset_cache']
+
+def get_snapshot_store():
+    """
+    --------------------
+    Description
+    --------------------
+    get_snapshot_store (function): Function that returns the SnapshotStore stored in the streamlit session state, creating it on the first call, or None if pyarrow is not installed
+
+    --------------------
+    Parameters
+    --------------------
+    none
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    return None if pyarrow is not installed
+    if there is no store in the session state, instantiate a SnapshotStore class on the directory and size cap set by the SNAPSHOT_DIR and SNAPSHOT_MAX_BYTES environment variables and store it in the session state
+    return the store from the session state
+
+    --------------------
+    Returns
+    --------------------
+    SnapshotStore or None
+
+    """
+    if pa is None:
+        return None
+    if st.session_state.get('snapshot_store') is None:
+        st.session_state['snapshot_store'] = SnapshotStore()
+    return st.session_state['snapshot_store']
 
 def read_data():
     """
@@ -17,8 +80,12 @@ def read_data():
     --------------------
     Pseudo-Code
     --------------------
-    using database connection status to get relevant information to instantiate a Dataset class
-    get relevant data and informtiaon fo the Dataset class
+    if the Dataset in the session state is already the selected table of the current connection, return it without querying the database
+    using database connection status to get relevant information to instantiate a Dataset class that is bootstrapped from the shared catalog cache and aggregate queries and streams the rows in chunks only when needed
+    only estimate the number of rows from the table statistics when the table picker reports more rows than ESTIMATE_ROWS_THRESHOLD
+    get the version token of the table and return the cached Dataset for that version if there is one
+    if there is an on-disk snapshot of that version of the table, load the rows from it instead of bootstrapping the Dataset
+    otherwise get relevant data and informtiaon fo the Dataset class and store it in the cache
 
     --------------------
     Returns
@@ -29,8 +96,23 @@ def read_data():
     schema_name = st.session_state['schema_selected']
     table_name = st.session_state['table_selected']
     db = st.session_state['db']
-    Data = Dataset(schema_name, table_name, db=db)
+    Data = st.session_state['data']
+    if Data is not None and Data.db is db and Data.schema_name == schema_name and Data.table_name == table_name:
+        return Data
+    cache = get_dataset_cache()
+    catalog = st.session_state['catalog']
+    n_rows, _ = catalog.get_tables()[1].get(f'{schema_name}.{table_name}', (0, 0))
+    snapshots = get_snapshot_store()
+    Data = Dataset(schema_name, table_name, db=db, chunksize=10000, bootstrap=True, estimate_rows=n_rows > ESTIMATE_ROWS_THRESHOLD, catalog=catalog, snapshots=snapshots)
+    Data.set_version()
+    key = cache.get_key(Data)
+    cached_data = cache.get(key)
+    if cached_data is not None:
+        return cached_data
+    if snapshots is not None and snapshots.contains(Data):
+        Data.bootstrap = Data.estimate_rows = False
     Data.set_data()
+    cache.put(key, Data)
     return Data
 
 def display_overall():
@@ -49,7 +131,11 @@ def display_overall():
     Pseudo-Code
     --------------------
     get data from session session state
+    if the number of rows is an estimate or the duplicated rows have not been recounted, display its note, a checkbox selecting whether the duplicated rows are counted too and a button that counts the rows and missing values (and duplicated rows) exactly
+    display the selection of the column used to find the appended rows and a button that refreshes the counts with them (display_refresh_counts())
+    if the rows have not been loaded and the table can be snapshotted, display a button that loads them and saves them on disk (display_save_snapshot())
     display overll and schema information for selected table
+    display a button that profiles every column of the table on a thread pool (display_profile_all())
 
     --------------------
     Returns
@@ -59,9 +145,135 @@ def display_overall():
     """
     Data = st.session_state['data']
     st.header('Overall Information')
+    if Data.estimate_note:
+        count_duplicates = st.checkbox('With the duplicated rows (groups every row of the table)', key='exact_duplicates')
+        if st.button('Count rows exactly', key='exact_counts'):
+            with st.spinner('Counting rows...'):
+                Data.set_exact_counts(count_duplicates)
+        else:
+            st.caption(Data.estimate_note)
+    display_save_snapshot(Data)
+    display_refresh_counts(Data)
     st.table(data=Data.get_summary_df())
     st.header('Table Schema')
     st.dataframe(data=Data.get_schema())
+    display_profile_all(Data)
+
+def display_refresh_counts(Data):
+    """
+    --------------------
+    Description
+    --------------------
+    display_refresh_counts (function): Function that displays the selection of a column whose value increases in the order the inserted rows are committed (such as a commit timestamp, but not a column filled by a sequence such as an id, as transactions can commit their sequence values out of order and their rows would then never be refreshed), used by every refresh to find the appended rows instead of their xmin, and a button refreshing the number of rows and missing values of the table with the appended rows only (Dataset.refresh_counts())
+
+    --------------------
+    Parameters
+    --------------------
+    Data(Dataset): Dataset of the selected table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    display a select box with the columns of the table, or xmin, and store the selected column in the session state
+    display a button that refreshes the counts of the table with the selected column
+    if the counts have been refreshed, display a note on the last refresh (get_refresh_note())
+
+    --------------------
+    Returns
+    --------------------
+    none
+
+    """
+    options = ['xmin'] + list(Data.df.columns)
+    watermark_column = st.selectbox('Column increasing in commit order (e.g. a commit timestamp, not a sequence such as an id), used to find the appended rows on refresh', options, key='watermark_select')
+    st.session_state['watermark_column'] = None if watermark_column == 'xmin' else watermark_column
+    if st.button('Refresh counts', key='refresh_counts'):
+        Data.watermark_column = st.session_state['watermark_column']
+        with st.spinner('Refreshing counts...'):
+            Data.refresh_counts()
+    if Data.state is not None:
+        st.caption(get_refresh_note(Data.state))
+
+def display_save_snapshot(Data):
+    """
+    --------------------
+    Description
+    --------------------
+    display_save_snapshot (function): Function that displays a button loading the rows of a bootstrapped table and saving them as an on-disk snapshot, so that the next sessions read the table from disk while it does not change
+
+    --------------------
+    Parameters
+    --------------------
+    Data(Dataset): Dataset of the selected table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    only display the button if the Dataset is bootstrapped and has a snapshot store and a version token
+    if it is clicked:
+        load the rows of the table, which writes them to the snapshot store, and compute the table attributes from them exactly
+        store the Dataset again in the cache so that its memory usage is updated
+
+    --------------------
+    Returns
+    --------------------
+    none
+
+    """
+    if not (Data.bootstrap and Data.snapshots is not None and Data.version):
+        return
+    if st.button('Save local snapshot', key='save_snapshot'):
+        with st.spinner('Loading rows...'):
+            Data.bootstrap = Data.estimate_rows = False
+            Data.set_data()
+        cache = get_dataset_cache()
+        cache.put(cache.get_key(Data), Data)
+
+def display_profile_all(Data):
+    """
+    --------------------
+    Description
+    --------------------
+    display_profile_all (function): Function that displays a button profiling every numeric, text and date column of the table not profiled yet, on a process pool from the loaded rows (ProcessProfiler) or on a thread pool of SQL queries otherwise (ProfileExecutor), showing the progress as every column finishes
+
+    --------------------
+    Parameters
+    --------------------
+    Data(Dataset): Dataset of the selected table
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    display a button that profiles every column of the table
+    if it is clicked:
+        list the columns that have not been profiled yet
+        if the rows of the table are loaded and no sampling percentage is selected in session state, run a ProcessProfiler on them and store every profile in its column class (ProcessProfiler.get_column()), counting the unique and frequent values exactly as they are already in memory
+        otherwise run a ProfileExecutor on them with at most PROFILE_MAX_IN_FLIGHT columns at a time, on the sampling percentage, the precision of the unique counts and the capacity of the frequent values selected in session state
+        memoize every profiled column in session state and update the progress bar and the name of the last column as soon as it finishes
+
+    --------------------
+    Returns
+    --------------------
+    none
+
+    """
+    if not st.button('Profile all columns', key='profile_all_columns'):
+        return
+    if not Data.df.empty and not st.session_state.get('sample_percent'):
+        profiler = ProcessProfiler(Data)
+        columns = [(kind, col_name) for kind, col_name in profiler.get_columns() if get_column_profile(kind, col_name) is None]
+        profiles = ((kind, col_name, profiler.get_column(kind, col_name, profile)) for kind, col_name, profile in profiler.run(columns))
+    else:
+        executor = ProfileExecutor(Data, max_in_flight=PROFILE_MAX_IN_FLIGHT, sample_percent=st.session_state.get('sample_percent'), distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity'))
+        columns = [(kind, col_name) for kind, col_name in executor.get_columns() if get_column_profile(kind, col_name) is None]
+        profiles = executor.run(columns)
+    progress = st.progress(0)
+    status = st.empty()
+    for n_done, (kind, col_name, column) in enumerate(profiles, start=1):
+        set_column_profile(kind, col_name, column)
+        progress.progress(n_done / len(columns))
+        status.caption(f"Profiled {kind} column {col_name} ({n_done}/{len(columns)})")
+    progress.progress(1.0)
 
 def display_dataframes():
     """
@@ -80,7 +292,8 @@ def display_dataframes():
     --------------------
     get data from session session state
     setup slider and radio selection with streamlit
-    display relevant information of table data based on user choice
+    display relevant information of table data based on user choice, read from the database with LIMIT queries unless the rows are already loaded:
+        head and tail in key order, a TABLESAMPLE sample for the selected seed, or pages of the table browsed with previous and next buttons (display_pages())
 
     --------------------
     Returns
@@ -90,13 +303,60 @@ def display_dataframes():
     """
     Data = st.session_state['data']
     nrow = st.slider('Select the number of rows to be displayed', 5, 50)
-    logic = st.radio('Exploration Method', ('Head', 'Tail', 'Sample'))
+    logic = st.radio('Exploration Method', ('Head', 'Tail', 'Sample', 'Pages'))
     if logic == 'Head':
         st.header('Top Rows of Selected Table')
         st.write(Data.get_head(nrow))
     elif logic == 'Tail':
         st.header('Bottom Rows of Selected Table')
         st.write(Data.get_tail(nrow))
-    else:
+    elif logic == 'Sample':
+        seed = st.number_input('Sample seed', min_value=0, value=0, step=1)
         st.header('Random Sample Rows of Selected Table')
-        st.write(Data.get_sample(nrow))
+        st.write(Data.get_sample(nrow, seed=int(seed)))
+    else:
+        st.header('Pages of Selected Table')
+        display_pages(Data, nrow)
+
+def display_pages(Data, nrow):
+    """
+    --------------------
+    Description
+    --------------------
+    display_pages (function): Function that displays the table one page at a time with previous and next buttons, reading every page with a keyset query (Dataset.get_page()) from the key of the last row of the previous page kept in the session state
+
+    --------------------
+    Parameters
+    --------------------
+    Data(Dataset): dataset of the selected table
+    nrow(int): number of rows of a page
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    reset the stack of page keys in session state if the table or the number of rows per page changed
+    display previous and next buttons: next pushes the key of the last row of the current page on the stack, previous pops it
+    read the page starting after the key on top of the stack, remember the key of its last row and display it with its page number
+    note that the pages of a table without primary key are read in the order its rows are stored, so that rows updated while paging can be shown twice or skipped
+
+    --------------------
+    Returns
+    --------------------
+    none
+
+    """
+    page_id = (Data.schema_name, Data.table_name, nrow)
+    pages = st.session_state.get('explore_pages')
+    if pages is None or pages['id'] != page_id:
+        pages = {'id': page_id, 'keys': [None], 'next': None}
+        st.session_state['explore_pages'] = pages
+    col_previous, col_next = st.columns(2)
+    if col_previous.button('Previous page', key='previous_page') and len(pages['keys']) > 1:
+        pages['keys'].pop()
+    if col_next.button('Next page', key='next_page') and pages['next'] is not None:
+        pages['keys'].append(pages['next'])
+    page, pages['next'] = Data.get_page(nrow, after=pages['keys'][-1])
+    st.caption(f"Page {len(pages['keys'])}" + ('' if pages['next'] is not None else ' (last page)'))
+    if Data.get_key_columns() == ['ctid']:
+        st.caption('The table has no primary key: its pages are read in the order its rows are stored (ctid), block range by block range, so rows updated while paging can be shown twice or skipped.')
+    st.write(page)
@@ -1,8 +1,92 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
+from urllib.parse import quote, unquote
+
+import numpy as np
 import pandas as pd
 import streamlit as st
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from src.database.logics import PostgresConnector, CatalogCache, IncrementalState, COLUMN_ENGINE, BOOL_TYPE_OIDS, TEXT_TYPE_OIDS, DATE_TYPE_OIDS, DATETZ_TYPE_OIDS
+from src.serie_numeric.logics import NumericColumn
+from src.serie_text.logics import TextColumn
+from src.serie_date.logics import DateColumn
+from src.dataframe.queries import get_numeric_tables_query, get_text_tables_query, get_date_tables_query, get_table_version_query, get_columns_query, get_row_missing_query, get_duplicates_query, get_row_estimate_query, get_column_stats_query, get_page_query, get_table_blocks_query, get_row_counts_query
+
+INTEGER_TYPE_OIDS = [20, 21, 23]
+FLOAT4_TYPE_OID = 700
+NUMERIC_TYPE_OID = 1700
+CATEGORY_MAX_RATIO = 0.5
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', '.snapshots')
+SNAPSHOT_MAX_BYTES = int(os.getenv('SNAPSHOT_MAX_BYTES', 2 * 1024 ** 3))
+SNAPSHOT_FORMATS = ('feather', 'parquet')
+
+
+def compact_dtypes(df, column_types, max_category_ratio=CATEGORY_MAX_RATIO):
+    """
+    --------------------
+    Description
+    --------------------
+    compact_dtypes (function): Function that converts the columns of a dataframe loaded from Postgres to the most compact dtypes allowed by their Postgres types: integers (and numeric columns without decimals) to the smallest integer width, other numeric columns from Decimal objects to float64, real to float32, low-cardinality text to category, dates and timestamps to datetime64[ns, UTC] and booleans without missing values to bool
+
+    --------------------
+    Parameters
+    --------------------
+    df(pd.DataFrame): dataframe loaded from Postgres
+    column_types(dict): (type OID, formatted type) tuple of every column name (CatalogCache.get_column_types())
+    max_category_ratio(float): maximum ratio of unique values to rows for a text column to be converted to category, None to keep the text columns unchanged (default: CATEGORY_MAX_RATIO)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    for every column of the dataframe with a known Postgres type:
+        integers and numeric columns with a scale of 0 and at most 18 digits: convert to the smallest integer dtype holding their values, or to float64 if they have missing values
+        other numeric columns: convert the Decimal objects to float64
+        real: convert to float32
+        text: convert to category if the ratio of unique values to rows is at most max_category_ratio
+        date and timestamp: convert to datetime64[ns, UTC]
+        boolean: convert to bool if there are no missing values
+    return the converted dataframe
+
+    --------------------
+    Returns
+    --------------------
+    pandas dataframe
 
-from src.database.logics import PostgresConnector
-from src.dataframe.queries import get_numeric_tables_query, get_text_tables_query, get_date_tables_query
+    """
+    df = df.copy(deep=False)
+    for col_name in df.columns:
+        if col_name not in column_types or df.empty:
+            continue
+        type_oid, data_type = column_types[col_name]
+        serie = df[col_name]
+        scale = re.fullmatch(r'numeric\((\d+),(\d+)\)', data_type or '')
+        if type_oid in INTEGER_TYPE_OIDS or (scale and scale.group(2) == '0' and int(scale.group(1)) <= 18):
+            if serie.isna().any():
+                df[col_name] = pd.to_numeric(serie).astype('float64')
+            else:
+                df[col_name] = pd.to_numeric(serie.map(int) if serie.dtype == object else serie, downcast='integer')
+        elif type_oid == NUMERIC_TYPE_OID:
+            df[col_name] = pd.to_numeric(serie).astype('float64')
+        elif type_oid == FLOAT4_TYPE_OID:
+            df[col_name] = pd.to_numeric(serie).astype('float32')
+        elif type_oid in TEXT_TYPE_OIDS:
+            if max_category_ratio is not None and serie.dtype != 'category' and serie.nunique() <= max_category_ratio * serie.shape[0]:
+                df[col_name] = serie.astype('category')
+        elif type_oid in DATE_TYPE_OIDS + DATETZ_TYPE_OIDS:
+            df[col_name] = pd.to_datetime(serie, utc=True)
+        elif type_oid in BOOL_TYPE_OIDS and not serie.isna().any():
+            df[col_name] = serie.astype(bool)
+    return df
 
 
 class Dataset:
@@ -26,12 +110,40 @@ class Dataset:
     -> num_cols (list): List of columns of numerical type (optional)
     -> text_cols (list): List of columns of text type (optional)
     -> date_cols (list): List of columns of datetime type (optional)
+    -> chunksize (int): Number of rows streamed from Postgres at a time with a server-side cursor, None loads the table in one fetch (optional)
+    -> keep_rows (bool): Whether the streamed chunks are concatenated into self.df or only folded into the table statistics (optional)
+    -> version (str): Token identifying the version of the content of the table, used as part of the key of the DatasetCache (optional)
+    -> schema (pd.Dataframe): Schema information of the table, kept after the first call of get_schema() (optional)
+    -> bootstrap (bool): Whether set_data() computes the table attributes from the catalog and aggregate queries instead of loading the rows (optional)
+    -> estimate_rows (bool): Whether the number of rows of a bootstrapped table is the catalog estimate (pg_stat_user_tables / pg_class) instead of an exact count, leaving the missing values and duplicated rows uncounted until set_exact_counts() is called (optional)
+    -> estimate_note (str): Note on the confidence of the estimated number of rows (optional)
+    -> column_stats (dict): Estimated profile of every analysed column read from pg_stats, kept after the first call of get_column_stats() (optional)
+    -> catalog (CatalogCache): Shared cache of the columns and types of the tables, used instead of querying information_schema when set (optional)
+    -> compact (bool): Whether the loaded rows are converted to the most compact dtypes allowed by the Postgres types of the columns (compact_dtypes()) (optional)
+    -> snapshots (SnapshotStore): On-disk store from which the rows of the current version of the table are read, and to which they are written after being loaded from Postgres, when set (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, used by refresh_counts() to select the new rows instead of their xmin (optional)
+    -> state (IncrementalState): Position of the last scan of refresh_counts() (optional)
+    -> key_cols (list): Columns ordering the rows of the table for paging through it, kept after the first call of get_key_columns() (optional)
     """
-    def __init__(self, schema_name=None, table_name=None, db=None, df=pd.DataFrame()):
+    def __init__(self, schema_name=None, table_name=None, db=None, df=pd.DataFrame(), chunksize=None, keep_rows=True, bootstrap=False, estimate_rows=False, catalog=None, compact=True, snapshots=None, watermark_column=None):
         self.schema_name = schema_name
         self.table_name = table_name
         self.db = db
         self.df = df
+        self.chunksize = chunksize
+        self.keep_rows = keep_rows
+        self.version = None
+        self.schema = None
+        self.bootstrap = bootstrap
+        self.estimate_rows = estimate_rows
+        self.estimate_note = None
+        self.column_stats = None
+        self.catalog = catalog
+        self.compact = compact
+        self.snapshots = snapshots
+        self.watermark_column = watermark_column
+        self.state = None
+        self.key_cols = None
         self.n_rows = None
         self.n_cols = None
         self.n_duplicates = None
@@ -55,10 +167,10 @@ class Dataset:
         --------------------
         Pseudo-Code
         --------------------
-        open connection and cursor to the database
-        extract content of selected Postgres table and load into class attribute as pandas dataframe
-        close cursor and connection to the database
+        if bootstrap is set, compute the table attributes from the catalog and aggregate queries without loading the rows (set_bootstrap())
+        otherwise load the rows of the table (set_rows())
         call class fucntions to compute table attributes after checking the dataframe is not empty
+        only extract the column types if the table attributes were computed without keeping the rows
 
         --------------------
         Returns
@@ -66,11 +178,10 @@ class Dataset:
         none
 
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        self.df = self.db.load_table(self.schema_name, self.table_name)
-        self.db.close_cursor()
-        self.db.close_connection()
+        if self.bootstrap:
+            self.set_bootstrap()
+        else:
+            self.set_rows()
 
         if (not self.is_df_none()):
             self.set_dimensions()
@@ -79,13 +190,17 @@ class Dataset:
             self.set_numeric_columns()
             self.set_text_columns()
             self.set_date_columns()
+        elif (self.n_rows):
+            self.set_numeric_columns()
+            self.set_text_columns()
+            self.set_date_columns()
 
-    def is_df_none(self):
+    def set_rows(self):
         """
         --------------------
         Description
         --------------------
-        is_df_none (method): Class method that checks if self.df is empty or none
+        set_rows (method): Class method that loads the rows of the selected Postgres table into self.df
 
         --------------------
         Parameters
@@ -95,48 +210,83 @@ class Dataset:
         --------------------
         Pseudo-Code
         --------------------
-        return boolean value indicating if the dataframe is empty
+        if a snapshot store is set and the rows are kept, get the version token of the table if it is not known yet (set_version()) and load the rows from the snapshot of that version if there is one
+        open connection and cursor to the database
+        if a chunksize is set, stream the content of selected Postgres table in chunks:
+            if keep_rows is set, concatenate the chunks into class attribute as pandas dataframe, converting the numeric and date columns of every chunk to compact dtypes (compact_dtypes()) if compact is set
+            otherwise fold the chunks into the table attributes without keeping the rows and count the duplicated rows in Postgres with a group by on a hash of the rows (get_duplicates_query())
+        otherwise extract content of selected Postgres table and load into class attribute as pandas dataframe
+        close cursor and connection to the database
+        if compact is set, convert the columns of the loaded dataframe to compact dtypes (compact_dtypes())
+        if a snapshot store is set and the rows are kept, write them as the snapshot of the version of the table
 
         --------------------
         Returns
         --------------------
-        Boolean value
+        none
 
         """
-        return self.df.empty
+        use_snapshot = self.snapshots is not None and self.keep_rows
+        if use_snapshot:
+            if self.version is None:
+                self.set_version()
+            df = self.snapshots.read(self)
+            if df is not None:
+                self.df = df
+                return
+        column_types = self.get_column_types() if self.compact else None
+        self.db.open_connection()
+        self.db.open_cursor()
+        if self.chunksize:
+            chunks = self.db.load_table_chunks(self.schema_name, self.table_name, itersize=self.chunksize)
+            if self.keep_rows:
+                if column_types:
+                    chunks = (compact_dtypes(chunk, column_types, max_category_ratio=None) for chunk in chunks)
+                self.df = pd.concat(chunks, ignore_index=True)
+            else:
+                self.fold_chunks(chunks)
+                self.n_duplicates = int(self.db.run_query(get_duplicates_query(self.schema_name, self.table_name))[0][0])
+        else:
+            self.df = self.db.load_table(self.schema_name, self.table_name)
+        self.db.close_cursor()
+        self.db.close_connection()
+        if column_types and self.df is not None:
+            self.df = compact_dtypes(self.df, column_types)
+        if use_snapshot:
+            self.snapshots.write(self)
 
-    def set_dimensions(self):
+    def get_column_types(self):
         """
         --------------------
         Description
         --------------------
-        set_dimensions (method): Class method that computes the dimensions (number of columns and rows) of self.df and store them as attributes (self.n_rows, self.n_cols)
+        get_column_types (method): Class method that returns the Postgres type of every column of the table from the shared catalog cache, or from a catalog cache of the connection of the class when it has none (CatalogCache.get_column_types())
 
         --------------------
         Parameters
         --------------------
-        self: Reference to the current instance of the classtion
+        self: Reference to the current instance of the class
 
         --------------------
         Pseudo-Code
         --------------------
-        save relevant dataframe shape into attributes representing number of columns and rows of the dataframe
+        return the (type OID, formatted type) tuple of every column of the table read from the catalog cache
 
         --------------------
         Returns
         --------------------
-        none
+        dict
 
         """
-        self.n_rows = self.df.shape[0]
-        self.n_cols = self.df.shape[1]
+        catalog = self.catalog if self.catalog is not None else CatalogCache(self.db)
+        return catalog.get_column_types(self.schema_name, self.table_name)
 
-    def set_duplicates(self):
+    def set_bootstrap(self):
         """
         --------------------
         Description
         --------------------
-        set_duplicates (method): Class method that computes the number of duplicated of self.df and store it as attribute (self.n_duplicates)
+        set_bootstrap (method): Class method that computes the number of rows, columns, duplicated rows and missing values of the table from the catalog and aggregate SQL queries (from get_columns_query(), set_exact_counts() and set_row_estimate()) without loading its rows
 
         --------------------
         Parameters
@@ -146,7 +296,9 @@ class Dataset:
         --------------------
         Pseudo-Code
         --------------------
-        save the number of duplicated rows in the class's dataframe to the class attribute
+        extract the list of columns of the table (get_typed_columns()) and save their number and an empty dataframe with the column names to the class
+        if estimate_rows is set, only read the estimated number of rows from the table statistics (set_row_estimate())
+        otherwise count the rows, missing values and duplicated rows by scanning the table (set_exact_counts())
 
         --------------------
         Returns
@@ -154,24 +306,35 @@ class Dataset:
         none
 
         """
-        self.n_duplicates = self.df.duplicated().sum()
-
-    def set_missing(self):
+        col_names = self.get_typed_columns(None, get_columns_query)
+        self.df = pd.DataFrame(columns=col_names)
+        self.n_cols = len(col_names)
+        if self.estimate_rows:
+            self.set_row_estimate()
+        else:
+            self.set_exact_counts()
+
+    def set_exact_counts(self, count_duplicates=False):
         """
         --------------------
         Description
         --------------------
-        set_missing (method): Class method that computes the number of missing values of self.df and store it as attribute (self.n_missing)
+        set_exact_counts (method): Class method that computes the exact number of rows and missing values of the table, and optionally its duplicated rows, with aggregate SQL queries (from get_row_missing_query() and get_duplicates_query())
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
+        count_duplicates(bool): whether the duplicated rows are counted too, which groups every row of the table (default: False)
 
         --------------------
         Pseudo-Code
         --------------------
-        save the number of missing rows in the class's dataframe to corresponding class attribute
+        open connection and cursor to the database
+        count the rows and the missing values of every column in a single statement
+        if count_duplicates is set, count the duplicated rows with a group by on a hash of the rows, otherwise note that they have not been counted
+        flag the number of rows as exact
+        close cursor and connection to the database
 
         --------------------
         Returns
@@ -179,29 +342,86 @@ class Dataset:
         none
 
         """
-        self.n_missing = self.df.isna().sum().sum()
+        self.db.open_connection()
+        self.db.open_cursor()
+        row = self.db.run_query(get_row_missing_query(self.schema_name, self.table_name, list(self.df.columns))).iloc[0]
+        self.n_rows, self.n_missing = int(row[0]), int(row[1])
+        self.estimate_rows = False
+        if count_duplicates:
+            self.n_duplicates = int(self.db.run_query(get_duplicates_query(self.schema_name, self.table_name))[0][0])
+            self.estimate_note = None
+        else:
+            self.estimate_note = 'The duplicated rows have not been counted; count the rows exactly with the duplicated rows to count them.'
+        self.db.close_cursor()
+        self.db.close_connection()
 
-    def set_numeric_columns(self):
+    def refresh_counts(self):
         """
         --------------------
         Description
         --------------------
-        set_numeric_columns (method): Class method that extract the list of numeric columns from a table using a SQL query (from get_numeric_tables_query()),
-        store it as attribute (self.num_cols) and then convert the relevant columns of self.df accordingly.
+        refresh_counts (method): Class method that refreshes the number of rows and missing values of the table by only counting the rows appended since the previous refresh, as long as no row has been updated or deleted and the table has not been truncated (IncrementalState), and recounts the duplicated rows when the whole table is scanned
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
 
+        --------------------
+        Pseudo-Code
+        --------------------
+        start a new IncrementalState if there is none or if the watermark column has changed
+        count the rows and the missing values of the new rows, or of every row when they cannot be merged, in a single statement that also returns the position of the scan (get_row_counts_query())
+        if the scan was incremental, add the counts to the previous ones and note that the duplicated rows were counted before the appended rows
+        otherwise replace the counts and count the duplicated rows in the same snapshot with a group by on a hash of the rows (get_duplicates_query())
+        flag the number of rows as exact and store the position of the scan
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        if self.state is None or self.state.watermark_column != self.watermark_column:
+            self.state = IncrementalState(self.schema_name, self.table_name, self.watermark_column)
+        col_names = list(self.df.columns)
+        def scan(condition):
+            row = self.db.run_query(get_row_counts_query(self.schema_name, self.table_name, col_names, condition, self.watermark_column)).iloc[0].tolist()
+            if not self.state.incremental:
+                self.n_duplicates = int(self.db.run_query(get_duplicates_query(self.schema_name, self.table_name))[0][0])
+            return row
+        snapshot, watermark, n_rows, seen_xids, n_missing = self.state.refresh(self.db, scan)
+        if self.state.incremental:
+            self.n_rows += int(n_rows)
+            self.n_missing += int(n_missing)
+            if n_rows:
+                self.estimate_note = 'The duplicated rows were counted before rows were appended; count the rows exactly to recount them.'
+        else:
+            self.n_rows, self.n_missing = int(n_rows), int(n_missing)
+            self.estimate_note = None
+        self.estimate_rows = False
+        self.state.set_position(snapshot, watermark, n_rows, seen_xids)
+
+    def set_row_estimate(self):
+        """
+        --------------------
+        Description
+        --------------------
+        set_row_estimate (method): Class method that reads the estimated number of rows of the table from pg_stat_user_tables.n_live_tup, or pg_class.reltuples when there are no statistics or they have been reset (n_live_tup of 0 with a positive reltuples), and describes how reliable the estimate is (from get_row_estimate_query())
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
 
         --------------------
         Pseudo-Code
         --------------------
         open connection and cursor to the database
-        using existing sql query to extract numeric columns of the Postgres table
-        transform class's dataframe's columns based on extracted numeric columns after checking the dataframe is not empty
-        close connection and cursor to the database
+        extract the catalog row estimates, the number of rows modified since the last analyze and the time of the last analyze
+        save the estimated number of rows and a note on its confidence to the class
+        close cursor and connection to the database
+
         --------------------
         Returns
         --------------------
@@ -210,75 +430,76 @@ class Dataset:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        result = self.db.run_query(get_numeric_tables_query(self.schema_name, self.table_name))
-        if (not result.empty):
-            self.num_cols = list(result[0])
-            for column in self.num_cols:
-                for col in self.df.columns:
-                    if (col == column):
-                        self.df[col] = pd.to_numeric(self.df[col])
+        result = self.db.run_query(get_row_estimate_query(self.schema_name, self.table_name))
         self.db.close_cursor()
         self.db.close_connection()
-
-    def set_text_columns(self):
+        if result.empty:
+            self.n_rows, self.estimate_note = 0, 'No statistics are available for this table.'
+            return
+        reltuples, n_live_tup, n_mod_since_analyze, last_analyze = result.iloc[0]
+        if pd.notna(n_live_tup) and not (n_live_tup == 0 and reltuples > 0):
+            self.n_rows = int(n_live_tup)
+        else:
+            self.n_rows = max(int(reltuples), 0)
+        if pd.isna(last_analyze):
+            self.estimate_note = 'Estimated from the table statistics; the table has never been analysed, so the estimate may be far off.'
+        else:
+            self.estimate_note = f'Estimated from the table statistics last analysed on {pd.Timestamp(last_analyze):%Y-%m-%d %H:%M}; {int(n_mod_since_analyze or 0):,} rows have been modified since.'
+
+    def fold_chunks(self, chunks):
         """
         --------------------
         Description
         --------------------
-        set_text_columns (method): Class method that extract the list of text columns from a table using a SQL query (from get_numeric_tables_query()),
-        store it as attribute (self.text_cols) and then convert the relevant columns of self.df accordingly.
+        fold_chunks (method): Class method that computes the number of rows, columns and missing values of a table from a stream of dataframe chunks without keeping the rows, the duplicated rows being counted in Postgres by set_rows() as they cannot be detected without keeping a hash of every row
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
-
+        chunks(iterable): pandas dataframes holding consecutive rows of the table
 
         --------------------
         Pseudo-Code
         --------------------
-        open connection and cursor to the database
-        using existing sql query to extract text columns of the Postgres table
-        transform class's dataframe's columns based on extracted text columns after checking the dataframe is not empty
-        close connection and cursor to the database
+        reset the table attributes to zero
+        for every chunk, add its number of rows and missing values to the corresponding class attributes
+        save the number of columns and an empty dataframe with the column names to the class
+
         --------------------
         Returns
         --------------------
         none
+
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        result = self.db.run_query(get_text_tables_query(self.schema_name, self.table_name))
-        if (not result.empty):
-            self.text_cols = list(result[0])
-            for column in self.text_cols:
-                for col in self.df.columns:
-                    if (col == column):
-                        self.df[col].apply(lambda v: str(v) if not pd.isnull(v) else None)
-        self.db.close_cursor()
-        self.db.close_connection()
+        self.n_rows = 0
+        self.n_missing = 0
+        for chunk in chunks:
+            self.n_rows += chunk.shape[0]
+            self.n_missing += int(chunk.isna().sum().sum())
+            self.df = chunk.head(0)
+        self.n_cols = self.df.shape[1]
 
-    def set_date_columns(self):
+    def set_version(self):
         """
         --------------------
         Description
         --------------------
-        set_date_columns (method): Class method that extract the list of datetime columns from a table using a SQL query (from get_numeric_tables_query()),
-        store it as attribute (self.date_cols) and then convert the relevant columns of self.df accordingly.
+        set_version (method): Class method that extracts a token identifying the version of the content of the table using a SQL query (from get_table_version_query()) and store it as attribute (self.version)
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
 
-
         --------------------
         Pseudo-Code
         --------------------
         open connection and cursor to the database
-        using existing sql query to extract date columns of the Postgres table
-        transform class's dataframe's columns based on extracted datte columns after checking the dataframe is not empty
+        using existing sql query to extract the number of inserted, updated and deleted rows of the Postgres table, its file node and the time the statistics were last reset
+        join them into a version token, summed over the partitions of a partitioned table, or use an empty token if the table has no statistics (e.g. views and foreign tables), which disables the reuse of its cached Dataset and snapshot
         close connection and cursor to the database
+
         --------------------
         Returns
         --------------------
@@ -287,100 +508,120 @@ class Dataset:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        result = self.db.run_query(get_date_tables_query(self.schema_name, self.table_name))
-        if (not result.empty):
-            self.date_cols = list(result[0])
-            for column in self.date_cols:
-                for col in self.df.columns:
-                    if (col == column):
-                        self.df[col] = pd.to_datetime(self.df[col], utc=True)
+        result = self.db.run_query(get_table_version_query(self.schema_name, self.table_name))
         self.db.close_cursor()
         self.db.close_connection()
+        self.version = '-'.join(str(value) for value in result.iloc[0].tolist()) if (result is not None and not result.empty) else ''
 
-    def get_head(self, n=5):
+    def get_memory_usage(self):
         """
         --------------------
         Description
         --------------------
-        get_head (method): Class method that computes the first rows of self.df according to the provided number of rows specified as parameter (default: 5)
+        get_memory_usage (method): Class method that computes the number of bytes used by self.df
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
-        n(int): control the number of rows to be displayed
 
         --------------------
         Pseudo-Code
         --------------------
-        show the top n rows of the class's dataframe
+        return the deep memory usage of the class's dataframe, or 0 if there is no dataframe
 
         --------------------
         Returns
         --------------------
-        pandas dataframe
+        int
 
         """
-        return self.df.head(n)
+        if self.df is None:
+            return 0
+        return int(self.df.memory_usage(deep=True).sum())
 
-    def get_tail(self, n=5):
+    def is_df_none(self):
         """
         --------------------
         Description
         --------------------
-        get_tail (method): Class method that computes the last rows of self.df according to the provided number of rows specified as parameter (default: 5)
+        is_df_none (method): Class method that checks if self.df is empty or none
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
-        n(int): control the number of rows to be displayed
 
         --------------------
         Pseudo-Code
         --------------------
-        show the bottom n rows of the class's dataframe
+        return boolean value indicating if the dataframe is empty
 
         --------------------
         Returns
         --------------------
-        pandas dataframe
+        Boolean value
+
+        """
+        return self.df.empty
+
+    def set_dimensions(self):
+        """
+        --------------------
+        Description
+        --------------------
+        set_dimensions (method): Class method that computes the dimensions (number of columns and rows) of self.df and store them as attributes (self.n_rows, self.n_cols)
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the classtion
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        save relevant dataframe shape into attributes representing number of columns and rows of the dataframe
+
+        --------------------
+        Returns
+        --------------------
+        none
 
         """
-        return self.df.tail(n)
+        self.n_rows = self.df.shape[0]
+        self.n_cols = self.df.shape[1]
 
-    def get_sample(self, n=5):
+    def set_duplicates(self):
         """
         --------------------
         Description
         --------------------
-        get_sample (method): Class method that computes a random sample of rows of self.df according to the provided number of rows specified as parameter (default: 5)
+        set_duplicates (method): Class method that computes the number of duplicated of self.df and store it as attribute (self.n_duplicates)
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
-        n(int): control the number of rows to be displayed
 
         --------------------
         Pseudo-Code
         --------------------
-        show random n rows of the class's dataframe
+        save the number of duplicated rows in the class's dataframe to the class attribute
 
         --------------------
         Returns
         --------------------
-        pandas dataframe
+        none
 
         """
-        return self.df.sample(n)
+        self.n_duplicates = self.df.duplicated().sum()
 
-    def get_summary_df(self):
+    def set_missing(self):
         """
         --------------------
         Description
         --------------------
-        get_summary_df (method): Class method that formats all requested information from self.df to be displayed in the Overall section of Streamlit app as a Pandas dataframe with 2 columns: Description and Value
+        set_missing (method): Class method that computes the number of missing values of self.df and store it as attribute (self.n_missing)
 
         --------------------
         Parameters
@@ -390,26 +631,23 @@ class Dataset:
         --------------------
         Pseudo-Code
         --------------------
-        setup an empty pandas DataFrame
-        set specified columns and values from computed attributes of the class's dataframe
+        save the number of missing rows in the class's dataframe to corresponding class attribute
 
         --------------------
         Returns
         --------------------
-        pandas dataframe
+        none
 
         """
-        summary = pd.DataFrame()
-        summary['Description'] = ['Name of Table', 'Number of Rows', 'Number of Columns', 'Number of Duplicated Rows', 'Number of Rows with Missing Values']
-        summary['Value'] = [self.table_name, self.n_rows, self.n_cols, self.n_duplicates, self.n_missing]
-        return summary
+        self.n_missing = self.df.isna().sum().sum()
 
-    def get_schema(self):
+    def set_numeric_columns(self):
         """
         --------------------
         Description
         --------------------
-        get_schema (method): Class method that formats table schema information for selected Postgres table
+        set_numeric_columns (method): Class method that extract the list of numeric columns from a table using a SQL query (from get_numeric_tables_query()),
+        store it as attribute (self.num_cols) and then convert the relevant columns of self.df accordingly.
 
         --------------------
         Parameters
@@ -420,19 +658,1358 @@ class Dataset:
         --------------------
         Pseudo-Code
         --------------------
-        open connection and cursor to the database
-        get table schema information for classls selected table from existing sql query
-        close connection and cursor to the database
+        extract numeric columns of the Postgres table from the catalog cache or the existing sql query (get_typed_columns())
+        transform class's dataframe's columns based on extracted numeric columns after checking the dataframe is not empty
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        col_names = self.get_typed_columns('numeric', get_numeric_tables_query)
+        if col_names:
+            self.num_cols = col_names
+            for column in self.num_cols:
+                for col in self.df.columns:
+                    if (col == column):
+                        self.df[col] = pd.to_numeric(self.df[col])
 
+    def set_text_columns(self):
+        """
+        --------------------
+        Description
+        --------------------
+        set_text_columns (method): Class method that extract the list of text columns from a table using a SQL query (from get_numeric_tables_query()),
+        store it as attribute (self.text_cols) and then convert the relevant columns of self.df accordingly.
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        extract text columns of the Postgres table from the catalog cache or the existing sql query (get_typed_columns())
+        transform class's dataframe's columns based on extracted text columns after checking the dataframe is not empty
         --------------------
         Returns
         --------------------
-        pandas dataframe
+        none
+        """
+        col_names = self.get_typed_columns('text', get_text_tables_query)
+        if col_names:
+            self.text_cols = col_names
+            for column in self.text_cols:
+                for col in self.df.columns:
+                    if (col == column):
+                        self.df[col].apply(lambda v: str(v) if not pd.isnull(v) else None)
 
+    def set_date_columns(self):
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        schema = self.db.get_table_schema(self.schema_name, self.table_name)
-        self.db.close_cursor()
-        self.db.close_connection()
-        return schema
+        --------------------
+        Description
+        --------------------
+        set_date_columns (method): Class method that extract the list of datetime columns from a table using a SQL query (from get_numeric_tables_query()),
+        store it as attribute (self.date_cols) and then convert the relevant columns of self.df accordingly.
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        extract date columns of the Postgres table from the catalog cache or the existing sql query (get_typed_columns())
+        transform class's dataframe's columns based on extracted datte columns after checking the dataframe is not empty
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        col_names = self.get_typed_columns('date', get_date_tables_query)
+        if col_names:
+            self.date_cols = col_names
+            for column in self.date_cols:
+                for col in self.df.columns:
+                    if (col == column):
+                        self.df[col] = pd.to_datetime(self.df[col], utc=True)
+
+    def get_typed_columns(self, kind, get_query):
+        """
+        --------------------
+        Description
+        --------------------
+        get_typed_columns (method): Class method that returns the names of the columns of the table of a given kind from the shared catalog cache (CatalogCache.get_columns()), or from a SQL query on information_schema when the class has no catalog
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        kind(str): kind of the columns, 'numeric', 'text' or 'date', or all the columns if None
+        get_query(function): function returning the SQL query that lists the columns of that kind
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if there is a catalog cache, return its columns of the table of that kind
+        otherwise open connection and cursor to the database, extract the columns with the sql query, close cursor and connection to the database and return them
+
+        --------------------
+        Returns
+        --------------------
+        list
+
+        """
+        if self.catalog is not None:
+            return self.catalog.get_columns(self.schema_name, self.table_name, kind)
+        self.db.open_connection()
+        self.db.open_cursor()
+        result = self.db.run_query(get_query(self.schema_name, self.table_name))
+        self.db.close_cursor()
+        self.db.close_connection()
+        return list(result[0]) if not result.empty else []
+
+    def get_head(self, n=5):
+        """
+        --------------------
+        Description
+        --------------------
+        get_head (method): Class method that computes the first rows of self.df according to the provided number of rows specified as parameter (default: 5), or reads the first page of the Postgres table when its rows have not been loaded
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        n(int): control the number of rows to be displayed
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the class's dataframe is loaded, show the top n rows of it
+        otherwise show the first page of n rows of the table (get_page())
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        if not self.is_df_none():
+            return self.df.head(n)
+        return self.get_page(n)[0]
+
+    def get_tail(self, n=5):
+        """
+        --------------------
+        Description
+        --------------------
+        get_tail (method): Class method that computes the last rows of self.df according to the provided number of rows specified as parameter (default: 5), or reads them from the end of the Postgres table in key order when its rows have not been loaded
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        n(int): control the number of rows to be displayed
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the class's dataframe is loaded, show the bottom n rows of it
+        otherwise read the last page of n rows of the table in descending key order (get_page()) and put it back in ascending order
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        if not self.is_df_none():
+            return self.df.tail(n)
+        page = self.get_page(n, descending=True)[0]
+        return page.iloc[::-1].reset_index(drop=True)
+
+    def get_key_columns(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_key_columns (method): Class method that returns the columns ordering the rows of the table for paging through it: its primary key detected in the table schema (get_schema()), or the physical location of the rows (ctid) if it has none, and keeps them so that the catalog is not read again for every page
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the key columns have already been computed, return them
+        get the table schema and keep the names of the primary key columns
+        store them, or ['ctid'] if there are none, as attribute and return them
+
+        --------------------
+        Returns
+        --------------------
+        list
+
+        """
+        if self.key_cols is not None:
+            return self.key_cols
+        schema = self.get_schema()
+        key_cols = list(schema.loc[schema['primary_key'] == True, 'column_name']) if schema is not None and not schema.empty else []
+        self.key_cols = key_cols or ['ctid']
+        return self.key_cols
+
+    def get_page(self, n=5, after=None, descending=False):
+        """
+        --------------------
+        Description
+        --------------------
+        get_page (method): Class method that reads a page of n rows of the Postgres table with keyset pagination (from get_page_query()), so that only the rows of the page are read when the table has a primary key, and only the blocks holding them when it has none (get_block_page())
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        n(int): control the number of rows to be displayed
+        after(list): key of the last row of the previous page, the first page if None
+        descending(bool): whether the pages are read from the end of the table
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        get the key columns of the table (get_key_columns())
+        open connection and cursor to the database, read the page of rows following the key, from a range of blocks if the rows are ordered on their physical location, and close cursor and connection to the database
+        keep the key of the last row of the page to read the next one, or None if the page is the last one
+        drop the physical location of the rows from the page if it was used as key
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe, list
+
+        """
+        key_cols = self.get_key_columns()
+        self.db.open_connection()
+        self.db.open_cursor()
+        if key_cols == ['ctid']:
+            page = self.get_block_page(n, after, descending)
+        else:
+            page = self.db.load_query(get_page_query(self.schema_name, self.table_name, key_cols, n, after, descending))
+        self.db.close_cursor()
+        self.db.close_connection()
+        next_key = [str(value) for value in page.iloc[-1][key_cols]] if page.shape[0] == n else None
+        if key_cols == ['ctid']:
+            page = page.drop(columns='ctid')
+        return page, next_key
+
+    def get_block_page(self, n=5, after=None, descending=False):
+        """
+        --------------------
+        Description
+        --------------------
+        get_block_page (method): Class method that reads a page of n rows of a Postgres table without primary key in the order of their physical location (ctid) from the smallest range of blocks holding them, which Postgres 14+ reads with a TID range scan, instead of sorting every row of the table to keep the first ones. The rows are in the order they are stored, so rows moved by an update between two pages can be shown twice or skipped
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        n(int): control the number of rows to be displayed
+        after(list): physical location of the last row of the previous page, the first page if None
+        descending(bool): whether the pages are read from the end of the table
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        using the open cursor, get the number of blocks of the table (get_table_blocks_query()) and read the page from every block if there are none (partitioned tables)
+        start from the block of the last row of the previous page, or from the first (last if descending) block of the table
+        read the page from a range of one block starting (ending if descending) at that block, leaving the range open on the side of the end of the table so that rows appended since are read
+        double the range until it holds n rows or reaches the start (end if descending) of the table
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        result = self.db.run_query(get_table_blocks_query(self.schema_name, self.table_name))
+        n_blocks = int(result.iloc[0, 0]) if result is not None and not result.empty else 0
+        if n_blocks == 0:
+            return self.db.load_query(get_page_query(self.schema_name, self.table_name, ['ctid'], n, after, descending))
+        block = int(after[0].strip('()').split(',')[0]) if after is not None else None
+        n_span = 1
+        while True:
+            if descending:
+                end_block = block + 1 if block is not None else n_blocks
+                first_block = max(end_block - n_span, 0)
+                blocks = (first_block or None, end_block if block is not None else None)
+                at_edge = first_block == 0
+            else:
+                first_block = block or 0
+                end_block = first_block + n_span
+                blocks = (first_block or None, end_block if end_block < n_blocks else None)
+                at_edge = end_block >= n_blocks
+            page = self.db.load_query(get_page_query(self.schema_name, self.table_name, ['ctid'], n, after, descending, blocks))
+            if page.shape[0] == n or at_edge:
+                return page
+            n_span *= 2
+
+    def get_sample(self, n=5, seed=0):
+        """
+        --------------------
+        Description
+        --------------------
+        get_sample (method): Class method that computes a random sample of rows of self.df according to the provided number of rows specified as parameter (default: 5), or samples the Postgres table with TABLESAMPLE when its rows have not been loaded
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        n(int): control the number of rows to be displayed
+        seed(int): seed of the sample so that the same rows are shown on every rerun (default: 0)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the class's dataframe is loaded, show random n rows of it drawn with the seed
+        otherwise open connection and cursor to the database, sample n rows of the table sized on its number of rows and close cursor and connection to the database
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        if not self.is_df_none():
+            return self.df.sample(n, random_state=seed)
+        self.db.open_connection()
+        self.db.open_cursor()
+        sample = self.db.sample_table(self.schema_name, self.table_name, n, self.n_rows, seed=seed)
+        self.db.close_cursor()
+        self.db.close_connection()
+        return sample
+
+    def get_summary_df(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_summary_df (method): Class method that formats all requested information from self.df to be displayed in the Overall section of Streamlit app as a Pandas dataframe with 2 columns: Description and Value
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        setup an empty pandas DataFrame
+        set specified columns and values from computed attributes of the class's dataframe, flagging the number of rows when it is an estimate
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        summary = pd.DataFrame()
+        summary['Description'] = ['Name of Table', 'Estimated Number of Rows' if self.estimate_rows else 'Number of Rows', 'Number of Columns', 'Number of Duplicated Rows', 'Number of Rows with Missing Values']
+        summary['Value'] = [self.table_name, self.n_rows, self.n_cols, self.n_duplicates, self.n_missing]
+        return summary
+
+    def get_schema(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_schema (method): Class method that formats table schema information for selected Postgres table
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the schema information has already been extracted, return it
+        open connection and cursor to the database
+        get table schema information for classls selected table from existing sql query
+        close connection and cursor to the database
+        save the schema information to corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        if self.schema is not None:
+            return self.schema
+        self.db.open_connection()
+        self.db.open_cursor()
+        self.schema = self.db.get_table_schema(self.schema_name, self.table_name)
+        self.db.close_cursor()
+        self.db.close_connection()
+        return self.schema
+
+    def get_column_stats(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_column_stats (method): Class method that reads the planner statistics of all the columns of the table from pg_stats in a single catalog query (from get_column_stats_query()) and converts them into estimated column profiles
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return the estimated column profiles already read if there are any
+        open connection and cursor to the database
+        extract the null fraction, number of distinct values, most common values and frequencies and histogram bounds of every column with the estimated number of rows of the table
+        close cursor and connection to the database
+        for every column, scale the fractions by the estimated number of rows:
+            number of missing values from the null fraction
+            number of unique values from n_distinct, which is a fraction of the rows when negative
+            occurrences of the most common values from their frequencies
+            rows per histogram bucket from the rows that are neither missing nor one of the most common values, shared equally by the buckets
+        keep the estimated column profiles in the class, empty if the table has never been analysed
+
+        --------------------
+        Returns
+        --------------------
+        dict
+
+        """
+        if self.column_stats is not None:
+            return self.column_stats
+        self.db.open_connection()
+        self.db.open_cursor()
+        result = self.db.run_query(get_column_stats_query(self.schema_name, self.table_name))
+        self.db.close_cursor()
+        self.db.close_connection()
+        self.column_stats = {}
+        for col_name, null_frac, n_distinct, values, freqs, bounds, reltuples in result.itertuples(index=False):
+            n_rows = max(float(reltuples), 0)
+            values = values or []
+            freqs = freqs or []
+            bounds = bounds or []
+            n_histogram = (1 - null_frac - sum(freqs)) * n_rows / (len(bounds) - 1) if len(bounds) > 1 else 0
+            self.column_stats[col_name] = {
+                'n_rows': round(n_rows),
+                'n_missing': round(null_frac * n_rows),
+                'n_unique': round(n_distinct if n_distinct >= 0 else -n_distinct * n_rows),
+                'values': values,
+                'occurrences': [round(freq * n_rows) for freq in freqs],
+                'percentages': [round(freq, 4) for freq in freqs],
+                'bounds': bounds,
+                'n_histogram': max(n_histogram, 0)
+            }
+        return self.column_stats
+
+
+class DatasetCache:
+    """
+    --------------------
+    Description
+    --------------------
+    -> DatasetCache (class): Class that keeps the Dataset objects already loaded from Postgres so that they are reused across tabs and reruns, evicting the least recently used ones above a memory cap (also used for the memoized column profiles, whose classes provide the same get_memory_usage() method)
+
+    --------------------
+    Attributes
+    --------------------
+    -> max_bytes (int): Maximum number of bytes of dataframes kept in the cache (optional)
+    -> entries (OrderedDict): Cached Dataset objects and their size in bytes, keyed by connection, schema, table and version token, from the least to the most recently used
+    -> n_bytes (int): Number of bytes of dataframes currently kept in the cache
+    """
+    def __init__(self, max_bytes=512 * 1024 ** 2):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.n_bytes = 0
+
+    def get_key(self, data):
+        """
+        --------------------
+        Description
+        --------------------
+        get_key (method): Class method that builds the cache key of a Dataset from its connection, schema, table and version token, or None if it has no version token (e.g. views and foreign tables), as changes to its content could not be detected
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        data(Dataset): Dataset whose version has been set (set_version())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return None if the Dataset has no version token
+        return a tuple made of the connection details (user, host, port and database), the schema name, the table name and the version token
+
+        --------------------
+        Returns
+        --------------------
+        tuple or None
+
+        """
+        if not data.version:
+            return None
+        connection = f"{data.db.user}@{data.db.host}:{data.db.port}/{data.db.database}"
+        return (connection, data.schema_name, data.table_name, data.version)
+
+    def get(self, key):
+        """
+        --------------------
+        Description
+        --------------------
+        get (method): Class method that returns the cached Dataset for a key and marks it as the most recently used
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        key(tuple): key returned by get_key()
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the key is None (get_key()) or not in the cache, return None
+        move the entry to the end of the ordered dictionary and return its Dataset
+
+        --------------------
+        Returns
+        --------------------
+        Dataset or None
+
+        """
+        if key is None or key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def put(self, key, data):
+        """
+        --------------------
+        Description
+        --------------------
+        put (method): Class method that stores a Dataset in the cache and evicts the least recently used ones until the memory cap is respected
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        key(tuple): key returned by get_key()
+        data(Dataset): Dataset to be cached
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        do not store anything if the key is None (get_key())
+        remove the previous entry for the key, if any
+        store the Dataset with its memory usage at the end of the ordered dictionary
+        while the cache holds more bytes than the cap and more than one entry, remove the first (least recently used) entry
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        if key is None:
+            return
+        self.remove(key)
+        size = data.get_memory_usage()
+        self.entries[key] = (data, size)
+        self.n_bytes += size
+        while self.n_bytes > self.max_bytes and len(self.entries) > 1:
+            self.remove(next(iter(self.entries)))
+
+    def remove(self, key):
+        """
+        --------------------
+        Description
+        --------------------
+        remove (method): Class method that removes the entry of a key from the cache
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        key(tuple): key returned by get_key()
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the key is in the cache, remove its entry and subtract its size from the number of cached bytes
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        if key in self.entries:
+            _, size = self.entries.pop(key)
+            self.n_bytes -= size
+
+    def invalidate(self, schema_name=None, table_name=None):
+        """
+        --------------------
+        Description
+        --------------------
+        invalidate (method): Class method that removes from the cache every version of a table, every table of a schema or, if no names are given, every entry
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        schema_name(str), table_name(str): name of the Postgres table to be invalidated (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        for every key of the cache:
+            remove its entry if its schema and table match the given names (names that are None match everything)
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        for key in list(self.entries):
+            _, schema, table, _ = key
+            if (schema_name is None or schema == schema_name) and (table_name is None or table == table_name):
+                self.remove(key)
+
+
+class SnapshotStore:
+    """
+    --------------------
+    Description
+    --------------------
+    -> SnapshotStore (class): Class that keeps on disk a Feather or Parquet snapshot of the rows of the tables loaded from Postgres, keyed by connection, schema, table and version token, so that a new session or a restarted container memory-maps the file instead of downloading the table again, evicting the least recently used snapshots above a size cap
+
+    --------------------
+    Attributes
+    --------------------
+    -> directory (str): Directory under which the snapshots are written, one sub-directory per connection, schema and table (optional)
+    -> max_bytes (int): Maximum number of bytes of snapshot files kept in the directory (optional)
+    -> file_format (str): 'feather' for uncompressed Arrow IPC files read through a memory map, or 'parquet' for smaller compressed files (optional)
+    """
+    def __init__(self, directory=SNAPSHOT_DIR, max_bytes=SNAPSHOT_MAX_BYTES, file_format='feather'):
+        if pa is None:
+            raise ImportError("pyarrow is required to read and write snapshots")
+        if file_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"file_format must be one of {list(SNAPSHOT_FORMATS)}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+
+    def get_path(self, data):
+        """
+        --------------------
+        Description
+        --------------------
+        get_path (method): Class method that builds the path of the snapshot of a Dataset from its connection, schema, table and version token
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        data(Dataset): Dataset whose version has been set (set_version())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return None if the table has no version token (e.g. views), as changes to its content could not be detected
+        percent-encode the connection details (user, host, port and database), the schema name, the table name and the version token so that every one of them is a single path component
+        return the path made of the directory, the encoded connection, schema and table and a file named after the version token with the extension of the file format
+
+        --------------------
+        Returns
+        --------------------
+        str or None
+
+        """
+        if not data.version:
+            return None
+        connection = f"{data.db.user}@{data.db.host}:{data.db.port}/{data.db.database}"
+        parts = [quote(str(part), safe='') for part in (connection, data.schema_name, data.table_name)]
+        return os.path.join(self.directory, *parts, f"{quote(data.version, safe='')}.{self.file_format}")
+
+    def contains(self, data):
+        """
+        --------------------
+        Description
+        --------------------
+        contains (method): Class method that checks whether there is a snapshot of the current version of the table of a Dataset
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        data(Dataset): Dataset whose version has been set (set_version())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return whether the path of the snapshot of the Dataset exists
+
+        --------------------
+        Returns
+        --------------------
+        bool
+
+        """
+        path = self.get_path(data)
+        return path is not None and os.path.exists(path)
+
+    def read(self, data):
+        """
+        --------------------
+        Description
+        --------------------
+        read (method): Class method that loads the snapshot of the current version of the table of a Dataset, memory-mapping the file, and marks it as the most recently used
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        data(Dataset): Dataset whose version has been set (set_version())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if there is no snapshot for the version of the table, return None
+        read the file as an Arrow table through a memory map and convert it to a pandas dataframe, restoring the dtypes saved with it and sharing the buffers of the fixed-width columns without nulls with the map
+        update the modification time of the file, which orders the snapshots for eviction
+        return the dataframe
+
+        --------------------
+        Returns
+        --------------------
+        pd.DataFrame or None
+
+        """
+        if not self.contains(data):
+            return None
+        path = self.get_path(data)
+        if self.file_format == 'feather':
+            table = feather.read_table(path, memory_map=True)
+        else:
+            table = pq.read_table(path, memory_map=True)
+        os.utime(path)
+        return table.to_pandas(split_blocks=True)
+
+    def write(self, data):
+        """
+        --------------------
+        Description
+        --------------------
+        write (method): Class method that writes the rows of a Dataset as the snapshot of the current version of its table, removes the snapshots of the previous versions and evicts the least recently used snapshots until the size cap is respected
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        data(Dataset): Dataset whose rows have been loaded and whose version has been set (set_version())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the table has no version token or no rows were loaded, return None
+        convert the dataframe to an Arrow table, and return None if one of its columns holds values that Arrow cannot type
+        write it to a temporary file next to the snapshot, uncompressed for Feather and with zstd for Parquet, and rename the file to the snapshot path so that readers never see a partial file
+        remove the snapshots of the other versions of the table
+        evict the least recently used snapshots above the size cap (evict())
+        return the path of the snapshot
+
+        --------------------
+        Returns
+        --------------------
+        str or None
+
+        """
+        path = self.get_path(data)
+        if path is None or data.df is None:
+            return None
+        try:
+            table = pa.Table.from_pandas(data.df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if self.file_format == 'feather':
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+        else:
+            pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+        for name in os.listdir(os.path.dirname(path)):
+            other_path = os.path.join(os.path.dirname(path), name)
+            if other_path != path and name.endswith(SNAPSHOT_FORMATS):
+                os.remove(other_path)
+        self.evict(keep=path)
+        return path
+
+    def list_snapshots(self):
+        """
+        --------------------
+        Description
+        --------------------
+        list_snapshots (method): Class method that lists the snapshots of the directory with their connection, schema, table, version token, format, size and time of last use
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        walk the directory and keep the files with the extension of a snapshot format that are three levels below it
+        decode the connection, schema, table and version token from the components of their path
+        return them as a dataframe sorted from the least to the most recently used
+
+        --------------------
+        Returns
+        --------------------
+        pd.DataFrame
+
+        """
+        rows = []
+        for root, _, names in os.walk(self.directory):
+            parts = os.path.relpath(root, self.directory).split(os.sep)
+            if len(parts) != 3:
+                continue
+            for name in names:
+                version, _, file_format = name.rpartition('.')
+                if file_format not in SNAPSHOT_FORMATS:
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                rows.append([unquote(part) for part in parts] + [unquote(version), file_format, stat.st_size, pd.Timestamp(stat.st_mtime, unit='s'), path])
+        columns = ['connection', 'schema_name', 'table_name', 'version', 'format', 'n_bytes', 'last_used', 'path']
+        return pd.DataFrame(rows, columns=columns).sort_values('last_used', ignore_index=True)
+
+    def purge(self, schema_name=None, table_name=None):
+        """
+        --------------------
+        Description
+        --------------------
+        purge (method): Class method that removes the snapshots of a table, of every table of a schema or, if no names are given, every snapshot
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        schema_name(str), table_name(str): name of the Postgres table whose snapshots are removed (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        for every snapshot of the directory (list_snapshots()):
+            remove its file if its schema and table match the given names (names that are None match everything)
+        return the number of removed snapshots
+
+        --------------------
+        Returns
+        --------------------
+        int
+
+        """
+        snapshots = self.list_snapshots()
+        if schema_name is not None:
+            snapshots = snapshots[snapshots['schema_name'] == schema_name]
+        if table_name is not None:
+            snapshots = snapshots[snapshots['table_name'] == table_name]
+        for path in snapshots['path']:
+            os.remove(path)
+        return len(snapshots)
+
+    def evict(self, keep=None):
+        """
+        --------------------
+        Description
+        --------------------
+        evict (method): Class method that removes the least recently used snapshots until the files of the directory fit in the size cap
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        keep(str): path of a snapshot that is never evicted, such as the one just written (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        list the snapshots from the least to the most recently used (list_snapshots())
+        while they hold more bytes than the cap, remove the least recently used one that is not kept
+        return the number of removed snapshots
+
+        --------------------
+        Returns
+        --------------------
+        int
+
+        """
+        snapshots = self.list_snapshots()
+        n_bytes = int(snapshots['n_bytes'].sum())
+        n_removed = 0
+        for path, size in zip(snapshots['path'], snapshots['n_bytes']):
+            if n_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            n_bytes -= size
+            n_removed += 1
+        return n_removed
+
+
+class ProfileExecutor:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ProfileExecutor (class): Class that profiles the numeric, text and date columns of a Dataset by running the set_data() method of every column on a thread pool, each worker thread using its own PostgresConnector on a shared connection pool, and returns the profiled columns as they finish
+
+    --------------------
+    Attributes
+    --------------------
+    -> data (Dataset): Dataset whose columns are profiled (mandatory)
+    -> max_in_flight (int): Maximum number of columns of the table profiled (and of connections opened) at the same time (optional)
+    -> sample_percent (float): Percentage of the table sampled with TABLESAMPLE SYSTEM for profiling the columns, the whole table if None (optional)
+    -> distinct_precision (int): Precision of the HyperLogLog sketches counting the unique values of the columns, exact counts if None (optional)
+    -> frequent_capacity (int): Number of counters of the Space-Saving summaries finding the most frequent values of the columns, exact counts if None (optional)
+    -> pool (ConnectionPool): Connection pool shared by the worker threads, bounded by max_in_flight
+    -> workers (threading.local): Thread-local storage keeping the PostgresConnector of every worker thread
+    """
+    column_classes = {'numeric': NumericColumn, 'text': TextColumn, 'date': DateColumn}
+
+    def __init__(self, data, max_in_flight=4, sample_percent=None, distinct_precision=None, frequent_capacity=None):
+        self.data = data
+        self.max_in_flight = max_in_flight
+        self.sample_percent = sample_percent
+        self.distinct_precision = distinct_precision
+        self.frequent_capacity = frequent_capacity
+        db = data.db
+        self.pool = PostgresConnector(db.database, db.user, db.password, db.host, db.port, use_pool=True, pool_max_size=max_in_flight).get_pool()
+        self.workers = threading.local()
+
+    def get_worker_db(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_worker_db (method): Class method that returns the PostgresConnector of the current worker thread, creating it on the shared connection pool on the first call
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the current thread has no connector yet, create one with the connection details of the Dataset and attach it to the shared pool
+        return the connector of the current thread
+
+        --------------------
+        Returns
+        --------------------
+        PostgresConnector
+
+        """
+        if getattr(self.workers, 'db', None) is None:
+            db = self.data.db
+            self.workers.db = PostgresConnector(db.database, db.user, db.password, db.host, db.port, use_pool=True)
+            self.workers.db.pool = self.pool
+        return self.workers.db
+
+    def get_columns(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_columns (method): Class method that lists the columns of the Dataset to be profiled with their kind
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return a (kind, column name) tuple for every numeric, text and date column of the Dataset
+
+        --------------------
+        Returns
+        --------------------
+        list
+
+        """
+        kinds = {'numeric': self.data.num_cols, 'text': self.data.text_cols, 'date': self.data.date_cols}
+        return [(kind, col_name) for kind, col_names in kinds.items() for col_name in (col_names or [])]
+
+    def profile_column(self, kind, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        profile_column (method): Class method run by the worker threads that instantiates the column class of a column on the connector of the thread and computes its information
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        kind(str): kind of the column ('numeric', 'text' or 'date')
+        col_name(str): name of the column
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        instantiate the NumericColumn, TextColumn or DateColumn class of the column with the connector of the current thread (get_worker_db()), the sampling percentage, the precision of the unique counts and the capacity of the frequent values of the executor
+        compute its information (set_data())
+        return the kind, the name and the profiled column
+
+        --------------------
+        Returns
+        --------------------
+        tuple
+
+        """
+        column = self.column_classes[kind](self.data.schema_name, self.data.table_name, col_name, self.get_worker_db(), sample_percent=self.sample_percent, engine=COLUMN_ENGINE, distinct_precision=self.distinct_precision, frequent_capacity=self.frequent_capacity)
+        column.set_data()
+        return kind, col_name, column
+
+    def run(self, columns=None):
+        """
+        --------------------
+        Description
+        --------------------
+        run (method): Class method that profiles columns on a thread pool of max_in_flight workers and yields every profiled column as soon as it is finished
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        columns(list): (kind, column name) tuples of the columns to be profiled, every column of the Dataset if None (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        submit the profiling of every column (profile_column()) to a thread pool of max_in_flight workers
+        yield the kind, name and profiled column of every column in the order in which they finish
+        cancel the columns not started yet if the iteration is stopped early (futures cancelled one by one, shutdown() having no cancel_futures argument before Python 3.9), and close the connections of the shared pool
+
+        --------------------
+        Returns
+        --------------------
+        generator of tuples
+
+        """
+        if columns is None:
+            columns = self.get_columns()
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        futures = []
+        try:
+            futures = [executor.submit(self.profile_column, kind, col_name) for kind, col_name in columns]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.pool.close_all()
+
+
+def profile_series(serie, kind, top_k=20, n_bins=50):
+    """
+    --------------------
+    Description
+    --------------------
+    profile_series (function): Function that computes the profile of a column loaded in pandas with the same information as the SQL queries of the NumericColumn, TextColumn and DateColumn classes, which is stored in them by their set_local_values() method: its number of missing and unique values, its most frequent values and, depending on its kind, its summary statistics and histogram (numeric), its mode and character classes (text) or its earliest and latest dates and date counters (date), counting the values only once
+
+    --------------------
+    Parameters
+    --------------------
+    serie(pd.Series): values of the column
+    kind(str): kind of the column ('numeric', 'text' or 'date')
+    top_k(int): number of most frequent values kept (default: 20)
+    n_bins(int): number of bins of the histogram of the numeric columns (default: 50)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    convert the values to numbers or dates for the numeric and date columns
+    count every distinct value once, leaving out the categories of the categorical columns (compact_dtypes()) that do not occur, and derive the number of unique values and the top_k most frequent values with their occurrences and percentages
+    add the average, standard deviation, minimum, maximum, median, number of zero and negative values and the bins of the finite values of the numeric columns
+    add the mode of the text columns (the smallest of the most frequent values, as mode() in Postgres) and their number of whitespace, lowercase, uppercase, alphabetical and digit values, checked once per distinct value and weighted by its occurrences
+    add the earliest and latest dates of the date columns and their number of weekend, weekday, future, '1900-01-01' and '1970-01-01' dates
+
+    --------------------
+    Returns
+    --------------------
+    dict
+
+    """
+    if kind == 'numeric':
+        serie = pd.to_numeric(serie, errors='coerce')
+    elif kind == 'date':
+        serie = pd.to_datetime(serie, errors='coerce')
+    counts = serie.value_counts()
+    if isinstance(counts.index, pd.CategoricalIndex):
+        counts = counts[counts > 0]
+        counts.index = counts.index.astype(object)
+    frequent = pd.DataFrame({'value': counts.index[:top_k], 'occurrence': counts.values[:top_k]})
+    frequent['percentage'] = round(frequent['occurrence'] / max(counts.sum(), 1), 4)
+    profile = {'n_rows': serie.shape[0], 'n_missing': int(serie.isna().sum()), 'n_unique': counts.shape[0], 'frequent': frequent}
+    if kind == 'numeric':
+        values = serie.to_numpy(dtype='float64', na_value=np.nan)
+        finite = values[np.isfinite(values)]
+        bins = pd.DataFrame(columns=['bin_start', 'bin_end', 'Count of Records'])
+        if finite.size:
+            n_records, edges = np.histogram(finite, bins=n_bins)
+            bins = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'Count of Records': n_records})
+        profile.update({'col_mean': serie.mean(), 'col_std': serie.std(), 'col_min': serie.min(), 'col_max': serie.max(), 'col_median': serie.median(),
+                        'n_zeros': int((serie == 0).sum()), 'n_negatives': int((serie < 0).sum()), 'bins': bins})
+    elif kind == 'text':
+        values, occurrences = counts.index.to_series().astype(str), counts.to_numpy()
+        empty = (values.str.len() == 0).to_numpy()
+        def count_values(matches):
+            return int(occurrences[empty | matches.to_numpy(dtype=bool)].sum())
+        profile.update({'n_mode': counts.index[occurrences == occurrences[0]].min() if not counts.empty else None,
+                        'n_whitespace': count_values(values.str.isspace()), 'n_lowercase': count_values(values.str.isalpha() & values.str.islower()),
+                        'n_uppercase': count_values(values.str.isalpha() & values.str.isupper()), 'n_alphabet': count_values(values.str.isalpha()), 'n_digit': count_values(values.str.isdigit())})
+    elif kind == 'date':
+        tz = serie.dt.tz
+        profile.update({'col_min': serie.min(), 'col_max': serie.max(), 'n_weekend': int((serie.dt.weekday >= 5).sum()), 'n_weekday': int((serie.dt.weekday < 5).sum()),
+                        'n_future': int((serie > pd.Timestamp.now(tz=tz).normalize()).sum()), 'n_empty_1900': int((serie == pd.Timestamp('1900-01-01', tz=tz)).sum()),
+                        'n_empty_1970': int((serie == pd.Timestamp('1970-01-01', tz=tz)).sum())})
+    return profile
+
+
+def share_series(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    share_series (function): Function that copies the values of a column of fixed-width type (numbers, booleans and dates) into a shared memory block so that a worker process can read them without the Series being pickled
+
+    --------------------
+    Parameters
+    --------------------
+    serie(pd.Series): values of the column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    get the values of the column as a NumPy array, the nanoseconds since the epoch (int64) with the time zone for dates with a time zone, and return None if they are Python objects (text), whose conversion to a shareable buffer would cost more than profiling them
+    create a shared memory block of the size of the array and copy the array into it
+    return the description of the block (name, dtype, length and time zone) and the block itself
+
+    --------------------
+    Returns
+    --------------------
+    tuple (tuple, SharedMemory) or None
+
+    """
+    tz = None
+    if isinstance(serie.dtype, pd.DatetimeTZDtype):
+        values, tz = serie.array.asi8, str(serie.dtype.tz)
+    else:
+        values = serie.to_numpy()
+    if values.dtype.kind not in 'biufmM':
+        return None
+    block = SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+    return (block.name, values.dtype.str, values.shape[0], tz), block
+
+
+def profile_shared_series(spec, kind, top_k=20):
+    """
+    --------------------
+    Description
+    --------------------
+    profile_shared_series (function): Function run by the worker processes that attaches the shared memory block of a column (share_series()) and computes its profile (profile_series())
+
+    --------------------
+    Parameters
+    --------------------
+    spec(tuple): name, dtype, length and time zone (None for columns without one) of the shared memory block of the column
+    kind(str): kind of the column ('numeric', 'text' or 'date')
+    top_k(int): number of most frequent values kept (default: 20)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    attach the shared memory block and read it as a NumPy array without copying it
+    if the column has a time zone, read the nanoseconds since the epoch as dates in UTC converted to that time zone
+    compute the profile of the Series of the array, then detach the block
+
+    --------------------
+    Returns
+    --------------------
+    dict
+
+    """
+    name, dtype, length, tz = spec
+    block = SharedMemory(name=name)
+    try:
+        serie = pd.Series(np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf), copy=False)
+        if tz is not None:
+            serie = serie.view('datetime64[ns]').dt.tz_localize('UTC').dt.tz_convert(tz)
+        profile = profile_series(serie, kind, top_k)
+        del serie
+        return profile
+    finally:
+        block.close()
+
+
+class ProcessProfiler:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ProcessProfiler (class): Class that computes the profiles of the columns of a Dataset loaded in pandas (self.df) in parallel on a pool of worker processes, sharing the values of the fixed-width columns with the workers through shared memory instead of pickling them, while the text columns are profiled in the current process. It returns the profiles as dictionaries (profile_series()), which get_column() stores in the NumericColumn, TextColumn and DateColumn classes displayed by the Streamlit app when the rows of the table are loaded (display_profile_all())
+
+    --------------------
+    Attributes
+    --------------------
+    -> data (Dataset): Dataset whose dataframe columns are profiled (mandatory)
+    -> max_workers (int): Number of worker processes, the number of CPUs if None (optional)
+    -> top_k (int): Number of most frequent values kept for every column (optional)
+    """
+    column_classes = {'numeric': NumericColumn, 'text': TextColumn, 'date': DateColumn}
+
+    def __init__(self, data, max_workers=None, top_k=20):
+        self.data = data
+        self.max_workers = max_workers
+        self.top_k = top_k
+
+    def get_columns(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_columns (method): Class method that lists the columns of the dataframe to be profiled with their kind
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return a (kind, column name) tuple for every numeric, text and date column of the Dataset that is loaded in its dataframe
+
+        --------------------
+        Returns
+        --------------------
+        list
+
+        """
+        kinds = {'numeric': self.data.num_cols, 'text': self.data.text_cols, 'date': self.data.date_cols}
+        return [(kind, col_name) for kind, col_names in kinds.items() for col_name in (col_names or []) if col_name in self.data.df.columns]
+
+    def run(self, columns=None):
+        """
+        --------------------
+        Description
+        --------------------
+        run (method): Class method that profiles columns of the dataframe on a pool of worker processes and yields the profile of every column as soon as it is finished
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        columns(list): (kind, column name) tuples of the columns to be profiled, every column of the Dataset if None (optional)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        copy the values of every fixed-width column into shared memory (share_series()) and submit its profiling (profile_shared_series()) to the process pool
+        profile the text columns in the current process while the workers run and yield their kind, name and profile
+        yield the kind, name and profile of every other column in the order in which they finish, releasing its shared memory
+        cancel the columns not started yet and release the shared memory of the columns left if the iteration is stopped early
+
+        --------------------
+        Returns
+        --------------------
+        generator of tuples
+
+        """
+        if columns is None:
+            columns = self.get_columns()
+        shared, futures = {}, {}
+        executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            local_columns = []
+            for kind, col_name in columns:
+                shared_serie = share_series(self.data.df[col_name])
+                if shared_serie is None:
+                    local_columns.append((kind, col_name))
+                    continue
+                spec, shared[col_name] = shared_serie
+                futures[executor.submit(profile_shared_series, spec, kind, self.top_k)] = (kind, col_name)
+            for kind, col_name in local_columns:
+                yield kind, col_name, profile_series(self.data.df[col_name], kind, self.top_k)
+            for future in as_completed(futures):
+                kind, col_name = futures[future]
+                profile = future.result()
+                block = shared.pop(col_name)
+                block.close()
+                block.unlink()
+                yield kind, col_name, profile
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for block in shared.values():
+                block.close()
+                block.unlink()
+
+    def get_column(self, kind, col_name, profile):
+        """
+        --------------------
+        Description
+        --------------------
+        get_column (method): Class method that stores the profile of a column computed by run() in the column class of its kind, so that it is displayed and refreshed like a column profiled with SQL queries
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        kind(str): kind of the column ('numeric', 'text' or 'date')
+        col_name(str): name of the column
+        profile(dict): profile of the column (profile_series())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        instantiate the column class of the kind of the column on the table and connector of the Dataset
+        store the profile in its class attributes (set_local_values())
+
+        --------------------
+        Returns
+        --------------------
+        NumericColumn, TextColumn or DateColumn
+
+        """
+        column = self.column_classes[kind](self.data.schema_name, self.data.table_name, col_name, self.data.db)
+        column.set_local_values(profile)
+        return column
@@ -1,3 +1,5 @@
+from src.database.queries import get_scan_query
+
 def get_numeric_tables_query(schema_name, table_name):
     """
     --------------------
@@ -59,3 +61,208 @@ def get_date_tables_query(schema_name, table_name):
     """
     query = f"select column_name from information_schema.columns where table_schema = '{schema_name}' and table_name = '{table_name}' and data_type in ('timestamp without time zone', 'timestamp with time zone', 'time with time zone', 'time without time zone', 'interval', 'date')"
     return query
+
+def get_table_version_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_table_version_query (method): Function that returns the query used for extracting the number of inserted, updated and deleted rows of a Postgres table from the statistics collector, which changes whenever the content of the table changes, along with the file node of the table, which changes when it is truncated or rewritten, and the time the statistics of the database were last reset (in microseconds since the epoch, 0 if never), after which the counters start again from zero and can repeat an old value (a reset of the counters of a single table, or their loss after a crash, also moves it). The counters and file nodes of a partitioned table, which has no rows of its own, are summed over its partitions (pg_inherits), whose number is returned as well so that attaching or detaching one changes the token, and no row is returned for the relations without statistics (views, foreign tables)
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"with recursive tree as (select c.oid as relid, c.relkind from pg_class c join pg_namespace n on n.oid = c.relnamespace where n.nspname = '{schema_name}' and c.relname = '{table_name}' union all select i.inhrelid, p.relkind from tree join pg_inherits i on i.inhparent = tree.relid join pg_class p on p.oid = i.inhrelid where tree.relkind = 'p') select sum(s.n_tup_ins), sum(s.n_tup_upd), sum(s.n_tup_del), sum(pg_relation_filenode(s.relid)::bigint), count(*), coalesce((extract(epoch from max(d.stats_reset)) * 1000000)::bigint, 0) from tree join pg_stat_user_tables s on s.relid = tree.relid join pg_stat_database d on d.datname = current_database() where tree.relkind <> 'p' having count(*) > 0"
+    return query
+
+def get_columns_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_columns_query (method): Function that returns the query used for extracting the list of all the columns of a Postgres table from the catalog, in table order
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select column_name from information_schema.columns where table_schema = '{schema_name}' and table_name = '{table_name}' order by ordinal_position"
+    return query
+
+def get_row_missing_query(schema_name, table_name, col_names):
+    """
+    --------------------
+    Description
+    --------------------
+    get_row_missing_query (method): Function that returns the query used for computing in a single scan the number of rows and the number of missing values over all the columns of a Postgres table
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+    col_names(list): names of the columns of the table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    missing = ' + '.join(f"count(*) filter (where {col_name} is null)" for col_name in col_names) if col_names else '0'
+    query = f"select count(*), {missing} from {schema_name}.{table_name}"
+    return query
+
+def get_duplicates_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_duplicates_query (method): Function that returns the query used for computing the number of duplicated rows of a Postgres table by grouping the rows on a hash of their content
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select coalesce(sum(n - 1), 0) from (select count(*) as n from {schema_name}.{table_name} as t group by md5(t::text)) as row_groups"
+    return query
+
+def get_row_estimate_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_row_estimate_query (method): Function that returns the query used for extracting the estimated number of rows of a Postgres table from the catalog (pg_class.reltuples and pg_stat_user_tables.n_live_tup) without scanning it, with the number of rows modified since the last analyze and the time of that analyze
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select c.reltuples::bigint, s.n_live_tup, s.n_mod_since_analyze, greatest(s.last_analyze, s.last_autoanalyze) from pg_class c join pg_namespace n on n.oid = c.relnamespace left join pg_stat_user_tables s on s.relid = c.oid where n.nspname = '{schema_name}' and c.relname = '{table_name}'"
+    return query
+
+def get_table_blocks_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_table_blocks_query (method): Function that returns the query used for extracting the number of blocks of the heap of a Postgres table from the size of its main file, without reading it (0 for a partitioned table, which has no rows of its own)
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select pg_relation_size(c.oid) / current_setting('block_size')::bigint from pg_class c join pg_namespace n on n.oid = c.relnamespace where n.nspname = '{schema_name}' and c.relname = '{table_name}'"
+    return query
+
+def get_column_stats_query(schema_name, table_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_column_stats_query (method): Function that returns the query used for extracting the planner statistics (pg_stats) of every analysed column of a Postgres table with the estimated number of rows of the table, without scanning it. A table with child tables has a row of statistics per column for its own rows and another one including its children, of which only the first is kept, or the second for a partitioned table that has no rows of its own
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select s.attname, s.null_frac, s.n_distinct, s.most_common_vals::text::text[], s.most_common_freqs, s.histogram_bounds::text::text[], c.reltuples from pg_stats s join pg_namespace n on n.nspname = s.schemaname join pg_class c on c.relnamespace = n.oid and c.relname = s.tablename where s.schemaname = '{schema_name}' and s.tablename = '{table_name}' and s.inherited = (c.relkind = 'p')"
+    return query
+
+def get_page_query(schema_name, table_name, key_cols, n_rows, after=None, descending=False, blocks=None):
+    """
+    --------------------
+    Description
+    --------------------
+    get_page_query (method): Function that returns the query used for extracting a page of n_rows rows of a Postgres table ordered on its key columns, starting after the key of the last row of the previous page (keyset pagination) so that no skipped row is read, and only from a range of blocks of the table when its rows are ordered on their physical location, which Postgres 14+ reads with a TID range scan instead of sorting the whole table
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+    key_cols(list): names of the columns ordering the rows, the primary key or ['ctid'] for the physical location of the rows
+    n_rows(int): number of rows of the page
+    after(list): values of the key columns of the last row of the previous page, the first page if None
+    descending(bool): whether the rows are read from the end of the table
+    blocks(tuple): first block and block after the last one of the range of blocks read when key_cols is ['ctid'], either bound being None when the range is open on that side, every block if None
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    keys = ', '.join(key_cols)
+    columns = 'ctid, *' if key_cols == ['ctid'] else '*'
+    conditions = []
+    if after is not None:
+        values = ', '.join("'" + str(value).replace("'", "''") + "'" for value in after)
+        conditions.append(f"({keys}) {'<' if descending else '>'} ({values})")
+    if blocks is not None:
+        first_block, end_block = blocks
+        if first_block is not None:
+            conditions.append(f"ctid >= '({first_block},0)'")
+        if end_block is not None:
+            conditions.append(f"ctid < '({end_block},0)'")
+    where = f" where {' and '.join(conditions)}" if conditions else ''
+    order = ', '.join(f"{key_col} desc" for key_col in key_cols) if descending else keys
+    query = f"select {columns} from {schema_name}.{table_name}{where} order by {order} limit {n_rows}"
+    return query
+
+def get_row_counts_query(schema_name, table_name, col_names, condition=None, watermark_column=None):
+    """
+    --------------------
+    Description
+    --------------------
+    get_row_counts_query (method): Function that returns the query used for computing in a single scan the number of rows and the number of missing values over all the columns of a Postgres table, on the whole table or only on the rows matching a condition, after the position of the scan needed to select the rows appended after it (get_scan_query())
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str): name of selected Postgres table
+    col_names(list): names of the columns of the table
+    condition(str): WHERE condition selecting the rows to be counted, every row if None (optional)
+    watermark_column(str): name of a column whose value increases in the order the rows are committed, whose maximum is returned as text (optional)
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    missing = ' + '.join(f"count(*) filter (where {col_name} is null)" for col_name in col_names) if col_names else '0'
+    query = get_scan_query(schema_name, table_name, [missing], condition, watermark_column)
+    return query
@@ -0,0 +1,62 @@
+import argparse
+
+import pandas as pd
+
+from src.dataframe.logics import SnapshotStore, SNAPSHOT_DIR, SNAPSHOT_MAX_BYTES
+
+
+def list_snapshots(store):
+    """
+    --------------------
+    Description
+    --------------------
+    -> list_snapshots (function): Function that prints the snapshots of a SnapshotStore from the least to the most recently used, with their total size
+
+    --------------------
+    Parameters
+    --------------------
+    -> store (SnapshotStore): Store whose directory is listed
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> List the snapshots of the store (SnapshotStore.list_snapshots())
+    -> Print their connection, schema, table, version token, format, size in MiB and time of last use, followed by their number and total size
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    snapshots = store.list_snapshots()
+    if not snapshots.empty:
+        snapshots['MiB'] = (snapshots['n_bytes'] / 1024 ** 2).round(1)
+        with pd.option_context('display.width', None, 'display.max_colwidth', None):
+            print(snapshots[['connection', 'schema_name', 'table_name', 'version', 'format', 'MiB', 'last_used']].to_string(index=False))
+    print(f"{len(snapshots)} snapshots, {snapshots['n_bytes'].sum() / 1024 ** 2:,.1f} MiB in {store.directory} (cap {store.max_bytes / 1024 ** 2:,.0f} MiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List and purge the on-disk snapshots of the tables loaded by the application")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR, help="Directory of the snapshots (default: SNAPSHOT_DIR environment variable or .snapshots)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List the snapshots from the least to the most recently used")
+    purge_parser = subparsers.add_parser("purge", help="Remove the snapshots of a table, of a schema or all of them")
+    purge_parser.add_argument("--schema", help="Only remove the snapshots of the tables of this schema")
+    purge_parser.add_argument("--table", help="Only remove the snapshots of the tables with this name")
+    purge_parser.add_argument("--max-bytes", type=int, help="Instead of removing snapshots by name, evict the least recently used ones until the directory fits in this number of bytes")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.dir, max_bytes=SNAPSHOT_MAX_BYTES)
+    if args.command == "list":
+        list_snapshots(store)
+    elif args.max_bytes is not None:
+        store.max_bytes = args.max_bytes
+        print(f"evicted {store.evict()} snapshots")
+    else:
+        print(f"removed {store.purge(args.schema, args.table)} snapshots")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import streamlit as st
 
-from src.dataframe.logics import Dataset
+from src.config import get_column_profile, set_column_profile, display_refresh_profile
+from src.database.logics import profile_columns, COLUMN_ENGINE
 from src.serie_date.logics import DateColumn
 
 
@@ -20,8 +21,9 @@ def display_dates():
     Pseudo-Code
     --------------------
     get required information from session state
-    get table data from instantiated Dataset class
-    extract date columns from table data, display column name and call display_date() frunction
+    get table data from the Dataset class already loaded in session state
+    display a button that profiles every date column not profiled yet concurrently (profile_columns()), memoizes them and displays the error of every column that could not be profiled
+    extract date columns from table data, display column name and call display_date() frunction (only computed on demand)
 
     --------------------
     Returns
@@ -31,14 +33,54 @@ def display_dates():
     """
     schema_name = st.session_state['schema_selected']
     table_name = st.session_state['table_selected']
-    Data_all = Dataset(schema_name, table_name, db=st.session_state['db'])
-    Data_all.set_data()
+    Data_all = st.session_state['data']
     if (Data_all.date_cols != None):
+        if st.button('Profile all date columns', key='date_profile_all'):
+            db = st.session_state['db']
+            columns = [DateColumn(schema_name, table_name, column, db=db, sample_percent=st.session_state.get('sample_percent'), distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity')) for column in Data_all.date_cols if get_column_profile('date', column) is None]
+            errors = []
+            for Data in profile_columns(columns, db, errors=errors):
+                set_column_profile('date', Data.col_name, Data)
+            for Data, error in errors:
+                st.error(f"Column {Data.col_name} could not be profiled: {error}")
         for idx, column in enumerate(Data_all.date_cols):
             with st.expander(f"{idx+1}. column: {column}"):
                 display_date(column, idx)
 
 
+def get_date_profile(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_date_profile (function): Function that returns the memoized DateColumn of a column, instantiating it and computing its information on the first call
+
+    --------------------
+    Parameters
+    --------------------
+    col_name(str): name of selected column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    get the memoized DateColumn class of the column from session state
+    if there is none, instantiate DateColumn class on the sampling percentage selected in session state (loading its values as Arrow arrays when pyarrow is installed), compute required information and memoize it
+
+    --------------------
+    Returns
+    --------------------
+    DateColumn
+    """
+    Data = get_column_profile('date', col_name)
+    if Data is None:
+        schema_name = st.session_state['schema_selected']
+        table_name = st.session_state['table_selected']
+        Data = DateColumn(schema_name, table_name, col_name, db=st.session_state['db'], sample_percent=st.session_state.get('sample_percent'), engine=COLUMN_ENGINE, distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity'))
+        Data.set_data()
+        set_column_profile('date', col_name, Data)
+    return Data
+
+
 def display_date(col_name, i):
     """
     --------------------
@@ -55,21 +97,62 @@ def display_date(col_name, i):
     --------------------
     Pseudo-Code
     --------------------
-    get required information from session state
-    instantiats DateColumn class with acquired inforamtion and compute required inforamtion
-    display barchart and frequent values from the instantiated class with streamlit
+    if the column has not been profiled yet, display a button that profiles it and, until it is clicked, only display the estimates from the planner statistics (display_date_estimate())
+    get the memoized DateColumn class of the column (get_date_profile())
+    display a button that refreshes the profile with the rows appended since its previous refresh (display_refresh_profile())
+    display barchart and frequent values from the instantiated class with streamlit, noting when they were computed on a sample
 
     --------------------
     Returns
     --------------------
     none
     """
-    schema_name = st.session_state['schema_selected']
-    table_name = st.session_state['table_selected']
-    Data = DateColumn(schema_name, table_name, col_name, db=st.session_state['db'])
-    Data.set_data()
+    if get_column_profile('date', col_name) is None and not st.button('Profile column', key=f'date_profile_{i}'):
+        display_date_estimate(col_name)
+        return
+    Data = get_date_profile(col_name)
+    display_refresh_profile(Data, key=f'date_refresh_{i}')
+    if Data.sample_percent:
+        st.caption(f"Profiled on a {Data.sample_percent}% sample of the table (TABLESAMPLE SYSTEM).")
     st.table(data=Data.get_summary_df())
     st.subheader('Bar Chart')
     st.altair_chart(Data.barchart, use_container_width=True)
     st.subheader('Most Frequent Values')
     st.dataframe(data=Data.frequent)
+
+
+def display_date_estimate(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    display_date_estimate (function): Function that displays the information of a single datetime column estimated from the planner statistics of the table, without scanning the column
+
+    --------------------
+    Parameters
+    --------------------
+    col_name(str): name of selected column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    get the estimated profile of the column from the Dataset in session state (get_column_stats()) and stop if the column has not been analysed
+    instantiate DateColumn class and set its values from the estimated profile
+    display a note that the values are estimates, the estimated information, barchart and most common values with streamlit
+
+    --------------------
+    Returns
+    --------------------
+    none
+    """
+    stats = st.session_state['data'].get_column_stats().get(col_name)
+    if stats is None:
+        return
+    Data = DateColumn(st.session_state['schema_selected'], st.session_state['table_selected'], col_name, db=st.session_state['db'])
+    Data.set_catalog_stats(stats)
+    st.caption('Estimated from the planner statistics (pg_stats) without scanning the column. Profile the column for exact values.')
+    st.table(data=Data.get_estimate_df())
+    st.subheader('Bar Chart')
+    st.altair_chart(Data.barchart, use_container_width=True)
+    st.subheader('Most Frequent Values')
+    st.dataframe(data=Data.frequent)
@@ -1,9 +1,14 @@
+import asyncio
+from datetime import date
 import streamlit as st
 import pandas as pd
 import altair as alt
 
-from src.database.logics import PostgresConnector
-from src.serie_date.queries import get_column_query, get_min_date_query, get_max_date_query, get_weekend_count_query, get_weekday_count_query, get_future_count_query, get_1900_count_query, get_1970_count_query
+from src.database.logics import PostgresConnector, IncrementalState, HyperLogLog, merge_totals, scan_column, read_registers, sketch_serie, format_distinct_count, read_top_values
+from src.serie_date.queries import get_min_date_query, get_max_date_query, get_weekend_count_query, get_weekday_count_query, get_future_count_query, get_1900_count_query, get_1970_count_query, get_summary_query, get_refresh_aggregates, get_future_days_query
+from src.database.queries import get_sampled_table_name, get_top_values_query, get_hll_registers_query
+
+REFRESH_TOTALS = {'n_values': 'sum', 'n_missing': 'sum', 'col_min': 'min', 'col_max': 'max', 'n_weekend': 'sum', 'n_weekday': 'sum', 'n_empty_1900': 'sum', 'n_empty_1970': 'sum'}
 
 class DateColumn:
     """
@@ -31,9 +36,21 @@ class DateColumn:
     -> n_empty_1970 (int): Number of times a serie has dates equal to '1970-01-01' (optional)
     -> barchart (int): Altair barchart displaying the count for each value of a serie (optional)
     -> frequent (int): Dataframe containing the most frequest value of a serie (optional)
+    -> estimated (bool): Whether the values come from the planner statistics (pg_stats) instead of a scan of the column (optional)
+    -> sample_percent (float): Percentage of the table sampled with TABLESAMPLE SYSTEM for computing the values, the whole table if None (optional)
+    -> engine (str): Extraction backend used for loading the values of the column, 'fetchall' or 'arrow' to load them as an Arrow-backed series processed with pyarrow.compute (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, used by refresh() to select the new rows instead of their xmin (optional)
+    -> state (IncrementalState): Position of the last scan of refresh() (optional)
+    -> totals (dict): Counters and earliest and latest dates of the column merged by refresh() (REFRESH_TOTALS) (optional)
+    -> sketch (HyperLogLog): Sketch of the dates of the column merged by refresh() (optional)
+    -> top (SpaceSaving): Summary of the most frequent dates of the column merged by refresh(), from which the barchart and the most frequent dates are derived (optional)
+    -> future (pd.DataFrame): Number of dates and of dates after the start of their day for every day from the day of the scan onwards, merged by refresh() (optional)
+    -> distinct_precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch estimating the number of unique values, None to count them exactly (optional)
+    -> unique_error (float): Relative standard error of n_unique, None if it is exact (optional)
+    -> frequent_capacity (int): Number of counters of the SpaceSaving summary finding the most frequent values in the loaded serie, None to count them exactly in Postgres (optional)
 
     """
-    def __init__(self, schema_name=None, table_name=None, col_name=None, db=None, serie=pd.Series()):
+    def __init__(self, schema_name=None, table_name=None, col_name=None, db=None, serie=pd.Series(), sample_percent=None, engine='fetchall', watermark_column=None, distinct_precision=None, frequent_capacity=None):
         self.schema_name = schema_name
         self.table_name = table_name
         self.col_name = col_name
@@ -50,13 +67,25 @@ class DateColumn:
         self.n_empty_1970 = None
         self.barchart = None
         self.frequent = None
+        self.estimated = False
+        self.sample_percent = sample_percent
+        self.engine = engine
+        self.watermark_column = watermark_column
+        self.state = None
+        self.totals = None
+        self.sketch = None
+        self.top = None
+        self.future = pd.DataFrame(columns=['count', 'after_midnight'], dtype='int64')
+        self.distinct_precision = distinct_precision
+        self.unique_error = None
+        self.frequent_capacity = frequent_capacity
 
     def set_data(self):
         """
         --------------------
         Description
         --------------------
-        set_data (method): Class method that computes all requested information from self.serie to be displayed in the Date section of Streamlit app
+        set_data (method): Class method that computes all requested information to be displayed in the Date section of Streamlit app without loading the column
 
         --------------------
         Parameters
@@ -66,10 +95,9 @@ class DateColumn:
         --------------------
         Pseudo-Code
         --------------------
-        open connection and cursor to the database
-        extract content of selected Postgres table's column and load into class attribute as pandas series
-        close cursor and connection to the database
-        call class fucntions to compute serie attributes after checking the serie is not empty
+        compute all the counters and the earliest and latest dates of the column in a single scan (set_summary())
+        estimate the number of unique values from the values streamed from Postgres if it has not been computed by the hll extension (set_unique_sketch())
+        call class fucntions to compute the most frequent values and their barchart after checking the column has a non-missing date (has_values())
 
         --------------------
         Returns
@@ -77,26 +105,310 @@ class DateColumn:
         none
 
 
+        """
+        self.set_summary()
+        self.set_unique_sketch()
+        if self.has_values():
+            self.set_frequent()
+            self.set_barchart()
+
+    async def set_data_async(self, adb):
+        """
+        --------------------
+        Description
+        --------------------
+        set_data_async (method): Coroutine version of set_data() that runs its SQL queries on an AsyncPostgresConnector, so that several columns can be profiled concurrently (profile_columns())
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        adb: AsyncPostgresConnector on which the SQL queries are run
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        run the counters query, the most frequent values query (counted in Postgres even when they are approximated, as the asynchronous connections cannot stream the values into a SpaceSaving summary), the HyperLogLog registers query (get_hll_registers_query(), when the unique values are approximated, the hll extension not being looked up on the asynchronous connections) concurrently
+        save the counters to corresponding class attributes (set_summary_values()) and the estimate of the sketch of the registers as number of unique values (read_registers())
+        call class fucntions to compute the most frequent values (set_frequent_values() with the result of the query) and their barchart after checking the column has a non-missing date (has_values())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        queries = [adb.run_query(get_summary_query(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision)),
+                   adb.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.col_name))]
+        if self.distinct_precision is not None:
+            queries.append(adb.run_query(get_hll_registers_query(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision)))
+        summary, top, *registers = await asyncio.gather(*queries)
+        self.set_summary_values(summary.iloc[0].tolist())
+
+        if registers:
+            self.n_unique = read_registers(registers[0], self.distinct_precision).count()
+        if self.has_values():
+            self.set_frequent_values(read_top_values(top))
+            self.set_barchart()
+
+    def get_source_name(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_source_name (method): Class method that returns the name of the table read by the SQL queries, followed by a TABLESAMPLE clause when the column is profiled on a sample (get_sampled_table_name())
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return the name of the table with the TABLESAMPLE SYSTEM clause for the sampling percentage, or unchanged if there is none
+
+        --------------------
+        Returns
+        --------------------
+        str
+
+        """
+        return get_sampled_table_name(self.table_name, self.sample_percent)
+
+    def set_summary(self):
+        """
+        --------------------
+        Description
+        --------------------
+        set_summary (method): Class method that computes the number of unique and missing values, the minimum and maximum values and the number of weekend, weekday, future, '1900-01-01' and '1970-01-01' dates of a serie in a single scan using a SQL query (get_summary_query())
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        open connection and cursor to the database
+        when the number of unique values is approximated, check whether the hll extension can estimate it in the same scan (PostgresConnector.has_extension())
+        using existing sql query to extract all the counters of the selected column of the Postgres table in one row
+        close connection and cursor to the database
+        save every value of the row to corresponding class attribute (set_summary_values())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.serie = self.db.run_query(get_column_query(self.schema_name, self.table_name, self.col_name))[0].squeeze()
+        server_hll = self.distinct_precision is not None and self.db.has_extension('hll')
+        row = self.db.run_query(get_summary_query(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision, server_hll)).iloc[0]
         self.db.close_cursor()
         self.db.close_connection()
+        self.set_summary_values(row.tolist())
 
+    def set_summary_values(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        set_summary_values (method): Class method that stores the 9 values computed for the column by the query of get_summary_query() in the corresponding class attributes
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        values: list of the values of the single row returned by the query of get_summary_query()
 
-        if (not self.is_serie_none()):
-            self.set_unique()
-            self.set_missing()
-            self.set_min()
-            self.set_max()
-            self.set_weekend()
-            self.set_weekday()
-            self.set_future()
-            self.set_empty_1900()
-            self.set_empty_1970()
+        --------------------
+        Pseudo-Code
+        --------------------
+        save every value to corresponding class attribute
+        save the standard error of the number of unique values if it is approximated (None when the query left it to set_unique_sketch())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        self.n_unique, self.n_missing, self.col_min, self.col_max, self.n_weekend, self.n_weekday, self.n_future, self.n_empty_1900, self.n_empty_1970 = values
+        self.unique_error = HyperLogLog.get_error(self.distinct_precision) if self.distinct_precision is not None else None
+
+    def set_local_values(self, profile):
+        """
+        --------------------
+        Description
+        --------------------
+        set_local_values (method): Class method that stores the profile of the column computed in pandas from the loaded rows of the table (profile_series() of ProcessProfiler) in the same class attributes as set_data()
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        profile: dictionary of the number of missing and unique values, earliest and latest dates, date counters and most frequent dates of the column
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        save the values to corresponding class attributes in the order of get_summary_query() (set_summary_values()), the number of unique values being counted exactly
+        call class fucntions to store the most frequent values and compute their barchart after checking the column has a non-missing date (has_values())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        self.distinct_precision = None
+        self.set_summary_values([profile[name] for name in ('n_unique', 'n_missing', 'col_min', 'col_max', 'n_weekend', 'n_weekday', 'n_future', 'n_empty_1900', 'n_empty_1970')])
+        if self.has_values():
+            self.set_frequent_values(profile['frequent'].copy())
             self.set_barchart()
-            self.set_frequent()
+
+    def set_unique_sketch(self):
+        """
+        --------------------
+        Description
+        --------------------
+        set_unique_sketch (method): Class method that estimates the number of unique values with a HyperLogLog sketch fed by the chunks of values streamed from a server-side cursor (PostgresConnector.count_distinct()), when it is approximated and has not been estimated by the hll extension
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        if the number of unique values is approximated and missing, open connection and cursor to the database, add the chunks of non-missing values of the column to a sketch (count_distinct()), save its estimate and close cursor and connection
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        if self.distinct_precision is not None and pd.isna(self.n_unique):
+            self.db.open_connection()
+            self.db.open_cursor()
+            self.n_unique = self.db.count_distinct(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision)[0]
+            self.db.close_cursor()
+            self.db.close_connection()
+
+    def refresh(self, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        refresh (method): Class method that profiles the whole column from a state whose size does not grow with the number of rows or unique dates, only scanning the rows appended since the previous refresh and merging them into the previous state as long as no row of the table has been updated or deleted (IncrementalState)
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        end(int): number of most frequent dates
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        start a new IncrementalState if there is none or if the watermark column has changed
+        compute the state of the new rows, or of every row when they cannot be merged, and merge it in the snapshot of the refresh (scan_rows())
+        store the position of the scan and drop the loaded pandas serie and the sampling percentage, as the profile now covers the whole table
+        derive all the values of the profile from the state (set_totals_values())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        if self.state is None or self.state.watermark_column != self.watermark_column:
+            self.state = IncrementalState(self.schema_name, self.table_name, self.watermark_column)
+        position = self.state.refresh(self.db, self.scan_rows)
+        self.state.set_position(*position)
+        self.serie = pd.Series(dtype=object)
+        self.sample_percent = None
+        self.set_totals_values(end)
+
+    def scan_rows(self, condition):
+        """
+        --------------------
+        Description
+        --------------------
+        scan_rows (method): Class method that computes in Postgres the counters, the HyperLogLog registers, the most frequent dates and the dates per day from the current day onwards of the rows of the column matching a condition, and merges them into the state of refresh()
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        condition(str): WHERE condition selecting the new rows, None for the whole table (IncrementalState.get_condition())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        compute the counters (get_refresh_aggregates()), the registers of a sketch of distinct_precision (or 14) and the frequent_capacity (or 1000) most frequent dates of the rows (scan_column())
+        count the dates of the rows per day from the current day onwards (get_future_days_query())
+        if the scan is incremental, merge them into the previous state (merge_totals()) and drop the days that have passed; otherwise start a new state
+        store the new state and return the position of the scan
+
+        --------------------
+        Returns
+        --------------------
+        list: position of the scan, passed to IncrementalState.set_position()
+
+        """
+        position, values, sketch, top = scan_column(self.db, self.schema_name, self.table_name, self.col_name, get_refresh_aggregates(self.col_name), condition, self.watermark_column, self.distinct_precision or 14, self.frequent_capacity or 1000)
+        totals = dict(zip(REFRESH_TOTALS, values))
+        days = self.db.run_query(get_future_days_query(self.schema_name, self.table_name, self.col_name, condition))
+        future = pd.DataFrame({'count': days[1].to_numpy(dtype='int64'), 'after_midnight': days[2].to_numpy(dtype='int64')}, index=days[0].to_numpy()) if not days.empty else pd.DataFrame(columns=['count', 'after_midnight'], dtype='int64')
+        if self.state.incremental:
+            totals, sketch, top = merge_totals(self.totals, totals, REFRESH_TOTALS), sketch.merge(self.sketch), top.merge(self.top)
+            future = self.future[self.future.index >= date.today()].add(future, fill_value=0).astype('int64')
+        self.totals, self.sketch, self.top, self.future = totals, sketch, top, future
+        return position
+
+    def set_totals_values(self, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        set_totals_values (method): Class method that computes the number of missing values, the earliest and latest dates, the counters, the estimated number of unique dates, the barchart and the most frequent dates of the column from the state merged by refresh(), the last two from the tracked dates
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        end(int): number of most frequent dates
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        save the number of missing values, the earliest and latest dates and the weekend, weekday, '1900-01-01' and '1970-01-01' counters to the class
+        sum the dates of the days after the current day and the dates after the start of the current day, which are compared at every refresh as they move to the past
+        estimate the number of unique dates with the sketch and store its standard error
+        create the barchart of the tracked dates and the most frequent dates with their estimated occurrences and percentages (set_frequent_values())
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        self.n_missing = int(self.totals['n_missing'])
+        self.col_min, self.col_max = self.totals['col_min'], self.totals['col_max']
+        self.n_weekend, self.n_weekday, self.n_empty_1900, self.n_empty_1970 = [int(self.totals[name]) for name in ('n_weekend', 'n_weekday', 'n_empty_1900', 'n_empty_1970')]
+        today = date.today()
+        self.n_future = int(self.future.loc[self.future.index > today, 'count'].sum() + self.future.loc[self.future.index == today, 'after_midnight'].sum())
+        self.n_unique = self.sketch.count()
+        self.unique_error = self.sketch.error
+        value_c = self.top.get_top(self.top.capacity)
+        self.barchart = alt.Chart(pd.DataFrame({'value': pd.to_datetime(value_c['value'], utc=True), 'occurrence': value_c['occurrence']})).mark_bar().encode(x='value', y='occurrence').interactive()
+        self.set_frequent_values(value_c.head(end).copy())
 
     def is_serie_none(self):
         """
@@ -122,6 +434,54 @@ class DateColumn:
         """
         return self.serie.empty
 
+    def has_values(self):
+        """
+        --------------------
+        Description
+        --------------------
+        has_values (method): Class method that checks if the column has at least one non-missing date from its earliest date computed by the summary query, without loading the column
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return boolean value indicating if the earliest date is not missing
+
+        --------------------
+        Returns
+        --------------------
+        Boolean value
+        """
+        return pd.notna(self.col_min)
+
+    def get_memory_usage(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_memory_usage (method): Class method that computes the number of bytes used by the Pandas series and dataframes of the profile, so that it can be kept in a cache with a memory cap (DatasetCache)
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        return the sum of the deep memory usage of every Pandas series and dataframe attribute of the class
+
+        --------------------
+        Returns
+        --------------------
+        int
+        """
+        return int(sum(pd.DataFrame(value).memory_usage(deep=True).sum() for value in vars(self).values() if isinstance(value, (pd.Series, pd.DataFrame))))
+
     def set_unique(self):
         """
         --------------------
@@ -137,7 +497,7 @@ class DateColumn:
         --------------------
         Pseudo-Code
         --------------------
-        save the number of distinct values of the serie to corresponding class attribute
+        save the number of distinct values of the serie to corresponding class attribute, or its estimate by a HyperLogLog sketch (sketch_serie()) when it is approximated
 
         --------------------
         Returns
@@ -145,7 +505,11 @@ class DateColumn:
         none
 
         """
-        self.n_unique = self.serie.nunique()
+        if self.distinct_precision is None:
+            self.n_unique = self.serie.nunique()
+        else:
+            sketch = sketch_serie(self.serie, self.distinct_precision)
+            self.n_unique, self.unique_error = sketch.count(), sketch.error
 
     def set_missing(self):
         """
@@ -199,7 +563,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.col_min = self.db.run_query(get_min_date_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.col_min = self.db.run_query(get_min_date_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -231,7 +595,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.col_max = self.db.run_query(get_max_date_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.col_max = self.db.run_query(get_max_date_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -263,7 +627,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_weekend = self.db.run_query(get_weekend_count_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_weekend = self.db.run_query(get_weekend_count_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -295,7 +659,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_weekday = self.db.run_query(get_weekday_count_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_weekday = self.db.run_query(get_weekday_count_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -327,7 +691,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_future = self.db.run_query(get_future_count_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_future = self.db.run_query(get_future_count_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -359,7 +723,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_empty_1900 = self.db.run_query(get_1900_count_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_empty_1900 = self.db.run_query(get_1900_count_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -391,7 +755,7 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_empty_1970 = self.db.run_query(get_1970_count_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_empty_1970 = self.db.run_query(get_1970_count_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -400,7 +764,7 @@ class DateColumn:
         --------------------
         Description
         --------------------
-        set_barchart (method): Class method that computes the Altair barchart displaying the count for each value of a serie
+        set_barchart (method): Class method that computes the Altair barchart displaying the count of the most frequent values of a serie (set_frequent()), so that its size does not grow with the number of unique values
 
         --------------------
         Parameters
@@ -410,12 +774,8 @@ class DateColumn:
         --------------------
         Pseudo-Code
         --------------------
-        open connection and cursor to the database
-        get values counts for values in the serie
-        create pandas dataframe with values and value counts
-        create Altair barchart using dataframe
+        create Altair barchart using the dataframe of the most frequent values
         store barchart in corresponding class attribute
-        close connection and cursor to the database
 
         --------------------
         Returns
@@ -423,15 +783,7 @@ class DateColumn:
         none
 
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame()
-        value_c = pd.DataFrame()
-        value_c['value'] = pd.to_datetime(counts.index, utc=True)
-        value_c['occurrence'] = counts.values
-        self.barchart = alt.Chart(value_c).mark_bar().encode(x='value', y='occurrence').interactive()
-        self.db.close_cursor()
-        self.db.close_connection()
+        self.barchart = alt.Chart(self.frequent[['value', 'occurrence']]).mark_bar().encode(x='value', y='occurrence').interactive()
 
 
     def set_frequent(self, end=20):
@@ -439,21 +791,22 @@ class DateColumn:
         --------------------
         Description
         --------------------
-        set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie
+        set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie, counted in Postgres or approximated with a fixed number of counters from the values streamed from Postgres
 
         --------------------
         Parameters
         --------------------
         self: Reference to the current instance of the class
+        end: number of most frequent values (default: 20)
 
         --------------------
         Pseudo-Code
         --------------------
         open connection and cursor to the database
-        get values counts and count percentage for values in the serie
-        create pandas dataframe with values, value counts and count precentage
-        store dataframe in corresponding class attribute
+        if the most frequent values are approximated, add the chunks of non-missing values streamed from a server-side cursor to a SpaceSaving summary of frequent_capacity counters (count_top_values()) and get its top values with their occurrences and percentages
+        otherwise get the top values with their occurrences and percentages in a single scan using a SQL query (get_top_values_query())
         close connection and cursor to the database
+        store them in corresponding class attribute (set_frequent_values())
 
         --------------------
         Returns
@@ -463,15 +816,119 @@ class DateColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame().head(end)
-        counts_perc = round(self.serie.value_counts(normalize=True).to_frame().head(end), 4)
-        value_c = pd.DataFrame()
-        value_c['value'] = pd.to_datetime(counts.index, utc=True)
-        value_c['occurrence'] = counts.values
-        value_c['percentage'] = counts_perc.values
-        self.frequent = value_c
+        if self.frequent_capacity is not None:
+            top = self.db.count_top_values(self.schema_name, self.get_source_name(), self.col_name, self.frequent_capacity).get_top(end)
+        else:
+            top = read_top_values(self.db.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.col_name, end)))
         self.db.close_cursor()
         self.db.close_connection()
+        self.set_frequent_values(top)
+
+    def set_frequent_values(self, value_c):
+        """
+        --------------------
+        Description
+        --------------------
+        set_frequent_values (method): Class method that stores the most frequent values of the column as UTC datetimes
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        value_c: pandas dataframe of the most frequent values with their occurrences and percentages (read_top_values() or SpaceSaving.get_top())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        convert the values to UTC datetimes
+        store dataframe in corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        value_c['value'] = pd.to_datetime(value_c['value'], utc=True)
+        self.frequent = value_c
+
+    def set_catalog_stats(self, stats):
+        """
+        --------------------
+        Description
+        --------------------
+        set_catalog_stats (method): Class method that sets the estimated number of unique and missing values, minimum, maximum, most frequent values and barchart of a column from its planner statistics (Dataset.get_column_stats()) without scanning it
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+        stats(dict): estimated profile of the column read from pg_stats
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        flag the column as estimated and store the estimated number of unique and missing values in corresponding class attributes
+        convert the most common values and the histogram bounds to datetimes and take the minimum and maximum over both
+        create pandas dataframe with the most common values, their estimated occurrences and percentages
+        if there are histogram bounds, create Altair barchart of the estimated number of rows between consecutive bounds
+        otherwise create Altair barchart of the most common values
+        store dataframe and barchart in corresponding class attributes
+
+        --------------------
+        Returns
+        --------------------
+        none
+
+        """
+        self.estimated = True
+        self.n_unique = stats['n_unique']
+        self.n_missing = stats['n_missing']
+        values = pd.to_datetime(pd.Series(stats['values'], dtype=object), utc=True)
+        bounds = pd.to_datetime(pd.Series(stats['bounds'], dtype=object), utc=True)
+        all_values = pd.concat([values, bounds])
+        if not all_values.empty:
+            self.col_min = all_values.min()
+            self.col_max = all_values.max()
+        value_c = pd.DataFrame()
+        value_c['value'] = values
+        value_c['occurrence'] = stats['occurrences']
+        value_c['percentage'] = stats['percentages']
+        self.frequent = value_c
+        if len(bounds) > 1:
+            value_b = pd.DataFrame({'value': bounds[:-1].values, 'value_end': bounds[1:].values, 'occurrence': round(stats['n_histogram'])})
+            self.barchart = alt.Chart(value_b).mark_bar().encode(x='value', x2='value_end', y='occurrence').interactive()
+        else:
+            self.barchart = alt.Chart(value_c).mark_bar().encode(x='value', y='occurrence').interactive()
+
+    def get_estimate_df(self):
+        """
+        --------------------
+        Description
+        --------------------
+        get_estimate_df (method): Class method that formats the information estimated from the planner statistics (set_catalog_stats()) as a Pandas dataframe with 2 columns: Description and Value
+
+        --------------------
+        Parameters
+        --------------------
+        self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        setup an empty pandas DataFrame
+        set specified columns, marked as estimates, and values from estimated attributes of the class
+
+        --------------------
+        Returns
+        --------------------
+        pandas dataframe
+
+        """
+        summary = pd.DataFrame()
+        summary['Description'] = ['Number of Unique Values (estimate)', 'Number of Rows with Missing Values (estimate)', 'Minimum Value (estimate)', 'Maximum Value (estimate)']
+        summary['Value'] = [str(self.n_unique), str(self.n_missing), str(self.col_min), str(self.col_max)]
+        return summary
 
     def get_summary_df(self):
         """
@@ -499,5 +956,5 @@ class DateColumn:
         """
         summary = pd.DataFrame()
         summary['Description'] = ['Number of Unique Values', 'Number of Rows with Missing Values', 'Number of Weekend Dates', 'Number of Weekday Dates', 'Number of Dates in Future', 'Number of Rows with 1900-01-01', 'Number of Rows with 1970-01-01', 'Minimum Value', 'Maximum Value']
-        summary['Value'] = [str(self.n_unique), str(self.n_missing), str(self.n_weekend), str(self.n_weekday), str(self.n_future), str(self.n_empty_1900), str(self.n_empty_1970), str(self.col_min), str(self.col_max)]
+        summary['Value'] = [format_distinct_count(self.n_unique, self.unique_error), str(self.n_missing), str(self.n_weekend), str(self.n_weekday), str(self.n_future), str(self.n_empty_1900), str(self.n_empty_1970), str(self.col_min), str(self.col_max)]
         return summary
@@ -1,3 +1,5 @@
+from src.database.queries import get_distinct_count
+
 def get_column_query(schema_name, table_name, col_name):
     """
     --------------------
@@ -161,3 +163,68 @@ def get_1970_count_query(schema_name, table_name, col_name):
     """
     query = f"select count({col_name}) from {schema_name}.{table_name} where {col_name} = '1970-01-01'"
     return query
+
+def get_summary_query(schema_name, table_name, col_name, precision=None, server_hll=False):
+    """
+    --------------------
+    Description
+    --------------------
+    get_summary_query (method): Function that returns the query used for computing in a single scan the number of unique and missing values, the earliest and latest dates and the number of weekend, weekday, future, '1900-01-01' and '1970-01-01' dates of a datetime column from a Postgres table
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str), col_name(str): name of selected column fom Postgres table
+    precision(int), server_hll(bool): precision of the HyperLogLog sketch estimating the number of unique values and whether it is built by the hll extension (get_distinct_count()), exact count if precision is None
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+    """
+    query = f"select {get_distinct_count(col_name, precision, server_hll)}, count(*) filter (where {col_name} is null), min({col_name}), max({col_name}), count(*) filter (where extract(isodow from {col_name}) in (6, 7)), count(*) filter (where extract(isodow from {col_name}) in (1, 2, 3, 4, 5)), count(*) filter (where {col_name} > current_date), count(*) filter (where {col_name} = '1900-01-01'), count(*) filter (where {col_name} = '1970-01-01') from {schema_name}.{table_name}"
+    return query
+
+def get_refresh_aggregates(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    get_refresh_aggregates (method): Function that returns the SQL aggregates of a datetime column kept by the incremental refresh of its profile, i.e. the number of missing values, the earliest and latest dates and the number of weekend, weekday, '1900-01-01' and '1970-01-01' dates with the same conditions as get_summary_query(), which are merged from one scan to the next (scan_column())
+
+    --------------------
+    Parameters
+    --------------------
+    col_name(str): name of selected column fom Postgres table
+
+    --------------------
+    Returns
+    --------------------
+    list of SQL aggregates(str)
+
+    """
+    return [f"count(*) filter (where {col_name} is null)", f"min({col_name})", f"max({col_name})", f"count(*) filter (where extract(isodow from {col_name}) in (6, 7))",
+            f"count(*) filter (where extract(isodow from {col_name}) in (1, 2, 3, 4, 5))", f"count(*) filter (where {col_name} = '1900-01-01')", f"count(*) filter (where {col_name} = '1970-01-01')"]
+
+def get_future_days_query(schema_name, table_name, col_name, condition=None):
+    """
+    --------------------
+    Description
+    --------------------
+    get_future_days_query (method): Function that returns the query used for counting the dates of a datetime column from the current day onwards per day, with the dates after the start of their day, so that the number of future dates of get_summary_query() can be recomputed on a later day without scanning them again
+
+    --------------------
+    Parameters
+    --------------------
+    schema_name(str), table_name(str), col_name(str): name of selected column fom Postgres table
+    condition(str): WHERE condition selecting the rows to be counted, every row if None (optional)
+
+    --------------------
+    Returns
+    --------------------
+    SQL query(str)
+
+    """
+    where = f" and {condition}" if condition else ""
+    query = f"select {col_name}::date, count(*), count(*) filter (where {col_name} > {col_name}::date) from {schema_name}.{table_name} where {col_name} >= current_date{where} group by 1"
+    return query
@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 
-from src.dataframe.logics import Dataset
+from src.config import get_column_profile, set_column_profile, display_refresh_profile
+from src.database.logics import profile_columns, COLUMN_ENGINE
 from src.serie_numeric.logics import NumericColumn
 
 def display_numerics():
@@ -20,8 +21,9 @@ def display_numerics():
     Pseudo-Code
     --------------------
     -> Define the required database information from the streamlit session state
-    -> Retreive a list of all tables containing numeric fields
-    -> Cycle through table list to display table name in streamlit expander container and display numerical information
+    -> Retreive the list of numeric columns from the Dataset already loaded in the streamlit session state
+    -> Display a button that profiles every numeric column not profiled yet concurrently (profile_columns()), memoizes them and displays the error of every column that could not be profiled
+    -> Cycle through table list to display table name in streamlit expander container and display numerical information (only computed on demand)
 
     --------------------
     Returns
@@ -31,13 +33,55 @@ def display_numerics():
     """
     schema_name = st.session_state['schema_selected']
     table_name = st.session_state['table_selected']
-    Data_all = Dataset(schema_name, table_name, db=st.session_state['db'])
-    Data_all.set_data()
+    Data_all = st.session_state['data']
     if (Data_all.num_cols != None):
+        if st.button('Profile all numeric columns', key='numeric_profile_all'):
+            db = st.session_state['db']
+            columns = [NumericColumn(schema_name, table_name, column, db, sample_percent=st.session_state.get('sample_percent'), distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity')) for column in Data_all.num_cols if get_column_profile('numeric', column) is None]
+            errors = []
+            for numeric_data in profile_columns(columns, db, errors=errors):
+                set_column_profile('numeric', numeric_data.column_name, numeric_data)
+            for numeric_data, error in errors:
+                st.error(f"Column {numeric_data.column_name} could not be profiled: {error}")
         for idx, column in enumerate(Data_all.num_cols):
             with st.expander(f"{idx+1}. column: {column}"):
                 display_numeric(column, idx)
 
+def get_numeric_profile(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_numeric_profile (function): Function that returns the memoized NumericColumn of a column, instantiating it and setting its values on the first call
+
+    --------------------
+    Parameters
+    --------------------
+    -> col_name(str): name of processed column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Retreive the memoized NumericColumn object of the column from the streamlit session state
+    -> If there is none, instantiate a NumericColumn object on the sampling percentage selected in the streamlit session state (loading its values as Arrow arrays when pyarrow is installed), set its values and memoize it
+    -> Return the NumericColumn object
+
+    --------------------
+    Returns
+    --------------------
+    -> (NumericColumn): Profiled numeric column
+
+    """
+    numeric_data = get_column_profile('numeric', col_name)
+    if numeric_data is None:
+        schema_name = st.session_state['schema_selected']
+        table_name = st.session_state['table_selected']
+        db = st.session_state['db']
+        numeric_data = NumericColumn(schema_name, table_name, col_name, db, sample_percent=st.session_state.get('sample_percent'), engine=COLUMN_ENGINE, distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity'))
+        numeric_data.set_data()
+        set_column_profile('numeric', col_name, numeric_data)
+    return numeric_data
+
 def display_numeric(col_name, i):
     """
     --------------------
@@ -54,9 +98,10 @@ def display_numeric(col_name, i):
     --------------------
     Pseudo-Code
     --------------------
-    -> Retreive required database information from the streamlit session state
-    -> Instantiate a NumericColumn object and set its values
-    -> Display an information table for the column parameter, an interctive bar chart of the numeric count and an interactive chart of the frequency of the top 20 numerical elements
+    -> If the column has not been profiled yet, display a button that profiles it and, until it is clicked, only display the estimates from the planner statistics (display_numeric_estimate())
+    -> Retreive the memoized NumericColumn object (get_numeric_profile())
+    -> Display a button that refreshes the profile with the rows appended since its previous refresh (display_refresh_profile())
+    -> Display a note when the column was profiled on a sample, an information table for the column parameter, an interctive bar chart of the numeric count and an interactive chart of the frequency of the top 20 numerical elements
 
     --------------------
     Returns
@@ -64,17 +109,56 @@ def display_numeric(col_name, i):
     -> None
 
     """
-    schema_name = st.session_state['schema_selected']
-    table_name = st.session_state['table_selected']
-    db = st.session_state['db']
-    numeric_data = NumericColumn(schema_name, table_name, col_name, db)
-    numeric_data.set_data()
+    if get_column_profile('numeric', col_name) is None and not st.button('Profile column', key=f'numeric_profile_{i}'):
+        display_numeric_estimate(col_name)
+        return
+    numeric_data = get_numeric_profile(col_name)
+    display_refresh_profile(numeric_data, key=f'numeric_refresh_{i}')
 
     if not numeric_data.is_serie_none():
+        if numeric_data.sample_percent:
+            st.caption(f"Profiled on a {numeric_data.sample_percent}% sample of the table (TABLESAMPLE SYSTEM).")
         st.table(data=numeric_data.get_summary_df())
         st.subheader('Bar Chart')
         st.altair_chart(numeric_data.histogram, use_container_width=True)
         st.subheader('Most Frequent Values')
         st.dataframe(data=numeric_data.frequent)
     else:
-        st.write('No data in table')
\ No newline at end of file
+        st.write('No data in table')
+
+def display_numeric_estimate(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> display_numeric_estimate (function): Function that displays the information of a single numerical column estimated from the planner statistics of the table, without scanning the column
+
+    --------------------
+    Parameters
+    --------------------
+    -> col_name(str): name of processed column
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Retreive the estimated profile of the column from the Dataset stored in the streamlit session state (get_column_stats()) and stop if the column has not been analysed
+    -> Instantiate a NumericColumn object and set its values from the estimated profile
+    -> Display a note that the values are estimates, an information table, a bar chart and the most common values of the column
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    stats = st.session_state['data'].get_column_stats().get(col_name)
+    if stats is None:
+        return
+    numeric_data = NumericColumn(st.session_state['schema_selected'], st.session_state['table_selected'], col_name, st.session_state['db'])
+    numeric_data.set_catalog_stats(stats)
+    st.caption('Estimated from the planner statistics (pg_stats) without scanning the column. Profile the column for exact values.')
+    st.table(data=numeric_data.get_estimate_df())
+    st.subheader('Bar Chart')
+    st.altair_chart(numeric_data.histogram, use_container_width=True)
+    st.subheader('Most Frequent Values')
+    st.dataframe(data=numeric_data.frequent)
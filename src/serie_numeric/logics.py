@@ -1,10 +1,15 @@
+import asyncio
 import streamlit as st
+import numpy as np
 import pandas as pd
 import altair as alt
 
-from src.database.logics import PostgresConnector
-from src.serie_numeric.queries import get_negative_number_query, get_std_query, get_unique_query
-from src.serie_date.queries import get_column_query
+from src.database.logics import PostgresConnector, IncrementalState, HyperLogLog, is_arrow_serie, merge_totals, scan_column, read_registers, format_distinct_count, read_top_values
+from src.serie_numeric.queries import get_negative_number_query, get_std_query, get_unique_query, get_summary_query, get_finite_range_query, get_histogram_query, get_refresh_aggregates, get_bins_query
+from src.database.queries import get_sampled_table_name, get_top_values_query, get_hll_registers_query
+
+REFRESH_TOTALS = {'n_values': 'sum', 'n_missing': 'sum', 'col_mean': None, 'col_m2': None, 'col_min': 'min', 'col_max': 'max', 'n_zeros': 'sum', 'n_negatives': 'sum', 'finite_min': 'min', 'finite_max': 'max'}
+N_REFRESH_BINS = 1024
 
 
 class NumericColumn:
@@ -33,9 +38,24 @@ class NumericColumn:
     -> n_negatives (int): Number of times a serie has negative values (optional)
     -> histogram (int): Altair histogram displaying the count for each bin value of a serie (optional)
     -> frequent (int): Datframe containing the most frequest value of a serie (optional)
+    -> n_values (int): Number of non-missing values of a serie (optional)
+    -> estimated (bool): Whether the values come from the planner statistics (pg_stats) instead of a scan of the column (optional)
+    -> sample_percent (float): Percentage of the table sampled with TABLESAMPLE SYSTEM for computing the values, the whole table if None (optional)
+    -> engine (str): Extraction backend used for loading the values of the column, 'fetchall' or 'arrow' to load them as an Arrow-backed series processed with pyarrow.compute (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, used by refresh() to select the new rows instead of their xmin (optional)
+    -> state (IncrementalState): Position of the last scan of refresh() (optional)
+    -> totals (dict): Aggregates of the column merged by refresh() (REFRESH_TOTALS), from which the summary statistics of the profile are derived (optional)
+    -> sketch (HyperLogLog): Sketch of the values of the column merged by refresh() (optional)
+    -> top (SpaceSaving): Summary of the most frequent values of the column merged by refresh() (optional)
+    -> bins (pd.Series): Number of finite values in every bin of width bin_width starting from bin_origin merged by refresh(), from which the median and the histogram are derived (optional)
+    -> bin_origin (float): Lower bound of the bin 0 of bins (optional)
+    -> bin_width (float): Width of the bins of bins, doubled whenever the values no longer fit in N_REFRESH_BINS bins (optional)
+    -> distinct_precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch estimating the number of unique values, None to count them exactly (optional)
+    -> unique_error (float): Relative standard error of n_unique, None if it is exact (optional)
+    -> frequent_capacity (int): Number of counters of the SpaceSaving summary finding the most frequent values in the loaded series, None to count them exactly in Postgres (optional)
 
     """    
-    def __init__(self, schema_name=None, table_name=None, column_name=None, db=PostgresConnector(), ds=pd.Series()):
+    def __init__(self, schema_name=None, table_name=None, column_name=None, db=PostgresConnector(), ds=pd.Series(), sample_percent=None, engine='fetchall', watermark_column=None, distinct_precision=None, frequent_capacity=None):
         self.schema_name = schema_name
         self.table_name = table_name
         self.column_name = column_name
@@ -52,6 +72,21 @@ class NumericColumn:
         self.n_negatives = None
         self.histogram = None
         self.frequent = None
+        self.n_values = None
+        self.estimated = False
+        self.sample_percent = sample_percent
+        self.engine = engine
+        self.watermark_column = watermark_column
+        self.state = None
+        self.totals = None
+        self.sketch = None
+        self.top = None
+        self.bins = pd.Series(dtype='int64')
+        self.bin_origin = None
+        self.bin_width = None
+        self.distinct_precision = distinct_precision
+        self.unique_error = None
+        self.frequent_capacity = frequent_capacity
 
     def set_data(self):
         """
@@ -68,9 +103,108 @@ class NumericColumn:
         --------------------
         Pseudo-Code
         --------------------
-        -> open connection and cursor to the database
-        -> extract content of selected Postgres table's column and load into class attribute as pandas series
-        -> close cursor and connection to the database
+        -> forget the state of refresh(), which no longer matches the profile
+        -> compute all the summary statistics of the column in a single scan (set_summary())
+        -> compute the binned histogram of the column in Postgres (set_histogram())
+        -> estimate the number of unique values from the values streamed from Postgres if it has not been computed by the hll extension (set_unique_sketch())
+        -> compute the most frequent values in Postgres, or approximate them from the values streamed from Postgres (set_frequent()), so that the column is never loaded
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.state = self.totals = None
+        self.set_summary()
+        self.set_histogram()
+        self.set_unique_sketch()
+        if (not self.is_serie_none()):
+            self.set_frequent()
+
+    async def set_data_async(self, adb):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_async (method): Coroutine version of set_data() that runs its SQL queries on an AsyncPostgresConnector, so that several columns can be profiled concurrently (profile_columns())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> adb (AsyncPostgresConnector): Asynchronous connector on which the SQL queries are run
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> run the summary statistics query, the most frequent values query and the HyperLogLog registers query (get_hll_registers_query(), when the unique values are approximated, the hll extension not being looked up on the asynchronous connections) concurrently, the most frequent values being counted in Postgres even when they are approximated as the asynchronous connections cannot stream the values into a SpaceSaving summary
+        -> pass the summary statistics to the class attributes (set_summary_values()) and the estimate of the sketch of the registers to the number of unique values (read_registers())
+        -> count the values per bin of the histogram in Postgres like set_histogram() (set_histogram_async()) and store the most frequent values (set_frequent_values())
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        queries = [adb.run_query(get_summary_query(self.schema_name, self.get_source_name(), self.column_name, self.distinct_precision)),
+                   adb.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.column_name))]
+        if self.distinct_precision is not None:
+            queries.append(adb.run_query(get_hll_registers_query(self.schema_name, self.get_source_name(), self.column_name, self.distinct_precision)))
+        summary, top, *registers = await asyncio.gather(*queries)
+        self.set_summary_values(summary.iloc[0].tolist())
+        if registers:
+            self.n_unique = read_registers(registers[0], self.distinct_precision).count()
+        await self.set_histogram_async(adb)
+        if (not self.is_serie_none()):
+            self.set_frequent_values(read_top_values(top))
+
+    def get_source_name(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_source_name (method): Class method that returns the name of the table read by the SQL queries, followed by a TABLESAMPLE clause when the column is profiled on a sample (get_sampled_table_name())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Return the name of the table with the TABLESAMPLE SYSTEM clause for the sampling percentage, or unchanged if there is none
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): Name of the table read by the SQL queries
+
+        """
+        return get_sampled_table_name(self.table_name, self.sample_percent)
+
+    def set_summary(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_summary (method): Class method that computes the number of unique, missing, zero and negative values and the average, standard deviation, minimum, maximum and median of a column in a single scan using a SQL query (get_summary_query())
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Open a connection and a cursor for the passed database
+        -> When the number of unique values is approximated, check whether the hll extension can estimate it in the same scan (PostgresConnector.has_extension())
+        -> Retreive the sql query to extract all the summary statistics of the selected column of the Postgres table
+        -> Close the cursor and connection to the database
+        -> Pass every value of the single row returned to the corresponding class attribute (set_summary_values())
 
         --------------------
         Returns
@@ -80,24 +214,104 @@ class NumericColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        df = self.db.run_query(get_column_query(self.schema_name, self.table_name, self.column_name))
-        if not df.empty:
-            self.serie = df[0].squeeze()
+        server_hll = self.distinct_precision is not None and self.db.has_extension('hll')
+        row = self.db.run_query(get_summary_query(self.schema_name, self.get_source_name(), self.column_name, self.distinct_precision, server_hll)).iloc[0]
         self.db.close_cursor()
         self.db.close_connection()
+        self.set_summary_values(row.tolist())
 
-        if (not self.is_serie_none()):
-            self.set_unique()
-            self.set_missing()
-            self.set_mean()
-            self.set_std()
-            self.set_min()
-            self.set_max()
-            self.set_median()
-            self.set_zeros()
-            self.set_negatives()
-            self.set_histogram()
-            self.set_frequent()
+    def set_summary_values(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_summary_values (method): Class method that stores the 10 values computed for the column by the query of get_summary_query() in the corresponding class attributes
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> values (list): Values of the single row returned by the query of get_summary_query()
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Pass every value to the corresponding class attribute
+        -> Store the standard error of the number of unique values if it is approximated (None when the query left it to set_unique_sketch())
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n_values, self.n_unique, self.n_missing, self.col_mean, self.col_std, self.col_min, self.col_max, self.col_median, self.n_zeros, self.n_negatives = values
+        self.unique_error = HyperLogLog.get_error(self.distinct_precision) if self.distinct_precision is not None else None
+
+    def set_local_values(self, profile):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_local_values (method): Class method that stores the profile of the column computed in pandas from the loaded rows of the table (profile_series() of ProcessProfiler) in the same class attributes as set_data()
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> profile (dict): Number of rows, missing and unique values, summary statistics, most frequent values and bins of the histogram of the column
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Pass the summary statistics to the corresponding class attributes in the order of get_summary_query() (set_summary_values()), the number of unique values being counted exactly
+        -> Store the most frequent values (set_frequent_values())
+        -> Create an Altair barchart from the bins and store it in the corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.distinct_precision = None
+        self.set_summary_values([profile['n_rows'] - profile['n_missing'], profile['n_unique'], profile['n_missing'], profile['col_mean'], profile['col_std'],
+                                 profile['col_min'], profile['col_max'], profile['col_median'], profile['n_zeros'], profile['n_negatives']])
+        self.set_frequent_values(profile['frequent'].copy())
+        self.histogram = alt.Chart(profile['bins']).mark_bar().encode(alt.X('bin_start', bin='binned', title=self.column_name), x2='bin_end', y='Count of Records').interactive()
+
+    def set_unique_sketch(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_unique_sketch (method): Class method that estimates the number of unique values with a HyperLogLog sketch fed by the chunks of values streamed from a server-side cursor (PostgresConnector.count_distinct()), when it is approximated and has not been estimated by the hll extension, so that the column is never loaded
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the number of unique values is approximated and missing:
+            -> Open a database connection and cursor
+            -> Add the chunks of non-missing values of the column to a sketch (count_distinct()) and store its estimate
+            -> Close the cursor and connection
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.distinct_precision is not None and pd.isna(self.n_unique):
+            self.db.open_connection()
+            self.db.open_cursor()
+            self.n_unique = self.db.count_distinct(self.schema_name, self.get_source_name(), self.column_name, self.distinct_precision)[0]
+            self.db.close_cursor()
+            self.db.close_connection()
 
     def is_serie_none(self):
         """
@@ -114,7 +328,7 @@ class NumericColumn:
         --------------------
         Pseudo-Code
         --------------------
-        -> Returns a boolean value indicating whether the Pandas series is empty or none
+        -> Returns a boolean value indicating whether the Pandas series is empty or none, the summary statistics computed in Postgres count no row and the profile has not been computed by refresh()
 
         --------------------
         Returns
@@ -122,7 +336,211 @@ class NumericColumn:
         -> (boolean): True if series is empty
 
         """
-        return self.serie.empty
+        return self.serie.empty and self.totals is None and not (self.n_values or self.n_missing)
+
+    def get_memory_usage(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_memory_usage (method): Class method that computes the number of bytes used by the Pandas series and dataframes of the profile, so that it can be kept in a cache with a memory cap (DatasetCache)
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Return the sum of the deep memory usage of every Pandas series and dataframe attribute of the class
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Number of bytes
+
+        """
+        return int(sum(pd.DataFrame(value).memory_usage(deep=True).sum() for value in vars(self).values() if isinstance(value, (pd.Series, pd.DataFrame))))
+
+    def refresh(self, n_bins=50, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        -> refresh (method): Class method that profiles the whole column from a state whose size does not grow with the number of rows or unique values, only scanning the rows appended since the previous refresh and merging them into the previous state as long as no row of the table has been updated or deleted (IncrementalState)
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> n_bins (int): Maximum number of bins of the histogram (default: 50)
+        -> end (int): Number of most frequent values (default: 20)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Start a new IncrementalState if there is none or if the watermark column has changed
+        -> Compute the state of the new rows, or of every row when they cannot be merged, and merge it in the snapshot of the refresh (scan_rows())
+        -> Store the position of the scan and drop the loaded Pandas series and the sampling percentage, as the profile now covers the whole table
+        -> Derive all the values of the profile from the state (set_totals_values())
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.state is None or self.state.watermark_column != self.watermark_column:
+            self.state = IncrementalState(self.schema_name, self.table_name, self.watermark_column)
+        position = self.state.refresh(self.db, self.scan_rows)
+        self.state.set_position(*position)
+        self.serie = pd.Series(dtype='float64')
+        self.sample_percent = None
+        self.set_totals_values(n_bins, end)
+
+    def scan_rows(self, condition):
+        """
+        --------------------
+        Description
+        --------------------
+        -> scan_rows (method): Class method that computes in Postgres the aggregates, the HyperLogLog registers, the most frequent values and the bin counts of the rows of the column matching a condition, and merges them into the state of refresh()
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> condition (str): WHERE condition selecting the new rows, None for the whole table (IncrementalState.get_condition())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Compute the aggregates (get_refresh_aggregates()), the registers of a sketch of distinct_precision (or 14) and the frequent_capacity (or 1000) most frequent values of the rows (scan_column())
+        -> If the scan is incremental, merge them into the previous state, the average and the sum of the squared deviations with the formula of Chan et al. (merge_totals()); otherwise start a new state
+        -> Widen the bins until the finite values fit (get_bin_grid()), count the finite values of the rows per bin (get_bins_query()) and add them to the bins
+        -> Store the new state and return the position of the scan
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Position of the scan, passed to IncrementalState.set_position()
+
+        """
+        precision, capacity = self.distinct_precision or 14, self.frequent_capacity or 1000
+        position, values, sketch, top = scan_column(self.db, self.schema_name, self.table_name, self.column_name, get_refresh_aggregates(self.column_name), condition, self.watermark_column, precision, capacity)
+        delta = dict(zip(REFRESH_TOTALS, values))
+        previous, bins, bin_origin, bin_width = None, pd.Series(dtype='int64'), None, None
+        if self.state.incremental:
+            previous, bins, bin_origin, bin_width = self.totals, self.bins, self.bin_origin, self.bin_width
+            sketch, top = sketch.merge(self.sketch), top.merge(self.top)
+        totals = merge_totals(previous, delta, REFRESH_TOTALS)
+        if previous is not None and previous['n_values'] and delta['n_values']:
+            n_values = previous['n_values'] + delta['n_values']
+            difference = delta['col_mean'] - previous['col_mean']
+            totals['col_mean'] = previous['col_mean'] + difference * delta['n_values'] / n_values
+            totals['col_m2'] = previous['col_m2'] + delta['col_m2'] + difference ** 2 * previous['n_values'] * delta['n_values'] / n_values
+        elif previous is not None and previous['n_values']:
+            totals['col_mean'], totals['col_m2'] = previous['col_mean'], previous['col_m2']
+        if totals['finite_min'] is not None:
+            bins, bin_origin, bin_width = self.get_bin_grid(bins, bin_origin, bin_width, totals['finite_min'], totals['finite_max'])
+        if delta['finite_min'] is not None:
+            counts = self.db.run_query(get_bins_query(self.schema_name, self.table_name, self.column_name, bin_origin, bin_width, condition))
+            bins = bins.add(pd.Series(counts[1].to_numpy(dtype='int64'), index=counts[0].to_numpy(dtype='int64')), fill_value=0).astype('int64')
+        self.totals, self.sketch, self.top, self.bins, self.bin_origin, self.bin_width = totals, sketch, top, bins, bin_origin, bin_width
+        return position
+
+    @staticmethod
+    def get_bin_grid(bins, bin_origin, bin_width, col_min, col_max):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_bin_grid (method): Static method that returns the bins of refresh() widened so that the finite values between col_min and col_max fit in N_REFRESH_BINS bins, every new bin being the union of two previous ones so that their counts stay exact
+
+        --------------------
+        Parameters
+        --------------------
+        -> bins (pd.Series): Number of values in every bin number
+        -> bin_origin (float): Lower bound of the bin 0, None if there are no bins yet
+        -> bin_width (float): Width of the bins, None if there are no bins yet
+        -> col_min (float): Minimum finite value of the column
+        -> col_max (float): Maximum finite value of the column
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If there are no bins yet, start them from col_min with N_REFRESH_BINS - 1 bins up to col_max (a width based on col_min if both are equal)
+        -> While the bins of col_min and col_max are N_REFRESH_BINS apart or more, double the width and add the counts of the bins 2i and 2i + 1 into the bin i
+
+        --------------------
+        Returns
+        --------------------
+        -> (tuple): Bins, origin and width
+
+        """
+        if bin_width is None:
+            bin_origin = col_min
+            bin_width = (col_max - col_min) / (N_REFRESH_BINS - 1) if col_max > col_min else (abs(col_min) or 1.0) / N_REFRESH_BINS
+        while np.floor((col_max - bin_origin) / bin_width) - np.floor((col_min - bin_origin) / bin_width) >= N_REFRESH_BINS:
+            bin_width *= 2
+            bins = bins.groupby(bins.index // 2).sum().astype('int64')
+        return bins, bin_origin, bin_width
+
+    def set_totals_values(self, n_bins=50, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_totals_values (method): Class method that computes the summary statistics, the histogram and the most frequent values of the column from the state merged by refresh(), with the same definitions as the SQL query of get_summary_query() except for the estimated number of unique values, median and most frequent values
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> n_bins (int): Maximum number of bins of the histogram (default: 50)
+        -> end (int): Number of most frequent values (default: 20)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Pass the numbers of values, missing values, zeros and negative values, the average, the minimum and the maximum to the corresponding class attributes
+        -> Compute the sample standard deviation (None for fewer than 2 values) from the sum of the squared deviations
+        -> Estimate the number of unique values with the sketch and store its standard error
+        -> Estimate the two middle finite values by spreading the values of their bins evenly and interpolate the median between them like percentile_cont(0.5)
+        -> Group the bins by runs of consecutive bins so that at most n_bins remain for the histogram
+        -> Keep the most frequent values of the summary with their estimated occurrences and percentages (set_frequent_values())
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        totals = self.totals
+        self.n_values, self.n_missing, self.n_zeros, self.n_negatives = [int(totals[name]) for name in ('n_values', 'n_missing', 'n_zeros', 'n_negatives')]
+        self.col_mean, self.col_min, self.col_max = totals['col_mean'], totals['col_min'], totals['col_max']
+        self.col_std = float(np.sqrt(totals['col_m2'] / (self.n_values - 1))) if self.n_values > 1 else None
+        self.n_unique = self.sketch.count()
+        self.unique_error = self.sketch.error
+        self.col_median = None
+        value_count = pd.DataFrame(columns=['bin_start', 'bin_end', 'Count of Records'])
+        if not self.bins.empty:
+            bins = self.bins.sort_index()
+            cumulative = bins.cumsum().to_numpy()
+            position = (cumulative[-1] - 1) / 2
+            ranks = np.array([np.floor(position), np.ceil(position)])
+            i = np.searchsorted(cumulative, ranks, side='right')
+            before = np.where(i > 0, cumulative[i - 1], 0)
+            lower, upper = self.bin_origin + (bins.index.to_numpy()[i] + (ranks - before + 0.5) / bins.to_numpy()[i]) * self.bin_width
+            median = lower + (upper - lower) * (position - ranks[0])
+            self.col_median = float(min(max(median, totals['finite_min']), totals['finite_max']))
+            first, last = bins.index[0], bins.index[-1]
+            size = -(-(last - first + 1) // n_bins)
+            histogram = bins.groupby((bins.index - first) // size).sum().reindex(range((last - first) // size + 1), fill_value=0)
+            starts = self.bin_origin + (first + histogram.index.to_numpy() * size) * self.bin_width
+            value_count = pd.DataFrame({'bin_start': starts, 'bin_end': starts + size * self.bin_width, 'Count of Records': histogram.to_numpy()})
+        self.histogram = alt.Chart(value_count).mark_bar().encode(alt.X('bin_start', bin='binned', title=self.column_name), x2='bin_end', y='Count of Records').interactive()
+        self.set_frequent_values(self.top.get_top(end))
 
     def set_unique(self):
         """
@@ -140,7 +558,7 @@ class NumericColumn:
         Pseudo-Code
         --------------------
         -> Open a connection and a cursor for the passed database
-        -> Retreive the sql query to extract the number of unique values of the selected column of the Postgres table
+        -> Retreive the sql query to extract the number of unique values of the selected column of the Postgres table, or estimate it with a HyperLogLog sketch (PostgresConnector.count_distinct()) when it is approximated
         -> Pass the result to corresponding class attribute
 
         --------------------
@@ -151,7 +569,10 @@ class NumericColumn:
         """
         self.db.open_connection() 
         self.db.open_cursor()
-        self.n_unique = self.db.run_query(get_unique_query(self.schema_name, self.table_name, self.column_name))[0][0]
+        if self.distinct_precision is None:
+            self.n_unique = self.db.run_query(get_unique_query(self.schema_name, self.get_source_name(), self.column_name))[0][0]
+        else:
+            self.n_unique, self.unique_error = self.db.count_distinct(self.schema_name, self.get_source_name(), self.column_name, self.distinct_precision)
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -232,7 +653,7 @@ class NumericColumn:
         """
         self.db.open_connection() 
         self.db.open_cursor()
-        self.n_negatives = self.db.run_query(get_negative_number_query(self.schema_name, self.table_name, self.column_name))[0][0]
+        self.n_negatives = self.db.run_query(get_negative_number_query(self.schema_name, self.get_source_name(), self.column_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
         
@@ -288,7 +709,7 @@ class NumericColumn:
         """
         self.db.open_connection() 
         self.db.open_cursor()
-        self.col_std = self.db.run_query(get_std_query(self.schema_name, self.table_name, self.column_name))[0][0]
+        self.col_std = self.db.run_query(get_std_query(self.schema_name, self.get_source_name(), self.column_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
     
@@ -367,27 +788,36 @@ class NumericColumn:
         """
         self.col_median = self.serie.median()
 
-    def set_histogram(self):
+    def set_histogram(self, n_bins=50):
         """
         --------------------
         Description
         --------------------
-        -> set_histogram (method): Class method that computes the Altair histogram displaying the count for each bin value of a serie
+        -> set_histogram (method): Class method that computes the Altair histogram displaying the count for each bin value of a serie, binning the values with NumPy if the serie is loaded or in Postgres using a SQL query (get_histogram_query()) otherwise
 
         --------------------
         Parameters
         --------------------
         -> self: Reference to the current instance of the class
+        -> n_bins (int): Maximum number of bins of the histogram (default: 50)
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Open a database connection and cursor 
-        -> Retreive the values counts from the Pandas series and convert to a Pandas dataframe
-        -> Create a Pandas dataframe and load values and value count
-        -> Create an Altair barchart using the dataframe
+        -> If the Pandas series is loaded:
+            -> Compute the counts and bin edges of its finite values (read from the Arrow array as float64 if it is Arrow-backed) with the histogram function of NumPy
+        -> Else:
+            -> Retreive the minimum and maximum of the column (set_summary()) if they have not been computed yet
+            -> Open a database connection and cursor
+            -> If the minimum or maximum is NaN or infinite, retreive the minimum and maximum of the finite values instead (get_finite_range_query()) and exclude the other values from the bins
+            -> If the column has finite values:
+                -> If the minimum is equal to the maximum, use a single bin
+                -> Retreive the count of values per bin with the sql query
+                -> Compute the bin edges from the minimum, maximum and number of bins (get_histogram_bins())
+            -> Close the cursor and connection
+        -> Create a Pandas dataframe with the start, end and count of records of every bin
+        -> Create an Altair barchart from the already binned dataframe
         -> Store barchart in the corresponding class attribute
-        -> Close the cursor and connection to the database
 
         --------------------
         Returns
@@ -395,38 +825,130 @@ class NumericColumn:
         -> None
 
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame()
-        value_count = pd.DataFrame()
-        value_count['id'] = pd.to_numeric(counts.index)
-        value_count['Count of Records'] = counts.values
-        self.histogram = alt.Chart(value_count).mark_bar().encode(alt.X("id", bin=alt.Bin(maxbins=50)), y='Count of Records').interactive()
-        self.db.close_cursor()
-        self.db.close_connection()
+        value_count = pd.DataFrame(columns=['bin_start', 'bin_end', 'Count of Records'])
+        if not self.serie.empty:
+            values = pd.Series(self.serie.dropna().to_numpy(dtype='float64')) if is_arrow_serie(self.serie) else pd.to_numeric(self.serie).dropna()
+            if not values.empty:
+                values = values[np.isfinite(values)]
+                counts, edges = np.histogram(values, bins=n_bins)
+                value_count = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'Count of Records': counts})
+        else:
+            if self.n_values is None:
+                self.set_summary()
+            if self.n_values:
+                col_min = float(self.col_min)
+                col_max = float(self.col_max)
+                finite_only = not (np.isfinite(col_min) and np.isfinite(col_max))
+                self.db.open_connection()
+                self.db.open_cursor()
+                if finite_only:
+                    bounds = self.db.run_query(get_finite_range_query(self.schema_name, self.get_source_name(), self.column_name))
+                    col_min, col_max = (float(bound) if pd.notna(bound) else None for bound in bounds.iloc[0])
+                if col_min is not None:
+                    if col_min == col_max:
+                        n_bins = 1
+                        col_max = col_min + 1
+                    counts = self.db.run_query(get_histogram_query(self.schema_name, self.get_source_name(), self.column_name, col_min, col_max, n_bins, finite_only))
+                    value_count = self.get_histogram_bins(counts, col_min, col_max, n_bins)
+                self.db.close_cursor()
+                self.db.close_connection()
+        self.histogram = alt.Chart(value_count).mark_bar().encode(alt.X('bin_start', bin='binned', title=self.column_name), x2='bin_end', y='Count of Records').interactive()
+
+    async def set_histogram_async(self, adb, n_bins=50):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_histogram_async (method): Coroutine version of the Postgres branch of set_histogram() that counts the values per bin with the same SQL query (get_histogram_query()) on an AsyncPostgresConnector, so that a column gets the same bins whichever way it is profiled
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> adb (AsyncPostgresConnector): Asynchronous connector on which the SQL queries are run
+        -> n_bins (int): Maximum number of bins of the histogram (default: 50)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> If the column has non-missing values (set_summary_values() having been called):
+            -> If the minimum or maximum is NaN or infinite, retreive the minimum and maximum of the finite values instead (get_finite_range_query()) and exclude the other values from the bins
+            -> If the column has finite values, retreive the count of values per bin with the sql query and compute the bin edges (get_histogram_bins()), using a single bin if the minimum is equal to the maximum
+        -> Create an Altair barchart from the binned dataframe and store it in the corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        value_count = pd.DataFrame(columns=['bin_start', 'bin_end', 'Count of Records'])
+        if self.n_values:
+            col_min = float(self.col_min)
+            col_max = float(self.col_max)
+            finite_only = not (np.isfinite(col_min) and np.isfinite(col_max))
+            if finite_only:
+                bounds = await adb.run_query(get_finite_range_query(self.schema_name, self.get_source_name(), self.column_name))
+                col_min, col_max = (float(bound) if pd.notna(bound) else None for bound in bounds.iloc[0])
+            if col_min is not None:
+                if col_min == col_max:
+                    n_bins = 1
+                    col_max = col_min + 1
+                counts = await adb.run_query(get_histogram_query(self.schema_name, self.get_source_name(), self.column_name, col_min, col_max, n_bins, finite_only))
+                value_count = self.get_histogram_bins(counts, col_min, col_max, n_bins)
+        self.histogram = alt.Chart(value_count).mark_bar().encode(alt.X('bin_start', bin='binned', title=self.column_name), x2='bin_end', y='Count of Records').interactive()
+
+    def get_histogram_bins(self, counts, col_min, col_max, n_bins):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_histogram_bins (method): Class method that converts the count of values per bin number returned by the SQL query of get_histogram_query() into the start, end and count of records of every bin
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> counts (pd.DataFrame): Result of the histogram query, with the bin numbers (1 to n_bins) in the first column and their counts in the second
+        -> col_min (float): Lower bound of the first bin
+        -> col_max (float): Upper bound of the last bin
+        -> n_bins (int): Number of bins
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Compute the width of the bins and the start and end of every bin from its number
 
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Start, end and count of records of every bin
+
+        """
+        width = (col_max - col_min) / n_bins
+        return pd.DataFrame({'bin_start': col_min + (counts[0] - 1) * width, 'bin_end': col_min + counts[0] * width, 'Count of Records': counts[1]})
 
     def set_frequent(self, end=20):
         """
         --------------------
         Description
         --------------------
-        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie
+        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie, counted in Postgres or approximated with a fixed number of counters from the values streamed from Postgres
 
         --------------------
         Parameters
         --------------------
         -> self: Reference to the current instance of the class
+        -> end (int): Number of most frequent values (default: 20)
 
         --------------------
         Pseudo-Code
         --------------------
-        -> Open a database connection and cursor 
-        -> Retreive the top 20 values occurences from the Pandas series and convert to a Pandas dataframe
-        -> Calculate the percentages and retreive the top 20 percentage values from the Pandas series and convert to a Pandas dataframe
-        -> Create a Pandas dataframe and load values, occurences and percentages
-        -> Store dataframe in the corresponding class attribute
+        -> Open a database connection and cursor
+        -> If the most frequent values are approximated, add the chunks of non-missing values streamed from a server-side cursor to a SpaceSaving summary of frequent_capacity counters (count_top_values()) and retrieve its top values with their occurrences and percentages
+        -> Otherwise retrieve the top values with their occurences and percentages in a single scan using a SQL query (get_top_values_query())
         -> Close the cursor and connection to the database
+        -> Store them in the corresponding class attribute (set_frequent_values())
 
         --------------------
         Returns
@@ -436,15 +958,127 @@ class NumericColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame().head(end)
-        percentages = round(self.serie.value_counts(normalize=True).to_frame().head(end), 4)
-        value_count = pd.DataFrame()
-        value_count['value'] = pd.to_numeric(counts.index)
-        value_count['occurrence'] = counts.values
-        value_count['percentage'] = percentages.values
-        self.frequent = value_count
+        if self.frequent_capacity is not None:
+            top = self.db.count_top_values(self.schema_name, self.get_source_name(), self.column_name, self.frequent_capacity).get_top(end)
+        else:
+            top = read_top_values(self.db.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.column_name, end)))
         self.db.close_cursor()
         self.db.close_connection()
+        self.set_frequent_values(top)
+
+    def set_frequent_values(self, value_count):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_frequent_values (method): Class method that stores the most frequent values of the column with numeric values
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> value_count (pd.DataFrame): Most frequent values with their occurrences and percentages (read_top_values() or SpaceSaving.get_top())
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Convert the values to numbers
+        -> Store dataframe in the corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        value_count['value'] = pd.to_numeric(value_count['value'])
+        self.frequent = value_count
+
+    def set_catalog_stats(self, stats, n_bins=50):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_catalog_stats (method): Class method that sets the estimated number of unique and missing values, minimum, maximum, most frequent values and histogram of a column from its planner statistics (Dataset.get_column_stats()) without scanning it
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+        -> stats (dict): Estimated profile of the column read from pg_stats
+        -> n_bins (int): Maximum number of bins of the histogram when the column only has most common values (default: 50)
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Flag the column as estimated and pass the estimated number of unique, missing and non-missing values to the corresponding class attributes
+        -> Convert the most common values and the histogram bounds to numbers and take the minimum and maximum over both
+        -> Create a Pandas dataframe with the most common values, their estimated occurrences and percentages
+        -> If there are histogram bounds, use them as bin edges, every bin holding the same share of rows plus the most common values falling in it
+        -> Else bin the most common values weighted by their occurrences with the histogram function of NumPy
+        -> Create an Altair barchart from the binned dataframe and store it in the corresponding class attribute
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.estimated = True
+        self.n_unique = stats['n_unique']
+        self.n_missing = stats['n_missing']
+        self.n_values = stats['n_rows'] - stats['n_missing']
+        values = pd.to_numeric(pd.Series(stats['values'], dtype=object))
+        bounds = pd.to_numeric(pd.Series(stats['bounds'], dtype=object))
+        all_values = pd.concat([values, bounds])
+        if not all_values.empty:
+            self.col_min = all_values.min()
+            self.col_max = all_values.max()
+        self.frequent = pd.DataFrame({'value': values, 'occurrence': stats['occurrences'], 'percentage': stats['percentages']})
+        value_count = pd.DataFrame(columns=['bin_start', 'bin_end', 'Count of Records'])
+        if len(bounds) > 1:
+            edges = bounds.to_numpy()
+            counts = stats['n_histogram'] + np.histogram(values, bins=edges, weights=stats['occurrences'])[0]
+            value_count = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'Count of Records': np.round(counts)})
+        elif not values.empty:
+            counts, edges = np.histogram(values, bins=min(n_bins, len(values)), weights=stats['occurrences'])
+            value_count = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'Count of Records': counts})
+        self.histogram = alt.Chart(value_count).mark_bar().encode(alt.X('bin_start', bin='binned', title=self.column_name), x2='bin_end', y='Count of Records').interactive()
+
+    def get_estimate_df(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_estimate_df (method): Class method that formats the information estimated from the planner statistics (set_catalog_stats()) as a Pandas dataframe with 2 columns: Description and Value
+
+        --------------------
+        Parameters
+        --------------------
+        -> self: Reference to the current instance of the class
+
+        --------------------
+        Pseudo-Code
+        --------------------
+        -> Create an empty Pandas datframe
+        -> Add row descriptions marked as estimates and values of the estimated class attributes
+
+        --------------------
+        Returns
+        --------------------
+        -> summary(Pandas.dataframe): A dataset containing two columns which can be used in a streamlit table function
+
+        """
+        summary = pd.DataFrame()
+        summary['Description'] = ['Number of Unique Values (estimate)',
+                                  'Number of Rows with Missing Values (estimate)',
+                                  'Minimum Value (estimate)',
+                                  'Maximum Value (estimate)']
+        summary['Value'] = ['{:,.0f}'.format(self.n_unique),
+                            '{:,.0f}'.format(self.n_missing),
+                            '{:,.3f}'.format(self.col_min) if self.col_min is not None else str(None),
+                            '{:,.3f}'.format(self.col_max) if self.col_max is not None else str(None)]
+        return summary
 
     def get_summary_df(self):
         """
@@ -480,7 +1114,7 @@ class NumericColumn:
                                   'Minimum Value', 
                                   'Maximum Value', 
                                   'Median Value',]
-        summary['Value'] = ['{:,.0f}'.format(self.n_unique), 
+        summary['Value'] = [format_distinct_count(self.n_unique, self.unique_error, '{:,.0f}'), 
                             '{:,.0f}'.format(self.n_missing), 
                             '{:,.0f}'.format(self.n_zeros), 
                             '{:,.0f}'.format(self.n_negatives), 
@@ -1,3 +1,5 @@
+from src.database.queries import get_distinct_count
+
 def get_negative_number_query(schema_name, table_name, col_name):
     """
     --------------------
@@ -80,4 +82,156 @@ def get_unique_query(schema_name, table_name, col_name):
 
     """
     query = f"select count(distinct {col_name}) from {schema_name}.{table_name}"
-    return query
\ No newline at end of file
+    return query
+
+def get_summary_query(schema_name, table_name, col_name, precision=None, server_hll=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_summary_query (method): Function that returns the query used for computing every summary statistic of a numeric column from a Postgres table in a single scan
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): The name of the database schema
+    -> table_name (str): The name of the table containing the required column. 
+    -> col_name (str): The column being analysed 
+    -> precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch estimating the number of unique values, None for an exact count (optional)
+    -> server_hll (bool): Whether the sketch is built in the database by the hll extension, the number of unique values being NULL otherwise (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Construct query using passed parameters, returning in this order: number of non-missing values, number of unique values (get_distinct_count()), number of missing values, average, standard deviation, minimum, maximum, median, number of zeros and number of negative values
+
+    --------------------
+    Returns
+    --------------------
+    -> query (str): Constructed query used to determine all the summary statistics for passed schema, table and column
+
+    """
+    query = f"select count({col_name}), {get_distinct_count(col_name, precision, server_hll)}, count(*) filter (where {col_name} is null), avg({col_name}), stddev({col_name}), min({col_name}), max({col_name}), percentile_cont(0.5) within group (order by {col_name}), count(*) filter (where {col_name} = 0), count(*) filter (where {col_name} < 0) from {schema_name}.{table_name}"
+    return query
+
+def get_finite_range_query(schema_name, table_name, col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_finite_range_query (method): Function that returns the query used for computing the minimum and maximum of the finite values of a floating-point or numeric column from a Postgres table (NaN and infinite values excluded)
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): The name of the database schema
+    -> table_name (str): The name of the table containing the required column. 
+    -> col_name (str): The column being analysed 
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Construct query using passed parameters
+
+    --------------------
+    Returns
+    --------------------
+    -> query (str): Constructed query used to determine the minimum and maximum finite values for passed schema, table and column
+
+    """
+    query = f"select min({col_name}), max({col_name}) from {schema_name}.{table_name} where {col_name} not in ('NaN', 'Infinity', '-Infinity')"
+    return query
+
+def get_histogram_query(schema_name, table_name, col_name, col_min, col_max, n_bins=50, finite_only=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_histogram_query (method): Function that returns the query used for counting the values of a numeric column from a Postgres table in equal-width bins between its minimum and maximum
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): The name of the database schema
+    -> table_name (str): The name of the table containing the required column. 
+    -> col_name (str): The column being analysed 
+    -> col_min (float): The minimum value of the column (lower bound of the first bin)
+    -> col_max (float): The maximum value of the column (upper bound of the last bin)
+    -> n_bins (int): The number of bins (default: 50)
+    -> finite_only (bool): Whether NaN and infinite values are excluded, which width_bucket() cannot place in a bin (only for floating-point and numeric columns) (default: False)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Construct query using passed parameters, assigning every non-missing value (and finite if finite_only is True) to a bin with width_bucket() (the maximum value is kept in the last bin) and counting the values per bin
+
+    --------------------
+    Returns
+    --------------------
+    -> query (str): Constructed query used to determine the number of values per bin (1 to n_bins) for passed schema, table and column
+
+    """
+    condition = f"{col_name} not in ('NaN', 'Infinity', '-Infinity')" if finite_only else f"{col_name} is not null"
+    query = f"select least(width_bucket({col_name}, {col_min}, {col_max}, {n_bins}), {n_bins}) as bin, count(*) from {schema_name}.{table_name} where {condition} group by 1 order by 1"
+    return query
+
+def get_refresh_aggregates(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_refresh_aggregates (method): Function that returns the SQL aggregates of a numeric column kept by the incremental refresh of its profile, which can be merged from one scan to the next (scan_column())
+
+    --------------------
+    Parameters
+    --------------------
+    -> col_name (str): The column being analysed 
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Return the number of missing values, the average and the sum of the squared deviations from it (merged with the formula of Chan et al.), the minimum and maximum, the number of zero and negative values and the minimum and maximum of the finite values, as float8 to be compared and merged in Python
+
+    --------------------
+    Returns
+    --------------------
+    -> aggregates (list): SQL aggregates of the column
+
+    """
+    finite = f"{col_name}::float8 not in ('NaN', 'Infinity', '-Infinity')"
+    aggregates = [f"count(*) filter (where {col_name} is null)", f"avg({col_name})::float8", f"(var_pop({col_name}) * count({col_name}))::float8",
+                  f"min({col_name})::float8", f"max({col_name})::float8", f"count(*) filter (where {col_name} = 0)", f"count(*) filter (where {col_name} < 0)",
+                  f"min({col_name}::float8) filter (where {finite})", f"max({col_name}::float8) filter (where {finite})"]
+    return aggregates
+
+def get_bins_query(schema_name, table_name, col_name, origin, width, condition=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_bins_query (method): Function that returns the query used for counting the finite values of a numeric column from a Postgres table in the bins of width width starting from origin, so that the counts of several scans can be added
+
+    --------------------
+    Parameters
+    --------------------
+    -> schema_name (str): The name of the database schema
+    -> table_name (str): The name of the table containing the required column. 
+    -> col_name (str): The column being analysed 
+    -> origin (float): The lower bound of the bin 0
+    -> width (float): The width of the bins
+    -> condition (str): WHERE condition selecting the rows to be counted, every row if None (optional)
+
+    --------------------
+    Pseudo-Code
+    --------------------
+    -> Construct query using passed parameters, numbering the bin of every finite value from origin (negative below it) and counting the values per bin
+
+    --------------------
+    Returns
+    --------------------
+    -> query (str): Constructed query used to determine the number of values per bin number for passed schema, table and column
+
+    """
+    where = f" and {condition}" if condition else ""
+    query = f"select floor(({col_name}::float8 - {float(origin)!r}) / {float(width)!r})::bigint, count(*) from {schema_name}.{table_name} where {col_name}::float8 not in ('NaN', 'Infinity', '-Infinity'){where} group by 1"
+    return query
@@ -1,7 +1,8 @@
 import streamlit as st
 
-from src.serie_text.logics import TextColumn
-from src.dataframe.logics import Dataset
+from src.config import get_column_profile, set_column_profile, display_refresh_profile
+from src.database.logics import profile_columns, COLUMN_ENGINE
+from src.serie_text.logics import TextColumn, profile_text_columns
 from src.dataframe.queries import get_text_tables_query
 
 def display_texts():
@@ -9,37 +10,87 @@ def display_texts():
     --------------------
     Description
     --------------------
-    -> display_texts (function): Function that displays all the relevant information for every text column of a table
+    -> display_texts (function): Function that displays all the relevant information for every text column of a table, computed on demand per column or for all the text columns in a single scan of the table (profile_text_columns()) followed by loading the columns concurrently (profile_columns())
 
     """
     schema_name = st.session_state['schema_selected']
     table_name = st.session_state['table_selected']
     db = st.session_state['db']
-    Data_all = Dataset(schema_name, table_name, db=db)
-    Data_all.set_data()
+    Data_all = st.session_state['data']
     text_cols = Data_all.text_cols
     if text_cols is not None:
+        if st.button('Profile all text columns', key='text_profile_all'):
+            missing_cols = [column for column in text_cols if get_column_profile('text', column) is None]
+            text_columns = profile_text_columns(schema_name, table_name, missing_cols, db, sample_percent=st.session_state.get('sample_percent'), distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity'))
+            errors = []
+            for text_column in profile_columns(text_columns, db, errors=errors):
+                set_column_profile('text', text_column.col_name, text_column)
+            for text_column, error in errors:
+                st.error(f"Column {text_column.col_name} could not be profiled: {error}")
         for idx, column in enumerate(text_cols):
             with st.expander(f"{idx+1}. column: {column}"):
                 display_text(column, idx)
 
 
+def get_text_profile(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_text_profile (function): Function that returns the memoized TextColumn of a column, instantiating it and computing its information on the first call
+
+
+    """
+    Data = get_column_profile('text', col_name)
+    if Data is None:
+        schema_name = st.session_state['schema_selected']
+        table_name = st.session_state['table_selected']
+        Data = TextColumn(schema_name, table_name, col_name, db=st.session_state['db'], sample_percent=st.session_state.get('sample_percent'), engine=COLUMN_ENGINE, distinct_precision=st.session_state.get('distinct_precision'), frequent_capacity=st.session_state.get('frequent_capacity'))
+        Data.set_data()
+        set_column_profile('text', col_name, Data)
+    return Data
+
+
 def display_text(col_name, i):
     """
     --------------------
     Description
     --------------------
-    -> display_text (function): Function that instantiates a TextColumn class from a dataframe column and displays all the relevant information for a single text column of a table
+    -> display_text (function): Function that displays all the relevant information for a single text column of a table once it has been profiled (on demand, with a button), and the estimates from the planner statistics until then (display_text_estimate())
 
 
     """
-    schema_name = st.session_state['schema_selected']
-    table_name = st.session_state['table_selected']
-    db = st.session_state['db']
-    Data = TextColumn(schema_name, table_name, col_name, db=db)
-    Data.set_data()
+    if get_column_profile('text', col_name) is None and not st.button('Profile column', key=f'text_profile_{i}'):
+        display_text_estimate(col_name)
+        return
+    Data = get_text_profile(col_name)
+    display_refresh_profile(Data, key=f'text_refresh_{i}')
+    if Data.sample_percent:
+        st.caption(f"Profiled on a {Data.sample_percent}% sample of the table (TABLESAMPLE SYSTEM).")
     st.table(data=Data.get_summary_df())
     st.subheader('Bar Chart')
     st.altair_chart(Data.barchart, use_container_width=True)
     st.subheader('Most Frequent Values')
-    st.dataframe(data=Data.frequent)
\ No newline at end of file
+    st.dataframe(data=Data.frequent)
+
+
+def display_text_estimate(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> display_text_estimate (function): Function that displays the information of a single text column estimated from the planner statistics of the table (Dataset.get_column_stats()), without scanning the column
+
+
+    """
+    stats = st.session_state['data'].get_column_stats().get(col_name)
+    if stats is None:
+        return
+    Data = TextColumn(st.session_state['schema_selected'], st.session_state['table_selected'], col_name, db=st.session_state['db'])
+    Data.set_catalog_stats(stats)
+    st.caption('Estimated from the planner statistics (pg_stats) without scanning the column. Profile the column for exact values.')
+    st.table(data=Data.get_estimate_df())
+    st.subheader('Bar Chart')
+    st.altair_chart(Data.barchart, use_container_width=True)
+    st.subheader('Most Frequent Values')
+    st.dataframe(data=Data.frequent)
@@ -1,10 +1,13 @@
+import asyncio
 import streamlit as st
 import pandas as pd
 import altair as alt
 
-from src.database.logics import PostgresConnector
-from src.serie_text.queries import get_mode_query, get_alpha_query, get_whitespace, get_lowercase, get_uppercase, get_digit, get_missing_query
-from src.serie_date.queries import get_column_query
+from src.database.logics import PostgresConnector, IncrementalState, HyperLogLog, merge_totals, scan_column, read_registers, sketch_serie, format_distinct_count, read_top_values
+from src.serie_text.queries import get_mode_query, get_alpha_query, get_whitespace, get_lowercase, get_uppercase, get_digit, get_missing_query, get_profile_query, get_refresh_aggregates
+from src.database.queries import get_sampled_table_name, get_top_values_query, get_hll_registers_query
+
+REFRESH_TOTALS = {'n_values': 'sum', 'n_missing': 'sum', 'n_whitespace': 'sum', 'n_lowercase': 'sum', 'n_uppercase': 'sum', 'n_alphabet': 'sum', 'n_digit': 'sum'}
 
 class TextColumn:
     """
@@ -32,9 +35,20 @@ class TextColumn:
     -> n_digit (int): Number of times a serie has only digit characters (optional)
     -> barchart (int): Altair barchart displaying the count for each value of a serie (optional)
     -> frequent (int): Datframe containing the most frequest value of a serie (optional)
+    -> estimated (bool): Whether the values come from the planner statistics (pg_stats) instead of a scan of the column (optional)
+    -> sample_percent (float): Percentage of the table sampled with TABLESAMPLE SYSTEM for computing the values, the whole table if None (optional)
+    -> engine (str): Extraction backend used for loading the values of the column, 'fetchall' or 'arrow' to load them as an Arrow-backed series processed with pyarrow.compute (optional)
+    -> watermark_column (str): Name of a column whose value increases in the order the rows are committed, used by refresh() to select the new rows instead of their xmin (optional)
+    -> state (IncrementalState): Position of the last scan of refresh() (optional)
+    -> totals (dict): Number of values, missing values and values of every character class of the column merged by refresh() (REFRESH_TOTALS) (optional)
+    -> sketch (HyperLogLog): Sketch of the values of the column merged by refresh() (optional)
+    -> top (SpaceSaving): Summary of the most frequent values of the column merged by refresh(), from which the mode, the barchart and the most frequent values are derived (optional)
+    -> distinct_precision (int): Base-2 logarithm of the number of registers of the HyperLogLog sketch estimating the number of unique values, None to count them exactly (optional)
+    -> unique_error (float): Relative standard error of n_unique, None if it is exact (optional)
+    -> frequent_capacity (int): Number of counters of the SpaceSaving summary finding the most frequent values in the loaded serie, None to count them exactly in Postgres (optional)
 
     """
-    def __init__(self, schema_name=None, table_name=None, col_name=None, db=None, serie=None):
+    def __init__(self, schema_name=None, table_name=None, col_name=None, db=None, serie=None, sample_percent=None, engine='fetchall', watermark_column=None, distinct_precision=None, frequent_capacity=None):
         self.schema_name = schema_name
         self.table_name = table_name
         self.col_name = col_name
@@ -52,33 +66,174 @@ class TextColumn:
         self.barchart = None
         self.frequent = None
         self.n_mode = None
+        self.estimated = False
+        self.sample_percent = sample_percent
+        self.engine = engine
+        self.watermark_column = watermark_column
+        self.state = None
+        self.totals = None
+        self.sketch = None
+        self.top = None
+        self.distinct_precision = distinct_precision
+        self.unique_error = None
+        self.frequent_capacity = frequent_capacity
     
     def set_data(self):
         """
         --------------------
         Description
         --------------------
-        -> set_data (method): Class method that computes all requested information from self.serie to be displayed in the Text section of Streamlit app 
+        -> set_data (method): Class method that computes all requested information to be displayed in the Text section of Streamlit app without loading the column
+        (the SQL counts are computed in a single scan by set_profile(), unless they have already been computed for several columns at once by profile_text_columns(), and the barchart is drawn from the most frequent values)
+        """
+        if self.n_missing is None:
+            self.set_profile()
+
+        self.set_unique_sketch()
+        self.set_empty()
+        self.set_frequent()
+        self.set_barchart()
+        self.get_summary_df()
+
+    async def set_data_async(self, adb):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_async (method): Coroutine version of set_data() that runs its SQL queries concurrently on an AsyncPostgresConnector, so that several columns can be profiled concurrently (profile_columns())
+
+        """
+        queries = [adb.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.col_name))]
+        if self.n_missing is None:
+            queries.append(adb.run_query(get_profile_query(self.schema_name, self.get_source_name(), [self.col_name], self.distinct_precision)))
+        sketch_needed = self.distinct_precision is not None and pd.isna(self.n_unique)
+        if sketch_needed:
+            queries.append(adb.run_query(get_hll_registers_query(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision)))
+        top, *results = await asyncio.gather(*queries)
+        registers = results.pop() if sketch_needed else None
+        if self.n_missing is None:
+            self.set_profile_values(results.pop().iloc[0].tolist())
+
+        if sketch_needed:
+            self.n_unique = read_registers(registers, self.distinct_precision).count()
+        self.set_empty()
+        self.frequent = read_top_values(top)
+        self.set_barchart()
+        self.get_summary_df()
+
+    def get_source_name(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_source_name (method): Class method that returns the name of the table read by the SQL queries, followed by a TABLESAMPLE clause when the column is profiled on a sample (get_sampled_table_name())
+
+        """
+        return get_sampled_table_name(self.table_name, self.sample_percent)
+
+    def set_profile(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_profile (method): Class method that computes the number of missing and unique values, the mode and the number of whitespace, lowercase, uppercase, alphabetical and digit values of a serie in a single scan using a SQL query (get_profile_query())
+
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.serie = self.db.run_query(get_column_query(self.schema_name, self.table_name, self.col_name))[0].squeeze()
+        server_hll = self.distinct_precision is not None and self.db.has_extension('hll')
+        row = self.db.run_query(get_profile_query(self.schema_name, self.get_source_name(), [self.col_name], self.distinct_precision, server_hll)).iloc[0]
         self.db.close_cursor()
         self.db.close_connection()
+        self.set_profile_values(row.tolist())
+
+    def set_profile_values(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_profile_values (method): Class method that stores the 8 values computed for the serie by the query of get_profile_query() in the corresponding class attributes, along with the standard error of the number of unique values when it is approximated
+
+        """
+        self.n_missing, self.n_unique, self.n_mode, self.n_whitespace, self.n_lowercase, self.n_uppercase, self.n_alphabet, self.n_digit = values
+        self.unique_error = HyperLogLog.get_error(self.distinct_precision) if self.distinct_precision is not None else None
+
+    def set_local_values(self, profile):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_local_values (method): Class method that stores the profile of the serie computed in pandas from the loaded rows of the table (profile_series() of ProcessProfiler) in the same class attributes as set_data(), the number of unique values being counted exactly
 
-        self.is_serie_none()
-        self.set_unique()
-        self.set_missing()
+        """
+        self.distinct_precision = None
+        self.set_profile_values([profile[name] for name in ('n_missing', 'n_unique', 'n_mode', 'n_whitespace', 'n_lowercase', 'n_uppercase', 'n_alphabet', 'n_digit')])
         self.set_empty()
-        self.set_mode()
-        self.set_whitespace()
-        self.set_lowercase()
-        self.set_uppercase()
-        self.set_alphabet()
-        self.set_digit()
+        self.frequent = profile['frequent'].copy()
         self.set_barchart()
-        self.set_frequent()
-        self.get_summary_df()
+
+    def set_unique_sketch(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_unique_sketch (method): Class method that estimates the number of unique values with a HyperLogLog sketch fed by the chunks of values streamed from a server-side cursor (PostgresConnector.count_distinct()), when it is approximated and has not been estimated by the hll extension
+
+        """
+        if self.distinct_precision is not None and pd.isna(self.n_unique):
+            self.db.open_connection()
+            self.db.open_cursor()
+            self.n_unique = self.db.count_distinct(self.schema_name, self.get_source_name(), self.col_name, self.distinct_precision)[0]
+            self.db.close_cursor()
+            self.db.close_connection()
+
+    def refresh(self, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        -> refresh (method): Class method that profiles the whole column from a state whose size does not grow with the number of rows or unique values (counters, HyperLogLog registers and most frequent values computed in Postgres), only scanning the rows appended since the previous refresh and merging them into the previous state as long as no row of the table has been updated or deleted (IncrementalState)
+
+        """
+        if self.state is None or self.state.watermark_column != self.watermark_column:
+            self.state = IncrementalState(self.schema_name, self.table_name, self.watermark_column)
+        position = self.state.refresh(self.db, self.scan_rows)
+        self.state.set_position(*position)
+        self.serie = pd.Series(dtype=object)
+        self.sample_percent = None
+        self.set_totals_values(end)
+
+    def scan_rows(self, condition):
+        """
+        --------------------
+        Description
+        --------------------
+        -> scan_rows (method): Class method that computes in Postgres the counters (get_refresh_aggregates()), the registers of a sketch of distinct_precision (or 14) and the frequent_capacity (or 1000) most frequent values of the rows of the column matching a condition (scan_column()), merges them into the state of refresh() if the scan is incremental (merge_totals()) and returns the position of the scan
+
+        """
+        position, values, sketch, top = scan_column(self.db, self.schema_name, self.table_name, self.col_name, get_refresh_aggregates(self.col_name), condition, self.watermark_column, self.distinct_precision or 14, self.frequent_capacity or 1000)
+        totals = dict(zip(REFRESH_TOTALS, values))
+        if self.state.incremental:
+            totals, sketch, top = merge_totals(self.totals, totals, REFRESH_TOTALS), sketch.merge(self.sketch), top.merge(self.top)
+        self.totals, self.sketch, self.top = totals, sketch, top
+        return position
+
+    def set_totals_values(self, end=20):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_totals_values (method): Class method that computes the number of missing values, the number of values of every character class, the estimated number of unique values, the mode, the barchart and the most frequent values of the column from the state merged by refresh(), the last three from the tracked values
+
+        """
+        self.n_missing = self.n_empty = int(self.totals['n_missing'])
+        self.n_whitespace, self.n_lowercase, self.n_uppercase, self.n_alphabet, self.n_digit = [int(self.totals[name]) for name in ('n_whitespace', 'n_lowercase', 'n_uppercase', 'n_alphabet', 'n_digit')]
+        self.n_unique = self.sketch.count()
+        self.unique_error = self.sketch.error
+        value_c = self.top.get_top(self.top.capacity)
+        self.n_mode = value_c['value'].iloc[0] if not value_c.empty else None
+        self.barchart = alt.Chart(value_c[['value', 'occurrence']]).mark_bar().encode(x='value', y='occurrence')
+        self.frequent = value_c.head(end)
 
     def is_serie_none(self):
         """
@@ -90,15 +245,29 @@ class TextColumn:
         """
         return self.serie.empty
 
+    def get_memory_usage(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_memory_usage (method): Class method that computes the number of bytes used by the Pandas series and dataframes of the profile, so that it can be kept in a cache with a memory cap (DatasetCache)
+
+        """
+        return int(sum(pd.DataFrame(value).memory_usage(deep=True).sum() for value in vars(self).values() if isinstance(value, (pd.Series, pd.DataFrame))))
+
     def set_unique(self):
         """
         --------------------
         Description
         --------------------
-        -> set_unique (method): Class method that computes the number of unique value of a serie
+        -> set_unique (method): Class method that computes the number of unique value of a serie, or estimates it with a HyperLogLog sketch (sketch_serie()) when it is approximated
 
         """
-        self.n_unique = self.serie.nunique()
+        if self.distinct_precision is None:
+            self.n_unique = self.serie.nunique()
+        else:
+            sketch = sketch_serie(self.serie, self.distinct_precision)
+            self.n_unique, self.unique_error = sketch.count(), sketch.error
 
     def set_missing(self):
         """
@@ -110,7 +279,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_missing = self.db.run_query(get_missing_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_missing = self.db.run_query(get_missing_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -119,10 +288,10 @@ class TextColumn:
         --------------------
         Description
         --------------------
-        -> set_empty (method): Class method that computes the number of times a serie has empty value
+        -> set_empty (method): Class method that sets the number of times a serie has empty value, which are its missing values counted by the profile query (set_profile())
 
         """
-        self.n_empty = self.serie.isna().sum()
+        self.n_empty = self.n_missing
 
     def set_mode(self):
         """
@@ -134,7 +303,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_mode = self.db.run_query(get_mode_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_mode = self.db.run_query(get_mode_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -148,7 +317,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_whitespace = self.db.run_query(get_whitespace(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_whitespace = self.db.run_query(get_whitespace(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -162,7 +331,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_lowercase = self.db.run_query(get_lowercase(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_lowercase = self.db.run_query(get_lowercase(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -176,7 +345,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_uppercase = self.db.run_query(get_uppercase(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_uppercase = self.db.run_query(get_uppercase(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
     
@@ -190,7 +359,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_alphabet = self.db.run_query(get_alpha_query(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_alphabet = self.db.run_query(get_alpha_query(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -204,7 +373,7 @@ class TextColumn:
         """
         self.db.open_connection()
         self.db.open_cursor()
-        self.n_digit = self.db.run_query(get_digit(self.schema_name, self.table_name, self.col_name))[0][0]
+        self.n_digit = self.db.run_query(get_digit(self.schema_name, self.get_source_name(), self.col_name))[0][0]
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -213,36 +382,25 @@ class TextColumn:
         --------------------
         Description
         --------------------
-        -> set_barchart (method): Class method that computes the Altair barchart displaying the count for each value of a serie
+        -> set_barchart (method): Class method that computes the Altair barchart displaying the count of the most frequent values of a serie (set_frequent()), so that its size does not grow with the number of unique values
 
         """
-        self.db.open_connection()
-        self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame()
-        value_c = pd.DataFrame()
-        value_c['value'] = counts.index
-        value_c['occurrence'] = counts.values
-        self.barchart = alt.Chart(value_c).mark_bar().encode(x='value', y='occurrence')
-        self.db.close_cursor()
-        self.db.close_connection()
+        self.barchart = alt.Chart(self.frequent[['value', 'occurrence']]).mark_bar().encode(x='value', y='occurrence')
 
     def set_frequent(self, end=20):
         """
         --------------------
         Description
         --------------------
-        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie
+        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie with their occurrences and percentages in a single scan using a SQL query (get_top_values_query()), or approximates them with a SpaceSaving summary of frequent_capacity counters fed by the chunks of values streamed from a server-side cursor (count_top_values())
 
         """
         self.db.open_connection()
         self.db.open_cursor()
-        counts = self.serie.value_counts().to_frame().head(end)
-        counts_perc = round(self.serie.value_counts(normalize=True).to_frame().head(end), 4)
-        value_c = pd.DataFrame()
-        value_c['value'] = counts.index
-        value_c['occurrence'] = counts.values
-        value_c['percentage'] = counts_perc.values
-        self.frequent = value_c
+        if self.frequent_capacity is not None:
+            self.frequent = self.db.count_top_values(self.schema_name, self.get_source_name(), self.col_name, self.frequent_capacity).get_top(end)
+        else:
+            self.frequent = read_top_values(self.db.run_query(get_top_values_query(self.schema_name, self.get_source_name(), self.col_name, end)))
         self.db.close_cursor()
         self.db.close_connection()
 
@@ -257,5 +415,57 @@ class TextColumn:
 
         summary = pd.DataFrame()
         summary['Description'] = ['Number of Unique Values', 'Number of Rows with Missing Values', 'Number of Empty values', 'Number of Whitespaces', 'Mode of Values','Number of lowercase', 'Number of uppercase', 'Number of Series with alphabetical characters', 'Number of Series with digit characters']
-        summary['Value'] = [str(self.n_unique), str(self.n_missing), str(self.n_empty), str(self.n_whitespace), str(self.n_mode), str(self.n_lowercase), str(self.n_uppercase), str(self.n_alphabet), str(self.n_digit)]
-        return summary
\ No newline at end of file
+        summary['Value'] = [format_distinct_count(self.n_unique, self.unique_error), str(self.n_missing), str(self.n_empty), str(self.n_whitespace), str(self.n_mode), str(self.n_lowercase), str(self.n_uppercase), str(self.n_alphabet), str(self.n_digit)]
+        return summary
+
+    def set_catalog_stats(self, stats):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_catalog_stats (method): Class method that sets the estimated number of unique and missing values, mode, most frequent values and barchart of a column from its planner statistics (Dataset.get_column_stats()) without scanning it
+
+        """
+        self.estimated = True
+        self.n_unique = stats['n_unique']
+        self.n_missing = stats['n_missing']
+        self.n_mode = stats['values'][0] if stats['values'] else None
+        value_c = pd.DataFrame()
+        value_c['value'] = stats['values']
+        value_c['occurrence'] = stats['occurrences']
+        value_c['percentage'] = stats['percentages']
+        self.frequent = value_c
+        self.barchart = alt.Chart(value_c).mark_bar().encode(x='value', y='occurrence')
+
+    def get_estimate_df(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_estimate_df (method): Class method that formats the information estimated from the planner statistics (set_catalog_stats()) as a Pandas dataframe with 2 columns: Description and Value
+
+        """
+        summary = pd.DataFrame()
+        summary['Description'] = ['Number of Unique Values (estimate)', 'Number of Rows with Missing Values (estimate)', 'Mode of Values (estimate)']
+        summary['Value'] = [str(self.n_unique), str(self.n_missing), str(self.n_mode)]
+        return summary
+
+def profile_text_columns(schema_name, table_name, col_names, db, sample_percent=None, distinct_precision=None, frequent_capacity=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_text_columns (function): Function that instantiates a TextColumn class for every text column of a table and computes their SQL counts for all the columns in a single scan of the table (get_profile_query())
+
+    """
+    text_columns = [TextColumn(schema_name, table_name, col_name, db=db, sample_percent=sample_percent, distinct_precision=distinct_precision, frequent_capacity=frequent_capacity) for col_name in col_names]
+    if col_names:
+        db.open_connection()
+        db.open_cursor()
+        server_hll = distinct_precision is not None and db.has_extension('hll')
+        row = db.run_query(get_profile_query(schema_name, get_sampled_table_name(table_name, sample_percent), col_names, distinct_precision, server_hll)).iloc[0].tolist()
+        db.close_cursor()
+        db.close_connection()
+        for idx, text_column in enumerate(text_columns):
+            text_column.set_profile_values(row[idx * 8:(idx + 1) * 8])
+    return text_columns
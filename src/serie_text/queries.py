@@ -1,5 +1,7 @@
 import statistics
 
+from src.database.queries import get_distinct_count
+
 def get_mode_query(schema_name, table_name, col_name):
     """
     --------------------
@@ -80,4 +82,32 @@ def get_missing_query(schema_name, table_name, col_name):
 """
     query = f"SELECT count(*) FROM {schema_name}.{table_name} where {col_name}  is NULL"
 
-    return query 
\ No newline at end of file
+    return query 
+
+def get_profile_query(schema_name, table_name, col_names, precision=None, server_hll=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_profile_query (method): Function that returns the query used for computing the number of missing and unique values, the mode and the number of whitespace, lowercase, uppercase, alphabetical and digit values of one or several text columns from a Postgres table in a single scan (the number of unique values being estimated with a HyperLogLog sketch of the given precision instead of counted exactly when precision is set, get_distinct_count())
+
+"""
+    columns_aggregates = []
+    for col_name in col_names:
+        columns_aggregates.append(f"count(*) filter (where {col_name} is null), {get_distinct_count(col_name, precision, server_hll)}, mode() within group (order by {col_name}), "
+                                  f"count(*) filter (where {col_name} ~ '^[[:space:]]*$'), count(*) filter (where {col_name} ~ '^[[:lower:]]*$'), "
+                                  f"count(*) filter (where {col_name} ~ '^[[:upper:]]*$'), count(*) filter (where {col_name} ~ '^[[:alpha:]]*$'), "
+                                  f"count(*) filter (where {col_name} ~ '^[[:digit:]]*$')")
+    query = f"SELECT {', '.join(columns_aggregates)} FROM {schema_name}.{table_name}"
+
+    return query
+
+def get_refresh_aggregates(col_name):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_refresh_aggregates (method): Function that returns the SQL aggregates of a text column kept by the incremental refresh of its profile, i.e. the number of missing values and of whitespace, lowercase, uppercase, alphabetical and digit values with the same patterns as get_profile_query(), which are added from one scan to the next (scan_column())
+"""
+    return [f"count(*) filter (where {col_name} is null)", f"count(*) filter (where {col_name} ~ '^[[:space:]]*$')", f"count(*) filter (where {col_name} ~ '^[[:lower:]]*$')",
+            f"count(*) filter (where {col_name} ~ '^[[:upper:]]*$')", f"count(*) filter (where {col_name} ~ '^[[:alpha:]]*$')", f"count(*) filter (where {col_name} ~ '^[[:digit:]]*$')"]
@@ -2,9 +2,13 @@ import unittest
 import pandas as pd
 import unittest
 import pandas as pd
+import time
+import psycopg2
+import numpy as np
+import asyncio
 import sqlalchemy as db
 
-from src.database.logics import PostgresConnector
+from src.database.logics import PostgresConnector, ConnectionPool, CatalogCache, AsyncPostgresConnector, profile_columns, is_arrow_serie, count_arrow_values, pa, merge_totals, read_top_summary, scan_column, IncrementalState, MAX_SEEN_XIDS, MIN_SAMPLE_PERCENT, HyperLogLog, get_bit_length, sketch_serie, SpaceSaving, sketch_top_values, read_top_values
 
 db_name = "postgres"
 db_host = "localhost"
@@ -278,6 +282,42 @@ class TestLoadTable(unittest.TestCase):
         result = postgresConnector.load_table(schema_name=schema_name, table_name=table_name)
         self.assertIsNone(result)
 
+    def test_iter_query_chunks_function_streams_two_queries_on_one_connection(self):
+        """
+        Test case to check that two streams open at the same time on one connection return the rows of their own query
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        first = postgresConnector.iter_query_chunks("SELECT employee_id FROM public.employees ORDER BY employee_id", itersize=100)
+        second = postgresConnector.iter_query_chunks("SELECT name FROM public.employees ORDER BY employee_id", itersize=100)
+        first_chunk, second_chunk = next(first), next(second)
+        first_rows = pd.concat([first_chunk] + list(first), ignore_index=True)
+        second_rows = pd.concat([second_chunk] + list(second), ignore_index=True)
+        postgresConnector.close_connection()
+        df_local = run_sql_query(engine=setup_local(), sql_query="SELECT employee_id, name FROM public.employees ORDER BY employee_id")
+        self.assertEqual(first_rows["employee_id"].tolist(), df_local["employee_id"].tolist())
+        self.assertEqual(second_rows["name"].tolist(), df_local["name"].tolist())
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_load_table_function_returns_arrow_backed_content_with_arrow_engine(self):
+        """
+        Test case to check that the load_table function returns the same content as Arrow-backed columns with the 'arrow' engine, and that their values are counted like with Pandas
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        expected_df = postgresConnector.load_table(schema_name="public", table_name="employees", engine='copy')
+        result_df = postgresConnector.load_table(schema_name="public", table_name="employees", engine='arrow')
+        empty_df = postgresConnector.run_query("SELECT * FROM public.employees WHERE false", engine='arrow')
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        self.assertTrue(all(is_arrow_serie(result_df[col]) for col in result_df.columns))
+        self.assertEqual(list(expected_df.columns), list(result_df.columns))
+        for col in ['employee_id', 'salary', 'name']:
+            self.assertEqual(expected_df[col].isna().sum(), result_df[col].isna().sum())
+            self.assertEqual(expected_df[col].value_counts().sort_index().to_dict(), count_arrow_values(result_df[col]).set_index('value')['occurrence'].sort_index().to_dict())
+        self.assertEqual((0, len(expected_df.columns)), empty_df.shape)
+
 class TestGetTableSchema(unittest.TestCase):
     """
     Class used for testing the get_table_schema method of the PostgresConnector class from database/logics.py
@@ -292,12 +332,32 @@ class TestGetTableSchema(unittest.TestCase):
         schema_name = "public"
         table_name = "employees"
         engine = setup_local()
-        df_local = run_sql_query(engine=engine, sql_query=f"SELECT c.table_name, c.column_name, c.data_type, CASE WHEN EXISTS(SELECT 1 FROM INFORMATION_SCHEMA.constraint_column_usage k WHERE c.table_name = k.table_name and k.column_name = c.column_name) THEN true ELSE false END as primary_key, c.is_nullable, c.character_maximum_length, c.numeric_precision FROM INFORMATION_SCHEMA.COLUMNS c WHERE c.table_schema='{schema_name}' AND c.table_name='{table_name}'")
+        df_local = run_sql_query(engine=engine, sql_query=f"SELECT c.relname AS table_name, a.attname AS column_name, format_type(a.atttypid, NULL) AS data_type, coalesce(k.primary_key, false) AS primary_key, CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable, information_schema._pg_char_max_length(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS character_maximum_length, information_schema._pg_numeric_precision(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS numeric_precision, coalesce(k.unique_key, false) AS unique_key, coalesce(k.foreign_key, false) AS foreign_key, i.attnum IS NOT NULL AS indexed FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_type t ON t.oid = a.atttypid LEFT JOIN (SELECT key.attnum, bool_or(con.contype = 'p') AS primary_key, bool_or(con.contype = 'u') AS unique_key, bool_or(con.contype = 'f') AS foreign_key FROM pg_constraint con CROSS JOIN unnest(con.conkey) AS key(attnum) WHERE con.conrelid = to_regclass('\"{schema_name}\".\"{table_name}\"') GROUP BY key.attnum) k ON k.attnum = a.attnum LEFT JOIN (SELECT DISTINCT unnest(ix.indkey::int2[]) AS attnum FROM pg_index ix WHERE ix.indrelid = to_regclass('\"{schema_name}\".\"{table_name}\"')) i ON i.attnum = a.attnum WHERE a.attrelid = to_regclass('\"{schema_name}\".\"{table_name}\"') AND a.attnum > 0 AND NOT a.attisdropped ORDER BY a.attnum")
         resutl_df = postgresConnector.get_table_schema(schema_name=schema_name, table_name=table_name)
         pd.testing.assert_frame_equal(df_local, resutl_df)
         postgresConnector.close_cursor()
         postgresConnector.close_connection()
 
+    def test_get_table_schema_function_returns_the_constraints_and_indexes_of_the_columns(self):
+        """
+        Test case to check that the get_table_schema function flags the primary key, unique, foreign key and indexed columns of the table
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        postgresConnector.cursor.execute("CREATE TEMP TABLE test_schema_parent (parent_id integer PRIMARY KEY)")
+        postgresConnector.cursor.execute("CREATE TEMP TABLE test_schema_child (child_id integer PRIMARY KEY, code text UNIQUE, parent_id integer REFERENCES test_schema_parent, note text, created date)")
+        postgresConnector.cursor.execute("CREATE INDEX ON test_schema_child (created)")
+        postgresConnector.cursor.execute("SELECT nspname FROM pg_namespace WHERE oid = pg_my_temp_schema()")
+        schema_name = postgresConnector.cursor.fetchone()[0]
+        result_df = postgresConnector.get_table_schema(schema_name=schema_name, table_name="test_schema_child").set_index('column_name')
+        self.assertEqual(['child_id'], list(result_df.index[result_df['primary_key']]))
+        self.assertEqual(['code'], list(result_df.index[result_df['unique_key']]))
+        self.assertEqual(['parent_id'], list(result_df.index[result_df['foreign_key']]))
+        self.assertEqual(['child_id', 'code', 'created'], list(result_df.index[result_df['indexed']]))
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+
     def test_get_table_schema_function_returns_None_for_no_database_connection(self):
         """
         Test case to check that get_table_schema function returns None for no database connection
@@ -308,5 +368,412 @@ class TestGetTableSchema(unittest.TestCase):
         result = postgresConnector.get_table_schema(schema_name=schema_name, table_name=table_name)
         self.assertIsNone(result)
 
+class TestConnectionPool(unittest.TestCase):
+    """
+    Class used for testing the connection pooling of the PostgresConnector class from database/logics.py
+    """
+    def test_pooled_connection_is_reused_after_close_connection(self):
+        """
+        Test case to check that closing a pooled connection returns it to the pool and that it is reused by the next open_connection call
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port, use_pool=True)
+        conn_object = postgresConnector.open_connection()
+        self.assertEqual(1, conn_object.status)
+        postgresConnector.close_connection()
+        self.assertEqual(0, conn_object.closed)
+        self.assertIs(conn_object, postgresConnector.open_connection())
+        self.assertEqual(1, postgresConnector.pool.n_open)
+        postgresConnector.close_connection()
+        postgresConnector.close_pool()
+        self.assertEqual(1, conn_object.closed)
+
+    def test_pooled_connection_is_replaced_if_unhealthy(self):
+        """
+        Test case to check that a pooled connection closed behind the pool's back is replaced by a new one on checkout
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port, use_pool=True)
+        conn_object = postgresConnector.open_connection()
+        postgresConnector.close_connection()
+        conn_object.close()
+        new_conn_object = postgresConnector.open_connection()
+        self.assertIsNot(conn_object, new_conn_object)
+        self.assertEqual(1, new_conn_object.status)
+        self.assertEqual(1, postgresConnector.pool.n_open)
+        postgresConnector.close_connection()
+        postgresConnector.close_pool()
+
+    def test_pool_does_not_open_more_than_max_size_connections(self):
+        """
+        Test case to check that the pool returns None instead of opening more than max_size connections
+        """
+        pool = ConnectionPool({'database': db_name, 'user': db_user, 'password': db_password, 'host': db_host, 'port': db_port}, max_size=1, checkout_timeout=0)
+        conn_object = pool.get_connection()
+        self.assertIsInstance(conn_object, psycopg2.extensions.connection)
+        self.assertIsNone(pool.get_connection())
+        self.assertEqual(pool.n_open, 1)
+        pool.put_connection(conn_object)
+        self.assertIs(conn_object, pool.get_connection())
+        pool.put_connection(conn_object)
+        pool.close_all()
+        self.assertEqual(pool.n_open, 0)
+
+    def test_pool_connects_outside_of_its_lock(self):
+        """
+        Test case to check that a thread checking out a connection does not hold the lock of the pool while connecting, and that a failed connection releases its slot
+        """
+        pool = ConnectionPool({'database': db_name, 'user': db_user, 'password': db_password, 'host': db_host, 'port': db_port}, max_size=1, checkout_timeout=0)
+        lock_free = []
+        connect = psycopg2.connect
+        def check_lock(**kwargs):
+            lock_free.append(pool.lock.acquire(blocking=False))
+            if lock_free[-1]:
+                pool.lock.release()
+            raise psycopg2.OperationalError("connection refused")
+        psycopg2.connect = check_lock
+        try:
+            self.assertIsNone(pool.get_connection())
+        finally:
+            psycopg2.connect = connect
+        self.assertEqual(lock_free, [True])
+        self.assertEqual(pool.n_open, 0)
+
+    def test_pooled_open_connection_returns_none_if_connection_fails(self):
+        """
+        Test case to check that open connection function returns None if the pool cannot connect
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_password, password='91422', host=db_host, port=db_port, use_pool=True)
+        self.assertIsNone(postgresConnector.open_connection())
+        postgresConnector.close_connection()
+
+class TestSampleTable(unittest.TestCase):
+    """
+    Class used for testing the sample_table and reservoir_sample methods of the PostgresConnector class from database/logics.py
+    """
+    def test_sample_table_function_returns_repeatable_sample(self):
+        """
+        Test case to check that the sample_table function returns the requested number of rows of the table and the same rows for the same seed
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        first_df = postgresConnector.sample_table(schema_name="public", table_name="employees", n_rows=10, n_table_rows=1000)
+        second_df = postgresConnector.sample_table(schema_name="public", table_name="employees", n_rows=10, n_table_rows=1000)
+        self.assertEqual(10, first_df.shape[0])
+        pd.testing.assert_frame_equal(first_df, second_df)
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+
+    def test_sample_table_function_reads_row_estimate_without_number_of_rows(self):
+        """
+        Test case to check that the sample_table function samples the share of the table given by its row estimate when the number of rows is not given
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        queries = []
+        load_query = postgresConnector.load_query
+        postgresConnector.load_query = lambda sql_query: queries.append(sql_query) or load_query(sql_query)
+        sample_df = postgresConnector.sample_table(schema_name="public", table_name="employees", n_rows=10)
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        self.assertEqual(10, sample_df.shape[0])
+        self.assertIn("TABLESAMPLE BERNOULLI (0.4)", queries[0])
+
+    def test_sample_table_function_samples_large_tables(self):
+        """
+        Test case to check that the sample_table function keeps a TABLESAMPLE clause for tables so large that the sampled share rounds to 0%
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        queries = []
+        load_query = postgresConnector.load_query
+        postgresConnector.load_query = lambda sql_query: queries.append(sql_query) or load_query(sql_query)
+        for n_table_rows in [30000000, 2000000000]:
+            postgresConnector.sample_table(schema_name="public", table_name="employees", n_rows=5, n_table_rows=n_table_rows)
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        self.assertEqual(2, len(queries))
+        self.assertTrue(all(f"TABLESAMPLE BERNOULLI ({MIN_SAMPLE_PERCENT})" in query for query in queries))
+
+    def test_reservoir_sample_function_returns_rows_of_the_query(self):
+        """
+        Test case to check that the reservoir_sample function returns the requested number of distinct rows of the query across several chunks
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        result_df = postgresConnector.reservoir_sample("SELECT generate_series(1, 100) AS x", n_rows=10, itersize=7)
+        self.assertEqual(10, result_df.shape[0])
+        self.assertEqual(10, result_df['x'].nunique())
+        self.assertTrue(result_df['x'].between(1, 100).all())
+        postgresConnector.close_connection()
+
+    def test_sample_table_function_returns_None_for_no_database_connection(self):
+        """
+        Test case to check that sample_table function returns None for no database connection
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_password, password=db_password, host=db_host, port=db_port)
+        result = postgresConnector.sample_table(schema_name="public", table_name="employees", n_rows=10)
+        self.assertIsNone(result)
+
+class TestCatalogCache(unittest.TestCase):
+    """
+    Class used for testing the CatalogCache class from database/logics.py
+    """
+    def test_get_columns_function_classifies_the_columns_of_the_table(self):
+        """
+        Test case to check that the get_columns function returns the columns of the table in order and classifies them by kind
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        catalog = CatalogCache(postgresConnector)
+        engine = setup_local()
+        df_local = run_sql_query(engine=engine, sql_query="SELECT column_name, data_type FROM information_schema.columns WHERE table_schema = 'public' AND table_name = 'employees' ORDER BY ordinal_position")
+        self.assertEqual(list(df_local['column_name']), catalog.get_columns("public", "employees"))
+        numeric_types = ['smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision', 'money']
+        self.assertEqual(list(df_local.loc[df_local['data_type'].isin(numeric_types), 'column_name']), catalog.get_columns("public", "employees", "numeric"))
+
+    def test_catalog_is_read_again_after_reload_or_ttl(self):
+        """
+        Test case to check that the cached columns of a schema are reused until they expire or are reloaded
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        catalog = CatalogCache(postgresConnector, ttl=300)
+        columns = catalog.get_schema_columns("public")
+        self.assertIs(columns, catalog.get_schema_columns("public"))
+        catalog.reload("public")
+        self.assertIsNot(columns, catalog.get_schema_columns("public"))
+        catalog.ttl = -1
+        columns = catalog.get_schema_columns("public")
+        self.assertIsNot(columns, catalog.get_schema_columns("public"))
+
+class TestAsyncPostgresConnector(unittest.TestCase):
+    """
+    Class used for testing the AsyncPostgresConnector class from database/logics.py
+    """
+    def run_queries(self, sql_queries, max_connections):
+        async def run():
+            async with AsyncPostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port, max_connections=max_connections) as adb:
+                return await asyncio.gather(*[adb.run_query(sql_query) for sql_query in sql_queries])
+        return asyncio.run(run())
+
+    def test_run_query_function_returns_the_same_result_as_the_synchronous_connector(self):
+        """
+        Test case to check that the run_query coroutine returns the same dataframe as the run_query method of PostgresConnector
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        expected = postgresConnector.run_query("SELECT * FROM public.employees")
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        pd.testing.assert_frame_equal(expected, self.run_queries(["SELECT * FROM public.employees"], 1)[0])
+
+    def test_queries_run_concurrently_up_to_max_connections(self):
+        """
+        Test case to check that queries run concurrently on several connections and one at a time with a single connection
+        """
+        sql_queries = ["SELECT pg_sleep(0.3)"] * 4
+        start = time.perf_counter()
+        self.run_queries(sql_queries, 4)
+        self.assertLess(time.perf_counter() - start, 0.9)
+        start = time.perf_counter()
+        self.run_queries(sql_queries, 1)
+        self.assertGreaterEqual(time.perf_counter() - start, 1.2)
+
+    def test_run_query_function_raises_error_if_connection_fails(self):
+        """
+        Test case to check that the run_query coroutine raises an OperationalError instead of returning None when it cannot connect
+        """
+        async def run():
+            async with AsyncPostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port='1') as adb:
+                return await adb.run_query("SELECT 1")
+        with self.assertRaises(psycopg2.OperationalError):
+            asyncio.run(run())
+
+    def test_profile_columns_function_reports_failed_columns(self):
+        """
+        Test case to check that profile_columns returns the columns that were profiled and reports the error of the others, or raises it without an error list
+        """
+        class Column:
+            def __init__(self, sql_query):
+                self.sql_query = sql_query
+            async def set_data_async(self, adb):
+                self.result = await adb.run_query(self.sql_query)
+        columns = [Column("SELECT 1"), Column("SELECT * FROM public.missing_table")]
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        errors = []
+        self.assertEqual([columns[0]], profile_columns(columns, postgresConnector, errors=errors))
+        self.assertIs(columns[1], errors[0][0])
+        self.assertIsInstance(errors[0][1], psycopg2.errors.UndefinedTable)
+        with self.assertRaises(psycopg2.errors.UndefinedTable):
+            profile_columns(columns, postgresConnector)
+
+class TestRefreshState(unittest.TestCase):
+    """
+    Class used for testing the merge_totals, read_top_summary and scan_column functions and the IncrementalState class from database/logics.py
+    """
+    def test_merge_totals_function_merges_by_rule(self):
+        """
+        Test case to check that merge_totals adds the counts, keeps the smallest and largest values with NaN as the largest one and leaves the other aggregates to the caller
+        """
+        rules = {'n_values': 'sum', 'col_min': 'min', 'col_max': 'max', 'col_mean': None}
+        totals = {'n_values': 3, 'col_min': 1.0, 'col_max': 5.0, 'col_mean': 2.0}
+        delta = {'n_values': 2, 'col_min': -1.0, 'col_max': float('nan'), 'col_mean': 7.0}
+        merged = merge_totals(totals, delta, rules)
+        self.assertEqual((5, -1.0, 7.0), (merged['n_values'], merged['col_min'], merged['col_mean']))
+        self.assertTrue(np.isnan(merged['col_max']))
+        self.assertEqual(5.0, merge_totals(totals, {'n_values': 0, 'col_min': None, 'col_max': None, 'col_mean': None}, rules)['col_max'])
+        self.assertEqual(delta, merge_totals(None, delta, rules))
+
+    def test_read_top_summary_function_bounds_untracked_values(self):
+        """
+        Test case to check that read_top_summary keeps the exact counts of the query and bounds the counts of the untracked values by the last count when the query was truncated
+        """
+        summary = read_top_summary(pd.DataFrame([['a', 5, 0.5], ['b', 3, 0.3]]), capacity=2, n_values=10)
+        self.assertEqual({'a': 5, 'b': 3}, summary.counts.to_dict())
+        self.assertEqual((3, 10), (summary.get_max_error(), summary.n_values))
+        self.assertEqual(0, read_top_summary(pd.DataFrame(), capacity=2).counts.shape[0])
+
+    def test_set_position_function_keeps_xids_still_after_snapshot(self):
+        """
+        Test case to check that set_position adds the xmin seen by the previous scans that still follow the xmin of the new snapshot, and forgets them all when there are too many
+        """
+        state = IncrementalState("public", "employees")
+        state.set_position("100:105:100", None, 4, [101, 103])
+        state.incremental = True
+        state.set_position("102:110:", None, 1, [108])
+        self.assertEqual([103, 108], state.seen_xids)
+        state.set_position("102:110:", None, 1, range(200000, 200000 + MAX_SEEN_XIDS + 1))
+        self.assertIsNone(state.seen_xids)
+
+    def test_scan_column_function_computes_bounded_state(self):
+        """
+        Test case to check that scan_column returns the aggregates, a sketch and the most frequent values of a column computed in Postgres
+        """
+        expected_serie = get_data_local(setup_local(), "employees")["name"]
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        position, values, sketch, top = scan_column(postgresConnector, "public", "employees", "name", ["count(*) filter (where name is null)"], precision=12, capacity=5)
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        self.assertEqual([expected_serie.shape[0], None], position[2:])
+        self.assertEqual([expected_serie.notna().sum(), expected_serie.isna().sum()], values)
+        self.assertLess(abs(sketch.count() - expected_serie.nunique()), 4 * sketch.error * expected_serie.nunique() + 1)
+        self.assertEqual(expected_serie.value_counts().sort_index().sort_values(ascending=False, kind='stable').head(5).to_dict(), top.counts.to_dict())
+
+class TestHyperLogLog(unittest.TestCase):
+    """
+    Class used for testing the HyperLogLog class and the count_distinct method of the PostgresConnector class from database/logics.py
+    """
+    def test_get_bit_length_function_returns_position_of_leftmost_bit(self):
+        """
+        Test case to check that get_bit_length returns the same number of bits as int.bit_length for every width of a 64-bit integer
+        """
+        values = [0, 1, 2, 3, 255, 256, 2 ** 32, 2 ** 53 - 1, 2 ** 63, 2 ** 64 - 1]
+        self.assertEqual([value.bit_length() for value in values], get_bit_length(np.array(values, dtype=np.uint64)).tolist())
+
+    def test_count_function_estimates_within_error_bound(self):
+        """
+        Test case to check that the estimate of a sketch is exact for a few values and within 4 standard errors for many values
+        """
+        self.assertEqual(0, HyperLogLog(12).count())
+        self.assertEqual(10, HyperLogLog(12).update(pd.Series(list("abcdefghij") * 3 + [None])).count())
+        sketch = sketch_serie(pd.Series(np.arange(200000) % 150000), precision=12, chunk_size=30000)
+        self.assertLess(abs(sketch.count() / 150000 - 1), 4 * sketch.error)
+
+    def test_merge_function_estimates_union_of_chunks(self):
+        """
+        Test case to check that merging the sketches of two overlapping partitions gives the sketch of their union, and that sketches of different precisions cannot be merged
+        """
+        first = sketch_serie(pd.Series(np.arange(0, 60000)), precision=12)
+        second = sketch_serie(pd.Series(np.arange(40000, 100000)), precision=12)
+        union = sketch_serie(pd.Series(np.arange(0, 100000)), precision=12)
+        self.assertEqual(union.count(), first.merge(second).count())
+        with self.assertRaises(ValueError):
+            first.merge(HyperLogLog(14))
+        with self.assertRaises(ValueError):
+            HyperLogLog(20)
+
+    def test_count_distinct_function_streams_values_without_hll_extension(self):
+        """
+        Test case to check that count_distinct counts exactly without precision and estimates the same count with a sketch
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        postgresConnector.open_cursor()
+        n_unique, error = postgresConnector.count_distinct("public", "employees", "salary")
+        has_hll = postgresConnector.has_extension("hll")
+        estimate, estimate_error = postgresConnector.count_distinct("public", "employees", "salary", precision=14, itersize=100)
+        postgresConnector.close_cursor()
+        postgresConnector.close_connection()
+        self.assertIsNone(error)
+        self.assertEqual(HyperLogLog.get_error(14), estimate_error)
+        self.assertLess(abs(estimate - n_unique), 4 * estimate_error * n_unique + 1)
+        if not has_hll:
+            self.assertEqual(sketch_serie(pd.Series(get_data_local(setup_local(), "employees")["salary"].dropna()), 14).count(), estimate)
+
+class TestSpaceSaving(unittest.TestCase):
+    """
+    Class used for testing the SpaceSaving class and the read_top_values function from database/logics.py
+    """
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.serie = pd.Series(rng.zipf(1.5, 50000) % 5000)
+        self.counts = self.serie.value_counts()
+
+    def test_get_top_function_is_exact_when_every_value_is_tracked(self):
+        """
+        Test case to check that a summary with more counters than values returns the exact occurrences and percentages of the most frequent values, ties ordered by value
+        """
+        top = SpaceSaving(10).update(pd.Series(['b', 'a', None, 'b', 'c', 'a', 'b'])).get_top(2)
+        self.assertEqual([['b', 3, 0.5], ['a', 2, 0.3333]], top.values.tolist())
+        self.assertEqual(0, SpaceSaving(10).get_top().shape[0])
+        with self.assertRaises(ValueError):
+            SpaceSaving(0)
+
+    def test_counts_overestimate_by_at_most_max_error(self):
+        """
+        Test case to check that the counts of a summary built chunk by chunk overestimate the true counts by at most its maximum error, itself at most the number of values divided by the capacity, and that it finds the most frequent values
+        """
+        summary = sketch_top_values(self.serie, capacity=200, chunk_size=5000)
+        true_counts = self.counts.reindex(summary.counts.index)
+        self.assertEqual(summary.n_values, self.serie.shape[0])
+        self.assertTrue((summary.counts >= true_counts).all())
+        self.assertTrue((summary.counts - true_counts <= summary.errors).all())
+        self.assertLessEqual(summary.get_max_error(), self.serie.shape[0] / 200)
+        self.assertEqual(self.counts.index[:10].tolist(), summary.get_top(10)['value'].tolist())
+
+    def test_merge_function_summarises_union_of_partitions(self):
+        """
+        Test case to check that merging the summaries of two partitions finds the same most frequent values as the summary of the whole column
+        """
+        first = sketch_top_values(self.serie.iloc[:25000], capacity=200)
+        second = sketch_top_values(self.serie.iloc[25000:], capacity=200)
+        merged = first.merge(second)
+        self.assertEqual(merged.n_values, self.serie.shape[0])
+        self.assertEqual(self.counts.index[:10].tolist(), merged.get_top(10)['value'].tolist())
+
+    def test_read_top_values_function_converts_query_result(self):
+        """
+        Test case to check that read_top_values returns the value, occurrence and percentage columns of the result of get_top_values_query
+        """
+        top = read_top_values(pd.DataFrame([['a', 3, 0.75], ['b', 1, 0.25]]))
+        self.assertEqual(['value', 'occurrence', 'percentage'], list(top.columns))
+        self.assertEqual([['a', 3, 0.75], ['b', 1, 0.25]], top.values.tolist())
+        self.assertEqual(['value', 'occurrence', 'percentage'], list(read_top_values(pd.DataFrame()).columns))
+
+    def test_count_top_values_function_streams_values(self):
+        """
+        Test case to check that count_top_values summarises the non-missing values streamed chunk by chunk like a summary of the loaded column
+        """
+        postgresConnector = PostgresConnector(database=db_name, user=db_user, password=db_password, host=db_host, port=db_port)
+        postgresConnector.open_connection()
+        summary = postgresConnector.count_top_values("public", "employees", "salary", capacity=50, itersize=700)
+        postgresConnector.close_connection()
+        expected = sketch_top_values(pd.Series(get_data_local(setup_local(), "employees")["salary"].dropna()), capacity=50, chunk_size=700)
+        self.assertEqual(expected.n_values, summary.n_values)
+        self.assertEqual(expected.get_top(10)[['occurrence', 'percentage']].values.tolist(), summary.get_top(10)[['occurrence', 'percentage']].values.tolist())
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
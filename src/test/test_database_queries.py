@@ -118,7 +118,7 @@ class TestTableSchemaQuery(unittest.TestCase):
         """
         self.schema_name = "public"
         self.table_name = "employees"
-        self.correct_query = "SELECT c.table_name, c.column_name, c.data_type, CASE WHEN EXISTS(SELECT 1 FROM INFORMATION_SCHEMA.constraint_column_usage k WHERE c.table_name = k.table_name and k.column_name = c.column_name) THEN true ELSE false END as primary_key, c.is_nullable, c.character_maximum_length, c.numeric_precision FROM INFORMATION_SCHEMA.COLUMNS c WHERE c.table_schema='public' AND c.table_name='employees'"
+        self.correct_query = "SELECT c.relname AS table_name, a.attname AS column_name, format_type(a.atttypid, NULL) AS data_type, coalesce(k.primary_key, false) AS primary_key, CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable, information_schema._pg_char_max_length(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS character_maximum_length, information_schema._pg_numeric_precision(information_schema._pg_truetypid(a, t), information_schema._pg_truetypmod(a, t)) AS numeric_precision, coalesce(k.unique_key, false) AS unique_key, coalesce(k.foreign_key, false) AS foreign_key, i.attnum IS NOT NULL AS indexed FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_type t ON t.oid = a.atttypid LEFT JOIN (SELECT key.attnum, bool_or(con.contype = 'p') AS primary_key, bool_or(con.contype = 'u') AS unique_key, bool_or(con.contype = 'f') AS foreign_key FROM pg_constraint con CROSS JOIN unnest(con.conkey) AS key(attnum) WHERE con.conrelid = to_regclass('\"public\".\"employees\"') GROUP BY key.attnum) k ON k.attnum = a.attnum LEFT JOIN (SELECT DISTINCT unnest(ix.indkey::int2[]) AS attnum FROM pg_index ix WHERE ix.indrelid = to_regclass('\"public\".\"employees\"')) i ON i.attnum = a.attnum WHERE a.attrelid = to_regclass('\"public\".\"employees\"') AND a.attnum > 0 AND NOT a.attisdropped ORDER BY a.attnum"
         self.empty_schema = ""
         self.empty_table = ""
 
@@ -169,5 +169,171 @@ class TestTableSchemaQuery(unittest.TestCase):
         del self.incorrect_schema
         del self.incorrect_table
 
+class TestCopyQuery(unittest.TestCase):
+    """
+    Class used for testing the get_copy_query() and get_query_columns_query() functions of the database/queries.py file
+    """
+    def setUp(self) -> None:
+        """
+        Method used to initiate the attributes or parameters that are going to be used in the test cases
+        """
+        self.sql_query = "SELECT * FROM public.employees;"
+        self.correct_copy_query = "COPY (SELECT * FROM public.employees) TO STDOUT WITH (FORMAT csv, NULL '\\N')"
+        self.correct_columns_query = "SELECT * FROM (SELECT * FROM public.employees) AS query_columns LIMIT 0"
+
+    def test_get_copy_query_returns_correct_query(self):
+        """
+        Test case to check that the get_copy_query function wraps the query without its trailing semicolon
+        """
+        query = get_copy_query(self.sql_query)
+        self.assertEqual(self.correct_copy_query, query)
+
+    def test_get_query_columns_query_returns_correct_query(self):
+        """
+        Test case to check that the get_query_columns_query function wraps the query in a subquery limited to 0 rows
+        """
+        query = get_query_columns_query(self.sql_query)
+        self.assertEqual(self.correct_columns_query, query)
+
+    def test_copy_queries_return_None_for_empty_or_none_query(self):
+        """
+        Test case to check that the get_copy_query and get_query_columns_query functions return None for empty or None query
+        """
+        self.assertIsNone(get_copy_query(""))
+        self.assertIsNone(get_copy_query(None))
+        self.assertIsNone(get_query_columns_query(""))
+        self.assertIsNone(get_query_columns_query(None))
+
+    def tearDown(self) -> None:
+        """
+        Method used to clean the parameters after they have been used while running the test cases
+        """
+        del self.sql_query
+        del self.correct_copy_query
+        del self.correct_columns_query
+
+class TestTableSizesQuery(unittest.TestCase):
+    """
+    Class used for testing the get_table_sizes_query() function of the database/queries.py file
+    """
+    def test_get_table_sizes_query_returns_correct_query(self):
+        """
+        Test case to check that the get_table_sizes_query function returns the catalog query for the estimated number of rows and size of the tables
+        """
+        correct_query = "SELECT n.nspname || '.' || c.relname AS table_name, COALESCE(s.n_live_tup, GREATEST(c.reltuples, 0))::bigint AS n_rows, pg_total_relation_size(c.oid) AS n_bytes FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid WHERE c.relkind IN ('r', 'p', 'm', 'f');"
+        self.assertEqual(correct_query, get_table_sizes_query())
+
+class TestCatalogColumnsQuery(unittest.TestCase):
+    """
+    Class used for testing the get_catalog_columns_query() function of the database/queries.py file
+    """
+    def test_get_catalog_columns_query_returns_correct_query(self):
+        """
+        Test case to check that the get_catalog_columns_query function reads pg_attribute and pg_type for the schema and returns None for an empty schema
+        """
+        correct_query = "SELECT c.relname AS table_name, a.attname AS column_name, a.attnum AS ordinal_position, CASE WHEN t.typtype = 'd' THEN t.typbasetype ELSE t.oid END AS type_oid, format_type(a.atttypid, a.atttypmod) AS data_type, NOT a.attnotnull AS is_nullable FROM pg_attribute a JOIN pg_class c ON c.oid = a.attrelid JOIN pg_namespace n ON n.oid = c.relnamespace JOIN pg_type t ON t.oid = a.atttypid WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p', 'v', 'm', 'f') AND a.attnum > 0 AND NOT a.attisdropped ORDER BY c.relname, a.attnum"
+        self.assertEqual(correct_query, get_catalog_columns_query("public"))
+        self.assertIsNone(get_catalog_columns_query(""))
+
+class TestTableSampleQuery(unittest.TestCase):
+    """
+    Class used for testing the get_sampled_table_name() and get_table_sample_query() functions of the database/queries.py file
+    """
+    def test_get_sampled_table_name_returns_tablesample_clause(self):
+        """
+        Test case to check that the get_sampled_table_name function appends the TABLESAMPLE clause and leaves the table unchanged without percentage
+        """
+        self.assertEqual("employees TABLESAMPLE SYSTEM (10) REPEATABLE (0)", get_sampled_table_name("employees", 10))
+        self.assertEqual("employees", get_sampled_table_name("employees", None))
+
+    def test_get_table_sample_query_returns_correct_query(self):
+        """
+        Test case to check that the get_table_sample_query function returns the sampling query and None for empty schema or table
+        """
+        correct_query = "SELECT * FROM public.employees TABLESAMPLE BERNOULLI (2.5) REPEATABLE (3) ORDER BY md5(ctid::text || '3') LIMIT 10"
+        self.assertEqual(correct_query, get_table_sample_query("public", "employees", 2.5, 10, seed=3))
+        self.assertIsNone(get_table_sample_query("", "employees", 2.5, 10))
+
+    def test_get_table_estimate_query_returns_correct_query(self):
+        """
+        Test case to check that the get_table_estimate_query function reads the live rows of the table, or its reltuples when they are missing or reset
+        """
+        correct_query = "SELECT COALESCE(NULLIF(s.n_live_tup, 0), GREATEST(c.reltuples, 0))::bigint FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid WHERE n.nspname = 'public' AND c.relname = 'employees'"
+        self.assertEqual(correct_query, get_table_estimate_query("public", "employees"))
+
+class TestNewRowsQuery(unittest.TestCase):
+    """
+    Class used for testing the get_table_changes_query(), get_new_rows_condition(), get_scan_query() and get_hll_registers_query() functions of the database/queries.py file
+    """
+    def test_get_table_changes_query_returns_correct_query(self):
+        """
+        Test case to check that the get_table_changes_query function reads the update and delete counters, the file node and the time of the last reset of the statistics of the table and the next transaction ID
+        """
+        correct_query = "SELECT s.n_tup_upd, s.n_tup_del, pg_relation_filenode(s.relid), coalesce((extract(epoch from d.stats_reset) * 1000000)::bigint, 0), txid_snapshot_xmax(txid_current_snapshot()) FROM (SELECT 1) AS one LEFT JOIN pg_stat_user_tables s ON s.schemaname = 'public' AND s.relname = 'employees' LEFT JOIN pg_stat_database d ON d.datname = current_database()"
+        self.assertEqual(correct_query, get_table_changes_query("public", "employees"))
+
+    def test_get_new_rows_condition_returns_correct_condition(self):
+        """
+        Test case to check that the get_new_rows_condition function compares the 32-bit xmin with the xmin of the snapshot, excluding the ones already seen, or the watermark column with its last value
+        """
+        self.assertEqual("id > '10'", get_new_rows_condition(watermark_column="id", watermark=10))
+        self.assertEqual("created > 'O''Brien'", get_new_rows_condition(watermark_column="created", watermark="O'Brien"))
+        correct_condition = "(xmin::text::bigint >= 3 AND (xmin::text::bigint - 3 + 4294967296) % 4294967296 < 2147483648 AND xmin::text::bigint NOT IN (4, 6))"
+        self.assertEqual(correct_condition, get_new_rows_condition("4294967299:4294967301:4294967299", seen_xids=[4, 6]))
+        self.assertNotIn(" NOT IN ", get_new_rows_condition("700:700:", seen_xids=[]))
+
+    def test_get_scan_query_returns_correct_query(self):
+        """
+        Test case to check that the get_scan_query function returns the position of the scan before the aggregates
+        """
+        correct_query = "SELECT txid_current_snapshot()::text, max(id)::text, count(*), NULL, count(salary), min(salary) FROM public.employees WHERE id > '10'"
+        self.assertEqual(correct_query, get_scan_query("public", "employees", ["count(salary)", "min(salary)"], "id > '10'", "id"))
+        correct_query = "SELECT txid_current_snapshot()::text, NULL, count(*), array_agg(DISTINCT xmin::text::bigint) FILTER (WHERE xmin::text::bigint >= 3 AND (xmin::text::bigint - txid_snapshot_xmin(txid_current_snapshot()) % 4294967296 + 4294967296) % 4294967296 < 2147483648) FROM public.employees"
+        self.assertEqual(correct_query, get_scan_query("public", "employees", []))
+
+    def test_get_hll_registers_query_returns_correct_query(self):
+        """
+        Test case to check that the get_hll_registers_query function splits the hashes of the non-missing values into the index and rank of their register
+        """
+        correct_query = "SELECT (h >> 50) & 16383, max(51 - length(ltrim((h & 1125899906842623)::bit(64)::text, '0'))) FROM (SELECT hashtextextended(name::text, 0) AS h FROM public.employees WHERE name IS NOT NULL AND id > '10') AS hashes GROUP BY 1"
+        self.assertEqual(correct_query, get_hll_registers_query("public", "employees", "name", 14, "id > '10'"))
+
+class TestDistinctCountQuery(unittest.TestCase):
+    """
+    Class used for testing the get_extension_query(), get_distinct_count() and get_distinct_count_query() functions of the database/queries.py file
+    """
+    def test_get_extension_query_returns_correct_query(self):
+        """
+        Test case to check that the get_extension_query function counts the installed extensions with the given name
+        """
+        self.assertEqual("SELECT count(*) FROM pg_extension WHERE extname = 'hll'", get_extension_query("hll"))
+
+    def test_get_distinct_count_returns_exact_sketched_or_no_count(self):
+        """
+        Test case to check that the get_distinct_count function counts the unique values exactly without precision, with the hll extension when it is installed and not at all otherwise
+        """
+        self.assertEqual("count(distinct salary)", get_distinct_count("salary"))
+        self.assertEqual("coalesce(hll_cardinality(hll_add_agg(hll_hash_any(salary), 12)), 0)::bigint", get_distinct_count("salary", 12, True))
+        self.assertEqual("NULL", get_distinct_count("salary", 12))
+
+    def test_get_distinct_count_query_returns_correct_query(self):
+        """
+        Test case to check that the get_distinct_count_query function counts the unique values in the database or selects the non-missing values to be sketched
+        """
+        self.assertEqual("SELECT count(distinct salary) FROM public.employees", get_distinct_count_query("public", "employees", "salary"))
+        self.assertEqual("SELECT salary FROM public.employees WHERE salary IS NOT NULL", get_distinct_count_query("public", "employees", "salary", 12))
+
+class TestTopValuesQuery(unittest.TestCase):
+    """
+    Class used for testing the get_top_values_query() function of the database/queries.py file
+    """
+    def test_get_top_values_query_returns_correct_query(self):
+        """
+        Test case to check that the get_top_values_query function keeps the most frequent non-missing values with their share of all the groups
+        """
+        correct_query = "SELECT name, count(*), round(count(*) / sum(count(*)) OVER (), 4) FROM public.employees WHERE name IS NOT NULL GROUP BY name ORDER BY count(*) DESC, name LIMIT 5"
+        self.assertEqual(correct_query, get_top_values_query("public", "employees", "name", 5))
+        self.assertIn("WHERE name IS NOT NULL AND id > '10' GROUP BY", get_top_values_query("public", "employees", "name", 5, "id > '10'"))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
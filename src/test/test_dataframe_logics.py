@@ -1,4 +1,6 @@
+import os
 import re
+import tempfile
 import unittest
 import pandas as pd
 import sqlalchemy as db
@@ -6,7 +8,9 @@ from datetime import datetime
 from sqlalchemy.engine import reflection
 
 from src.database.logics import PostgresConnector
-from src.dataframe.logics import Dataset
+from decimal import Decimal
+from src.dataframe.logics import Dataset, DatasetCache, SnapshotStore, ProfileExecutor, ProcessProfiler, profile_series, share_series, compact_dtypes
+from src.serie_numeric.logics import NumericColumn
 
 def setup(df, table_name):
     engine = db.create_engine('sqlite://')
@@ -33,6 +37,14 @@ def get_data_local(engine, table_name):
     ResultSet = ResultProxy.fetchall()
     return pd.DataFrame(ResultSet)
 
+def execute_local(connector, sql_query):
+    connector.open_connection()
+    connector.open_cursor()
+    connector.cursor.execute(sql_query)
+    connector.conn.commit()
+    connector.close_cursor()
+    connector.close_connection()
+
 def testnumeric(engine, table_name):
     numeric_cols = ['SMALLINT', 'INTEGER', 'BIGINT', 'DECIMAL', 'NUMERIC', 'REAL', 'DOUBLE PRECISION', 'SMALLSERIAL', 'SERIAL', 'BIGSERIAL', 'MONEY']
     connection = engine.connect()
@@ -119,6 +131,108 @@ class TestDataFrame(unittest.TestCase):
         self.assertEqual(data.text_cols, text_cols)
         self.assertEqual(data.date_cols, date_cols)
 
+    def test_set_data_bootstrap(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        engine = setup_local()
+        result = get_data_local(engine, table_name)
+        data = Dataset(schema_name, table_name, db=PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432'), bootstrap=True)
+        data.set_data()
+
+        self.assertTrue(data.is_df_none())
+        self.assertEqual(list(data.df.columns), list(result.columns))
+        self.assertEqual(data.n_rows, result.shape[0])
+        self.assertEqual(data.n_cols, result.shape[1])
+        self.assertEqual(data.n_duplicates, result.duplicated().sum())
+        self.assertEqual(data.n_missing, result.isna().sum().sum())
+        self.assertEqual(data.num_cols, testnumeric(engine, table_name))
+        self.assertEqual(data.text_cols, testtext(engine, table_name))
+        self.assertEqual(data.date_cols, testdate(engine, table_name))
+
+    def test_set_data_estimate(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        engine = setup_local()
+        result = get_data_local(engine, table_name)
+        data = Dataset(schema_name, table_name, db=PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432'), bootstrap=True, estimate_rows=True)
+        data.set_data()
+
+        self.assertTrue(data.estimate_rows)
+        self.assertIsNotNone(data.estimate_note)
+        self.assertIsNone(data.n_missing)
+        self.assertEqual(data.get_summary_df()['Description'][1], 'Estimated Number of Rows')
+        data.set_exact_counts()
+        self.assertFalse(data.estimate_rows)
+        self.assertEqual(data.n_rows, result.shape[0])
+        self.assertEqual(data.n_missing, result.isna().sum().sum())
+        self.assertIsNone(data.n_duplicates)
+        self.assertIsNotNone(data.estimate_note)
+        data.set_exact_counts(count_duplicates=True)
+        self.assertEqual(data.n_duplicates, result.duplicated().sum())
+        self.assertIsNone(data.estimate_note)
+
+    def test_set_row_estimate_after_stats_reset(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.estimate_test; create table public.estimate_test as select employee_id from public.employees; analyze public.estimate_test")
+        try:
+            execute_local(db, "select pg_stat_reset_single_table_counters('public.estimate_test'::regclass)")
+            data = Dataset('public', 'estimate_test', db=db)
+            data.set_row_estimate()
+            self.assertEqual(data.n_rows, 5000)
+        finally:
+            execute_local(db, "drop table if exists public.estimate_test")
+
+    def test_set_version_after_truncate_and_stats_reset(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.version_test; create table public.version_test as select employee_id from public.employees")
+        try:
+            data = Dataset('public', 'version_test', db=db)
+            data.set_version()
+            versions = [data.version]
+            execute_local(db, "truncate public.version_test")
+            data.set_version()
+            versions.append(data.version)
+            execute_local(db, "select pg_stat_reset_single_table_counters('public.version_test'::regclass)")
+            data.set_version()
+            versions.append(data.version)
+            self.assertEqual(len(set(versions)), 3)
+        finally:
+            execute_local(db, "drop table if exists public.version_test")
+
+    def test_set_version_of_partitioned_table_and_view(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.version_parts; create table public.version_parts (id int) partition by range (id); "
+                "create table public.version_parts_1 partition of public.version_parts for values from (0) to (100); create view public.version_view as select * from public.version_parts")
+        try:
+            data = Dataset('public', 'version_parts', db=db)
+            data.set_version()
+            versions = [data.version]
+            execute_local(db, "create table public.version_parts_2 partition of public.version_parts for values from (100) to (200)")
+            data.set_version()
+            versions.append(data.version)
+            execute_local(db, "truncate public.version_parts_1")
+            data.set_version()
+            versions.append(data.version)
+            self.assertEqual(len(set(versions)), 3)
+            self.assertTrue(all(versions))
+            view = Dataset('public', 'version_view', db=db)
+            view.set_version()
+            self.assertEqual(view.version, '')
+        finally:
+            execute_local(db, "drop view if exists public.version_view; drop table if exists public.version_parts")
+
+    def test_get_column_stats_with_child_tables(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.stats_parent cascade; drop table if exists public.stats_partitioned; create table public.stats_parent (value int); create table public.stats_child () inherits (public.stats_parent); insert into public.stats_parent select i from generate_series(1, 100) i; insert into public.stats_child select null from generate_series(1, 300); create table public.stats_partitioned (value int) partition by range (value); create table public.stats_partition partition of public.stats_partitioned for values from (1) to (1000); insert into public.stats_partitioned select i from generate_series(1, 100) i; analyze public.stats_parent; analyze public.stats_partitioned")
+        try:
+            stats = Dataset('public', 'stats_parent', db=db).get_column_stats()
+            self.assertEqual(stats['value']['n_missing'], 0)
+            self.assertEqual(stats['value']['n_unique'], 100)
+            stats = Dataset('public', 'stats_partitioned', db=db).get_column_stats()
+            self.assertEqual(stats['value']['n_unique'], 100)
+        finally:
+            execute_local(db, "drop table if exists public.stats_parent cascade; drop table if exists public.stats_partitioned")
+
     def test_empty(self):
         df_empty = pd.DataFrame()
         data = Dataset(df=df_empty)
@@ -136,6 +250,29 @@ class TestDataFrame(unittest.TestCase):
         data.set_duplicates()
         self.assertEqual(data.n_duplicates, df_dup.duplicated().sum())
 
+    def test_fold_chunks(self):
+        matrix = {'numeric':list(range(1, 10)), 'text':[str(x) for x in list(range(1, 10))], 'date':pd.date_range(datetime.today(), periods=9).tolist(), 'none':[None]*9}
+        df = pd.DataFrame(matrix)
+        df_dup = pd.concat([df, df.head(4)], ignore_index=True)
+        data = Dataset()
+        data.fold_chunks(df_dup.iloc[i:i+3] for i in range(0, df_dup.shape[0], 3))
+        self.assertEqual(data.n_rows, df_dup.shape[0])
+        self.assertEqual(data.n_cols, df_dup.shape[1])
+        self.assertIsNone(data.n_duplicates)
+        self.assertEqual(data.n_missing, df_dup.isna().sum().sum())
+        self.assertTrue(data.is_df_none())
+
+    def test_set_data_without_keeping_rows(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.fold_test; create table public.fold_test (a int, b int); insert into public.fold_test values (1, 5), (2, 6), (1, 5), (null, 7), (null, null), (null, null)")
+        try:
+            data = Dataset('public', 'fold_test', db=db, chunksize=2, keep_rows=False)
+            data.set_data()
+            self.assertTrue(data.is_df_none())
+            self.assertEqual((data.n_rows, data.n_cols, data.n_missing, data.n_duplicates), (6, 2, 5, 2))
+        finally:
+            execute_local(db, "drop table if exists public.fold_test")
+
     def test_missing(self):
         matrix = {'numeric':list(range(1, 10)), 'text':[str(x) for x in list(range(1, 10))], 'date':pd.date_range(datetime.today(), periods=9).tolist(), 'none':[None]*9}
         df = pd.DataFrame(matrix)
@@ -155,12 +292,51 @@ class TestDataFrame(unittest.TestCase):
         data = Dataset(df=df)
         pd.testing.assert_frame_equal(data.get_tail(5), df.tail(5))
 
+    def test_get_page(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        engine = setup_local()
+        result = get_data_local(engine, table_name)
+        data = Dataset(schema_name, table_name, db=PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432'), bootstrap=True)
+        data.set_data()
+        key_col = data.get_key_columns()[0]
+        result = result.sort_values(key_col, ignore_index=True)
+
+        first_page, next_key = data.get_page(5)
+        second_page, _ = data.get_page(5, after=next_key)
+        self.assertEqual(list(first_page[key_col]), list(result[key_col].head(5)))
+        self.assertEqual(list(second_page[key_col]), list(result[key_col].iloc[5:10]))
+        self.assertEqual(list(data.get_head(5)[key_col]), list(result[key_col].head(5)))
+        self.assertEqual(list(data.get_tail(5)[key_col]), list(result[key_col].tail(5)))
+
+    def test_get_block_page(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.page_test; create table public.page_test as select g as id, repeat('x', 200) as pad from generate_series(1, 3000) g; delete from public.page_test where id between 100 and 1500")
+        try:
+            data = Dataset('public', 'page_test', db=db)
+            self.assertEqual(data.get_key_columns(), ['ctid'])
+            data.get_schema = None
+            self.assertEqual(data.get_key_columns(), ['ctid'])
+            expected = list(range(1, 100)) + list(range(1501, 3001))
+            for descending in (False, True):
+                ids, after = [], None
+                while True:
+                    page, after = data.get_page(50, after=after, descending=descending)
+                    ids += list(page['id'])
+                    if after is None:
+                        break
+                self.assertEqual(ids, expected[::-1] if descending else expected)
+            self.assertEqual(list(data.get_tail(5)['id']), expected[-5:])
+        finally:
+            execute_local(db, "drop table if exists public.page_test")
+
     def test_get_sample(self):
         matrix = {'numeric':list(range(1, 10)), 'text':[str(x) for x in list(range(1, 10))], 'date':pd.date_range(datetime.today(), periods=9).tolist(), 'none':[None]*9}
         df = pd.DataFrame(matrix)
         data = Dataset(df=df)
         self.assertEqual(data.get_sample(5).shape[0], df.sample(5).shape[0])
         self.assertEqual(data.get_sample(5).shape[1], df.sample(5).shape[1])
+        pd.testing.assert_frame_equal(data.get_sample(5, seed=1), data.get_sample(5, seed=1))
 
     def test_summary(self):
         matrix = {'numeric':list(range(1, 10)), 'text':[str(x) for x in list(range(1, 10))], 'date':pd.date_range(datetime.today(), periods=9).tolist(), 'none':[None]*9}
@@ -186,5 +362,209 @@ class TestDataFrame(unittest.TestCase):
         s2 = actual.sort_values(ignore_index=True)
         pd.testing.assert_series_equal(s1, s2)
 
+class TestCompactDtypes(unittest.TestCase):
+    def test_compact_dtypes(self):
+        matrix = {'int':list(range(1, 10)), 'big':[2 ** 40] * 9, 'qty':[Decimal(x) for x in range(1, 10)], 'price':[Decimal('1.25')] * 8 + [None],
+                  'real':[0.5] * 9, 'status':['a', 'b', 'a', 'b', 'a', 'b', 'a', 'b', None], 'code':[str(x) for x in range(9)],
+                  'day':pd.date_range('2020-01-01', periods=9).date.tolist(), 'flag':[True, False] * 4 + [True], 'other':list(range(9))}
+        df = pd.DataFrame(matrix)
+        column_types = {'int': (23, 'integer'), 'big': (20, 'bigint'), 'qty': (1700, 'numeric(10,0)'), 'price': (1700, 'numeric(10,2)'), 'real': (700, 'real'),
+                        'status': (25, 'text'), 'code': (1043, 'character varying(5)'), 'day': (1082, 'date'), 'flag': (16, 'boolean')}
+        result = compact_dtypes(df, column_types)
+        expected = {'int': 'int8', 'big': 'int64', 'qty': 'int8', 'price': 'float64', 'real': 'float32', 'status': 'category', 'code': 'object',
+                    'day': 'datetime64[ns, UTC]', 'flag': 'bool', 'other': 'int64'}
+        self.assertEqual(result.dtypes.astype(str).to_dict(), expected)
+        self.assertEqual(list(result['qty']), list(range(1, 10)))
+        self.assertTrue(pd.isna(result['price'].iloc[-1]))
+        self.assertEqual(df['qty'].dtype, object)
+        self.assertLess(result.memory_usage(deep=True).sum(), df.memory_usage(deep=True).sum())
+
+class TestProfileExecutor(unittest.TestCase):
+    def test_run(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        data = Dataset(schema_name, table_name, db=db, bootstrap=True)
+        data.set_data()
+        executor = ProfileExecutor(data, max_in_flight=2)
+        profiles = {(kind, col_name): column for kind, col_name, column in executor.run()}
+        self.assertEqual(sorted(profiles), sorted(executor.get_columns()))
+        self.assertEqual(executor.pool.max_size, 2)
+
+        col_name = data.num_cols[0]
+        expected = NumericColumn(schema_name, table_name, col_name, db=db)
+        expected.set_data()
+        self.assertEqual(profiles[('numeric', col_name)].get_summary_df().values.tolist(), expected.get_summary_df().values.tolist())
+
+    def test_run_with_sketches(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        data = Dataset('public', 'employees', db=db, bootstrap=True)
+        data.set_data()
+        executor = ProfileExecutor(data, max_in_flight=2, distinct_precision=10, frequent_capacity=50)
+        for kind, col_name, column in executor.run():
+            self.assertEqual((column.distinct_precision, column.frequent_capacity), (10, 50))
+            self.assertIsNotNone(column.unique_error)
+
+    def test_run_stopped_early(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        data = Dataset('public', 'employees', db=db, bootstrap=True)
+        data.set_data()
+        executor = ProfileExecutor(data, max_in_flight=1)
+        profiles = executor.run()
+        next(profiles)
+        profiles.close()
+        self.assertEqual(executor.pool.n_open, 0)
+
+class TestProcessProfiler(unittest.TestCase):
+    def test_run(self):
+        matrix = {'numeric':list(range(1, 10)), 'float':[0.5, None, -1.5, 0.0, 2.5, 2.5, None, 3.0, 4.0], 'text':['a', 'b', None, 'a', 'c', 'a', 'b', None, 'd'], 'date':pd.date_range(datetime.today(), periods=9).tolist()}
+        df = pd.DataFrame(matrix)
+        data = Dataset(df=df)
+        data.num_cols, data.text_cols, data.date_cols = ['numeric', 'float'], ['text'], ['date']
+        profiles = {col_name: (kind, profile) for kind, col_name, profile in ProcessProfiler(data, max_workers=2).run()}
+        self.assertEqual(sorted(profiles), sorted(df.columns))
+        for col_name, (kind, profile) in profiles.items():
+            expected = profile_series(df[col_name], kind)
+            pd.testing.assert_frame_equal(profile.pop('frequent'), expected.pop('frequent'))
+            if kind == 'numeric':
+                pd.testing.assert_frame_equal(profile.pop('bins'), expected.pop('bins'))
+            self.assertEqual(profile, expected)
+        self.assertEqual(profiles['float'][1]['n_missing'], 2)
+        self.assertEqual(profiles['float'][1]['n_negatives'], 1)
+        self.assertEqual(profiles['text'][1]['n_unique'], 4)
+        self.assertEqual(profiles['text'][1]['n_mode'], 'a')
+        self.assertEqual(profiles['text'][1]['n_lowercase'], 7)
+
+    def test_get_column(self):
+        matrix = {'float':[0.5, None, -1.5, 0.0, 2.5, 2.5], 'text':['a', 'B', None, 'a', ' ', '12'], 'date':pd.to_datetime(['1970-01-01', '2024-01-06', None, '2024-01-08', '2024-01-08', '1900-01-01'])}
+        df = pd.DataFrame(matrix)
+        data = Dataset('public', 'local', df=df)
+        data.num_cols, data.text_cols, data.date_cols = ['float'], ['text'], ['date']
+        profiler = ProcessProfiler(data, max_workers=2)
+        columns = {col_name: profiler.get_column(kind, col_name, profile) for kind, col_name, profile in profiler.run()}
+        numeric, text, date = columns['float'], columns['text'], columns['date']
+        self.assertIsInstance(numeric, NumericColumn)
+        self.assertEqual((numeric.n_values, numeric.n_missing, numeric.n_zeros, numeric.n_negatives, numeric.col_median), (5, 1, 1, 1, 0.5))
+        self.assertEqual(numeric.histogram.data['Count of Records'].sum(), 5)
+        self.assertEqual((text.n_missing, text.n_empty, text.n_unique, text.n_mode, text.n_whitespace, text.n_lowercase, text.n_uppercase, text.n_alphabet, text.n_digit), (1, 1, 4, 'a', 1, 2, 1, 3, 1))
+        self.assertEqual(len(text.barchart.data), 4)
+        self.assertEqual((date.n_missing, date.n_weekend, date.n_weekday, date.n_future, date.n_empty_1900, date.n_empty_1970), (1, 1, 4, 0, 1, 1))
+        self.assertEqual(date.frequent['value'].iloc[0], pd.Timestamp('2024-01-08', tz='UTC'))
+        for column in columns.values():
+            self.assertIsNone(column.unique_error)
+            self.assertFalse(column.get_summary_df().empty)
+
+    def test_run_with_time_zones(self):
+        df = pd.DataFrame({'date':pd.to_datetime(['2024-01-01 10:00', None, '2024-01-01 10:00', '2024-03-01 23:30'], utc=True), 'local':pd.to_datetime(['2024-01-01 10:00', '2024-01-02', None, None]).tz_localize('Europe/Paris')})
+        data = Dataset(df=df)
+        data.num_cols, data.text_cols, data.date_cols = [], [], ['date', 'local']
+        spec, block = share_series(df['date'])
+        block.close()
+        block.unlink()
+        self.assertEqual(spec[3], 'UTC')
+        profiles = {col_name: profile for _, col_name, profile in ProcessProfiler(data, max_workers=2).run()}
+        for col_name in df.columns:
+            expected = profile_series(df[col_name], 'date')
+            pd.testing.assert_frame_equal(profiles[col_name].pop('frequent'), expected.pop('frequent'))
+            self.assertEqual(profiles[col_name], expected)
+        self.assertEqual(profiles['local']['col_min'], pd.Timestamp('2024-01-01 10:00', tz='Europe/Paris'))
+
+class TestDatasetCache(unittest.TestCase):
+    def test_get_put(self):
+        cache = DatasetCache()
+        data = Dataset('schema', 'table', db=PostgresConnector(), df=pd.DataFrame({'numeric':list(range(1, 10))}))
+        data.version = '1-0-0'
+        key = cache.get_key(data)
+        self.assertIsNone(cache.get(key))
+        cache.put(key, data)
+        self.assertIs(cache.get(key), data)
+        self.assertEqual(cache.n_bytes, data.get_memory_usage())
+
+    def test_put_without_version(self):
+        cache = DatasetCache()
+        data = Dataset('schema', 'view', db=PostgresConnector(), df=pd.DataFrame({'numeric':list(range(1, 10))}))
+        data.version = ''
+        key = cache.get_key(data)
+        self.assertIsNone(key)
+        cache.put(key, data)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.n_bytes, 0)
+
+    def test_lru_eviction(self):
+        datasets = []
+        for table_name in ['table_1', 'table_2', 'table_3']:
+            data = Dataset('schema', table_name, db=PostgresConnector(), df=pd.DataFrame({'numeric':list(range(1, 100))}))
+            data.version = '1-0-0'
+            datasets.append(data)
+        cache = DatasetCache(max_bytes=2 * datasets[0].get_memory_usage())
+        cache.put(cache.get_key(datasets[0]), datasets[0])
+        cache.put(cache.get_key(datasets[1]), datasets[1])
+        cache.get(cache.get_key(datasets[0]))
+        cache.put(cache.get_key(datasets[2]), datasets[2])
+        self.assertIs(cache.get(cache.get_key(datasets[0])), datasets[0])
+        self.assertIsNone(cache.get(cache.get_key(datasets[1])))
+        self.assertIs(cache.get(cache.get_key(datasets[2])), datasets[2])
+
+    def test_invalidate(self):
+        cache = DatasetCache()
+        for table_name in ['table_1', 'table_2']:
+            data = Dataset('schema', table_name, db=PostgresConnector(), df=pd.DataFrame({'numeric':list(range(1, 10))}))
+            data.version = '1-0-0'
+            cache.put(cache.get_key(data), data)
+        cache.invalidate('schema', 'table_1')
+        self.assertEqual(len(cache.entries), 1)
+        cache.invalidate()
+        self.assertEqual(len(cache.entries), 0)
+        self.assertEqual(cache.n_bytes, 0)
+
+    def test_column_profiles_eviction(self):
+        profiles = [NumericColumn(ds=pd.Series(range(1000), dtype='float64')) for _ in range(3)]
+        cache = DatasetCache(max_bytes=2 * profiles[0].get_memory_usage())
+        for i, profile in enumerate(profiles):
+            cache.put(('schema', 'table', 'numeric', f'column_{i}'), profile)
+        self.assertEqual(profiles[0].get_memory_usage(), profiles[0].serie.memory_usage(deep=True))
+        self.assertIsNone(cache.get(('schema', 'table', 'numeric', 'column_0')))
+        self.assertIs(cache.get(('schema', 'table', 'numeric', 'column_2')), profiles[2])
+        self.assertEqual(cache.n_bytes, 2 * profiles[0].get_memory_usage())
+
+class TestSnapshotStore(unittest.TestCase):
+    def test_set_rows_reads_snapshot(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = SnapshotStore(directory)
+            data = Dataset(schema_name, table_name, db=db, chunksize=2, snapshots=snapshots)
+            data.set_rows()
+            self.assertTrue(snapshots.contains(data))
+            cached = Dataset(schema_name, table_name, db=PostgresConnector(), snapshots=snapshots)
+            cached.version = data.version
+            cached.set_rows()
+            pd.testing.assert_frame_equal(cached.df, data.df)
+            listing = snapshots.list_snapshots()
+            self.assertEqual(listing[['schema_name', 'table_name', 'version']].values.tolist(), [[schema_name, table_name, data.version]])
+
+    def test_write_evict_purge(self):
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = SnapshotStore(directory, file_format='parquet')
+            data = Dataset('schema', 'table_1', db=PostgresConnector(), df=pd.DataFrame({'numeric':list(range(1, 100)), 'text':['a', None, 'c'] * 33}))
+            data.version = '1-0-0'
+            path = snapshots.write(data)
+            pd.testing.assert_frame_equal(snapshots.read(data), data.df)
+            data.version = '2-0-0'
+            snapshots.write(data)
+            self.assertFalse(os.path.exists(path))
+            snapshots.max_bytes = 2 * os.path.getsize(snapshots.get_path(data))
+            for table_name in ['table_2', 'table_3']:
+                os.utime(snapshots.get_path(data), (0, 0))
+                data.table_name = table_name
+                snapshots.write(data)
+            self.assertEqual(sorted(snapshots.list_snapshots()['table_name']), ['table_2', 'table_3'])
+            self.assertEqual(snapshots.purge('schema', 'table_2'), 1)
+            self.assertEqual(snapshots.purge(), 1)
+            self.assertTrue(snapshots.list_snapshots().empty)
+            data.version = ''
+            self.assertIsNone(snapshots.write(data))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
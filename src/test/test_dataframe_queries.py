@@ -4,6 +4,7 @@ import pandas as pd
 from src.dataframe.queries import *
 
 class TestDataFrameQueries(unittest.TestCase):
+
     def test_numeric_query(self):
         schema_name = 'schema'
         table_name = 'table'
@@ -25,5 +26,62 @@ class TestDataFrameQueries(unittest.TestCase):
         expected_query = f"select column_name from information_schema.columns where table_schema = '{schema_name}' and table_name = '{table_name}' and data_type in ('timestamp without time zone', 'timestamp with time zone', 'time with time zone', 'time without time zone', 'interval', 'date')"
         self.assertEqual(test_query, expected_query)
 
+    def test_table_version_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_table_version_query(schema_name, table_name)
+        expected_query = f"with recursive tree as (select c.oid as relid, c.relkind from pg_class c join pg_namespace n on n.oid = c.relnamespace where n.nspname = '{schema_name}' and c.relname = '{table_name}' union all select i.inhrelid, p.relkind from tree join pg_inherits i on i.inhparent = tree.relid join pg_class p on p.oid = i.inhrelid where tree.relkind = 'p') select sum(s.n_tup_ins), sum(s.n_tup_upd), sum(s.n_tup_del), sum(pg_relation_filenode(s.relid)::bigint), count(*), coalesce((extract(epoch from max(d.stats_reset)) * 1000000)::bigint, 0) from tree join pg_stat_user_tables s on s.relid = tree.relid join pg_stat_database d on d.datname = current_database() where tree.relkind <> 'p' having count(*) > 0"
+        self.assertEqual(test_query, expected_query)
+
+    def test_row_missing_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_row_missing_query(schema_name, table_name, ['a', 'b'])
+        expected_query = f"select count(*), count(*) filter (where a is null) + count(*) filter (where b is null) from {schema_name}.{table_name}"
+        self.assertEqual(test_query, expected_query)
+
+    def test_duplicates_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_duplicates_query(schema_name, table_name)
+        expected_query = f"select coalesce(sum(n - 1), 0) from (select count(*) as n from {schema_name}.{table_name} as t group by md5(t::text)) as row_groups"
+        self.assertEqual(test_query, expected_query)
+
+    def test_row_estimate_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_row_estimate_query(schema_name, table_name)
+        expected_query = f"select c.reltuples::bigint, s.n_live_tup, s.n_mod_since_analyze, greatest(s.last_analyze, s.last_autoanalyze) from pg_class c join pg_namespace n on n.oid = c.relnamespace left join pg_stat_user_tables s on s.relid = c.oid where n.nspname = '{schema_name}' and c.relname = '{table_name}'"
+        self.assertEqual(test_query, expected_query)
+
+    def test_column_stats_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_column_stats_query(schema_name, table_name)
+        expected_query = f"select s.attname, s.null_frac, s.n_distinct, s.most_common_vals::text::text[], s.most_common_freqs, s.histogram_bounds::text::text[], c.reltuples from pg_stats s join pg_namespace n on n.nspname = s.schemaname join pg_class c on c.relnamespace = n.oid and c.relname = s.tablename where s.schemaname = '{schema_name}' and s.tablename = '{table_name}' and s.inherited = (c.relkind = 'p')"
+        self.assertEqual(test_query, expected_query)
+
+    def test_page_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        self.assertEqual(get_page_query(schema_name, table_name, ['id'], 10), f"select * from {schema_name}.{table_name} order by id limit 10")
+        self.assertEqual(get_page_query(schema_name, table_name, ['a', 'b'], 10, after=[1, "x'y"]), f"select * from {schema_name}.{table_name} where (a, b) > ('1', 'x''y') order by a, b limit 10")
+        self.assertEqual(get_page_query(schema_name, table_name, ['ctid'], 10, descending=True), f"select ctid, * from {schema_name}.{table_name} order by ctid desc limit 10")
+        self.assertEqual(get_page_query(schema_name, table_name, ['ctid'], 10, after=['(3,4)'], blocks=(3, 5)), f"select ctid, * from {schema_name}.{table_name} where (ctid) > ('(3,4)') and ctid >= '(3,0)' and ctid < '(5,0)' order by ctid limit 10")
+        self.assertEqual(get_page_query(schema_name, table_name, ['ctid'], 10, descending=True, blocks=(7, None)), f"select ctid, * from {schema_name}.{table_name} where ctid >= '(7,0)' order by ctid desc limit 10")
+
+    def test_table_blocks_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        test_query = get_table_blocks_query(schema_name, table_name)
+        expected_query = f"select pg_relation_size(c.oid) / current_setting('block_size')::bigint from pg_class c join pg_namespace n on n.oid = c.relnamespace where n.nspname = '{schema_name}' and c.relname = '{table_name}'"
+        self.assertEqual(test_query, expected_query)
+
+    def test_row_counts_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        self.assertEqual(get_row_counts_query(schema_name, table_name, ['a', 'b']), get_scan_query(schema_name, table_name, ["count(*) filter (where a is null) + count(*) filter (where b is null)"]))
+        self.assertEqual(get_row_counts_query(schema_name, table_name, [], "id > '3'", 'id'), f"SELECT txid_current_snapshot()::text, max(id)::text, count(*), NULL, 0 FROM {schema_name}.{table_name} WHERE id > '3'")
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
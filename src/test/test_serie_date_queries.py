@@ -60,6 +60,22 @@ class TestSerieDateQueries(unittest.TestCase):
         expected_query = f"select count({col_name}) from {schema_name}.{table_name} where {col_name} = '1970-01-01'"
         self.assertEqual(test_query, expected_query)
 
+    def test_summary_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_summary_query(schema_name, table_name, col_name)
+        expected_query = f"select count(distinct {col_name}), count(*) filter (where {col_name} is null), min({col_name}), max({col_name}), count(*) filter (where extract(isodow from {col_name}) in (6, 7)), count(*) filter (where extract(isodow from {col_name}) in (1, 2, 3, 4, 5)), count(*) filter (where {col_name} > current_date), count(*) filter (where {col_name} = '1900-01-01'), count(*) filter (where {col_name} = '1970-01-01') from {schema_name}.{table_name}"
+        self.assertEqual(test_query, expected_query)
+
+    def test_future_days_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_future_days_query(schema_name, table_name, col_name, "id > '10'")
+        expected_query = f"select {col_name}::date, count(*), count(*) filter (where {col_name} > {col_name}::date) from {schema_name}.{table_name} where {col_name} >= current_date and id > '10' group by 1"
+        self.assertEqual(test_query, expected_query)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
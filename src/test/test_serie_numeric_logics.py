@@ -2,8 +2,9 @@ import unittest
 import pandas as pd
 import sqlalchemy as db
 import numpy as np
+import psycopg2
 
-from src.database.logics import PostgresConnector
+from src.database.logics import PostgresConnector, profile_columns
 from src.serie_numeric.logics import NumericColumn
 
 def setup_local():
@@ -18,6 +19,16 @@ def get_data_local(engine, table_name):
     res_df = res_proxy.fetchall()
     return pd.DataFrame(res_df)
 
+def execute_local(connector, sql_query, flush=False):
+    connector.open_connection()
+    connector.open_cursor()
+    connector.cursor.execute(sql_query)
+    if flush:
+        connector.cursor.execute("select pg_stat_force_next_flush()")
+    connector.conn.commit()
+    connector.close_cursor()
+    connector.close_connection()
+
 class TestSerie(unittest.TestCase):
     def test_init(self):
         schema_name = 'schema'
@@ -51,8 +62,6 @@ class TestSerie(unittest.TestCase):
 
         numeric_data = NumericColumn(schema_name, table_name, col_name, db=PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432'))
         numeric_data.set_data()
-        numeric_data.serie = pd.Series(numeric_data.serie)
-        numeric_data.serie.name = 'employee_id'
 
         counts = result_serie.value_counts().to_frame()
         percentages = round(result_serie.value_counts(normalize=True).to_frame().head(20), 4)
@@ -61,7 +70,7 @@ class TestSerie(unittest.TestCase):
         counts_df['occurrence'] = counts.values
         counts_df['percentage'] = percentages.values
 
-        pd.testing.assert_series_equal(numeric_data.serie, result_serie)
+        self.assertTrue(numeric_data.serie.empty)
         self.assertEqual(numeric_data.n_unique, result_serie.nunique())
         self.assertEqual(numeric_data.n_missing, result_serie.isna().sum())
         self.assertEqual(numeric_data.col_mean, result_serie.mean())
@@ -88,6 +97,128 @@ class TestSerie(unittest.TestCase):
         test_numeric_data.set_missing()
         self.assertEqual(test_numeric_data.n_missing, result_serie.isna().sum())
 
+    def test_histogram(self):
+        rand_data = pd.Series(np.random.normal(size=10000))
+        test_numeric_data = NumericColumn(ds = rand_data)
+        test_numeric_data.set_histogram()
+        histogram_data = test_numeric_data.histogram.data
+        self.assertLessEqual(histogram_data.shape[0], 50)
+        self.assertEqual(histogram_data['Count of Records'].sum(), rand_data.shape[0])
+
+    def test_histogram_non_finite(self):
+        test_numeric_data = NumericColumn(ds = pd.Series([1.0, 2.0, np.nan, np.inf, -np.inf, 3.0]))
+        test_numeric_data.set_histogram()
+        self.assertEqual(test_numeric_data.histogram.data['Count of Records'].sum(), 3)
+
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.histogram_test; create table public.histogram_test as select score from public.employees union all select unnest(array['NaN', 'Infinity', '-Infinity', null]::double precision[])")
+        try:
+            test_numeric_data = NumericColumn('public', 'histogram_test', 'score', db=db)
+            test_numeric_data.set_histogram()
+            histogram_data = test_numeric_data.histogram.data
+            self.assertEqual(histogram_data['Count of Records'].sum(), 5000 - get_data_local(setup_local(), 'employees')['score'].isna().sum())
+            self.assertTrue(np.isfinite(histogram_data[['bin_start', 'bin_end']].values).all())
+        finally:
+            execute_local(db, "drop table if exists public.histogram_test")
+
+    def test_catalog_stats(self):
+        stats = {'n_rows': 1000, 'n_missing': 100, 'n_unique': 12, 'values': ['0', '5'], 'occurrences': [200, 100], 'percentages': [0.2, 0.1], 'bounds': ['-10', '0', '10', '20'], 'n_histogram': 200}
+        test_numeric_data = NumericColumn(column_name='numeric')
+        test_numeric_data.set_catalog_stats(stats)
+        histogram_data = test_numeric_data.histogram.data
+        self.assertTrue(test_numeric_data.estimated)
+        self.assertEqual(test_numeric_data.n_values, 900)
+        self.assertEqual(test_numeric_data.col_min, -10)
+        self.assertEqual(test_numeric_data.col_max, 20)
+        self.assertEqual(histogram_data.shape[0], 3)
+        self.assertEqual(histogram_data['Count of Records'].sum(), 900)
+        self.assertEqual(list(test_numeric_data.frequent['value']), [0, 5])
+
+    def test_set_data_async(self):
+        schema_name = 'public'
+        table_name = 'employees'
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+
+        expected = NumericColumn(schema_name, table_name, 'employee_id', db=db)
+        expected.set_data()
+        columns = [NumericColumn(schema_name, table_name, col_name, db=db) for col_name in ['employee_id', 'salary', 'score']]
+        profile_columns(columns, db, max_concurrency=2)
+
+        self.assertEqual(expected.get_summary_df().values.tolist(), columns[0].get_summary_df().values.tolist())
+        pd.testing.assert_frame_equal(expected.frequent, columns[0].frequent)
+        self.assertTrue(all(column.histogram is not None for column in columns))
+        pd.testing.assert_frame_equal(expected.histogram.data, columns[0].histogram.data)
+
+    def test_set_data_approximate_distinct(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        expected = NumericColumn('public', 'employees', 'salary', db=db)
+        expected.set_data()
+        test_numeric_data = NumericColumn('public', 'employees', 'salary', db=db, distinct_precision=14)
+        test_numeric_data.set_data()
+        self.assertAlmostEqual(test_numeric_data.n_unique, expected.n_unique, delta=4 * test_numeric_data.unique_error * expected.n_unique + 1)
+        self.assertIsNone(expected.unique_error)
+        self.assertEqual(test_numeric_data.get_summary_df()['Value'][0], '{:,.0f} ± 0.8% (HyperLogLog)'.format(test_numeric_data.n_unique))
+        self.assertEqual(expected.get_summary_df()['Value'][1:].tolist(), test_numeric_data.get_summary_df()['Value'][1:].tolist())
+        self.assertTrue(test_numeric_data.serie.empty)
+
+        async_numeric_data = NumericColumn('public', 'employees', 'salary', db=db, distinct_precision=14)
+        profile_columns([async_numeric_data], db)
+        self.assertAlmostEqual(async_numeric_data.n_unique, expected.n_unique, delta=4 * async_numeric_data.unique_error * expected.n_unique + 1)
+        self.assertTrue(async_numeric_data.serie.empty)
+
+    def test_set_data_frequent_capacity(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        expected = NumericColumn('public', 'employees', 'salary', db=db)
+        expected.set_data()
+        columns = [NumericColumn('public', 'employees', 'salary', db=db, frequent_capacity=1000) for _ in range(2)]
+        columns[0].set_data()
+        profile_columns(columns[1:], db)
+        for column in columns:
+            self.assertTrue(column.serie.empty)
+            self.assertEqual(expected.frequent['occurrence'].tolist(), column.frequent['occurrence'].tolist())
+
+    def test_refresh(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        execute_local(db, "drop table if exists public.refresh_test; create table public.refresh_test as select salary from public.employees")
+        try:
+            test_numeric_data = NumericColumn('public', 'refresh_test', 'salary', db=db)
+            test_numeric_data.refresh()
+            self.assertFalse(test_numeric_data.state.incremental)
+            execute_local(db, "insert into public.refresh_test select salary * 2 from public.employees limit 50")
+            test_numeric_data.refresh()
+            self.assertTrue(test_numeric_data.state.incremental)
+            self.assertEqual(test_numeric_data.state.n_scanned, 50)
+
+            expected = NumericColumn('public', 'refresh_test', 'salary', db=db)
+            expected.set_data()
+            self.assertEqual(expected.get_summary_df().values.tolist()[1:8], test_numeric_data.get_summary_df().values.tolist()[1:8])
+            self.assertLess(abs(test_numeric_data.n_unique - expected.n_unique), 4 * test_numeric_data.unique_error * expected.n_unique + 1)
+            self.assertLessEqual(abs(test_numeric_data.col_median - float(expected.col_median)), test_numeric_data.bin_width)
+            self.assertEqual(expected.frequent['occurrence'].tolist(), test_numeric_data.frequent['occurrence'].tolist())
+            self.assertLessEqual(len(test_numeric_data.bins), 1024)
+
+            open_conn = psycopg2.connect(user=db.user, password=db.password, host=db.host, port=db.port, database=db.database)
+            open_conn.cursor().execute("savepoint before_insert; insert into public.refresh_test values (-1000000)")
+            execute_local(db, "insert into public.refresh_test values (2)")
+            test_numeric_data.refresh()
+            self.assertEqual(1, test_numeric_data.state.n_scanned)
+            open_conn.commit()
+            open_conn.close()
+            test_numeric_data.refresh()
+            self.assertTrue(test_numeric_data.state.incremental)
+            self.assertEqual((1, -1000000.0), (test_numeric_data.state.n_scanned, test_numeric_data.col_min))
+
+            execute_local(db, "truncate public.refresh_test; insert into public.refresh_test values (5)", flush=True)
+            test_numeric_data.refresh()
+            self.assertFalse(test_numeric_data.state.incremental)
+            self.assertEqual(1, test_numeric_data.n_values)
+
+            execute_local(db, "update public.refresh_test set salary = 0 where salary < 50000", flush=True)
+            test_numeric_data.refresh()
+            self.assertFalse(test_numeric_data.state.incremental)
+        finally:
+            execute_local(db, "drop table if exists public.refresh_test")
+
     def test_summary(self):
         schema_name = 'public'
         table_name = 'employees'
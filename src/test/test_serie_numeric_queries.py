@@ -28,5 +28,53 @@ class TestSerieNumericQueries(unittest.TestCase):
         expected_query = f"select count(distinct {col_name}) from {schema_name}.{table_name}"
         self.assertEqual(test_query, expected_query)
 
+    def test_get_summary_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_summary_query(schema_name, table_name, col_name)
+        expected_query = f"select count({col_name}), count(distinct {col_name}), count(*) filter (where {col_name} is null), avg({col_name}), stddev({col_name}), min({col_name}), max({col_name}), percentile_cont(0.5) within group (order by {col_name}), count(*) filter (where {col_name} = 0), count(*) filter (where {col_name} < 0) from {schema_name}.{table_name}"
+        self.assertEqual(test_query, expected_query)
+
+    def test_get_summary_query_approximate_distinct(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_summary_query(schema_name, table_name, col_name, 14, server_hll=True)
+        self.assertTrue(test_query.startswith(f"select count({col_name}), coalesce(hll_cardinality(hll_add_agg(hll_hash_any({col_name}), 14)), 0)::bigint, count(*) filter"))
+        self.assertTrue(get_summary_query(schema_name, table_name, col_name, 14).startswith(f"select count({col_name}), NULL, count(*) filter"))
+
+    def test_get_histogram_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_histogram_query(schema_name, table_name, col_name, 0.0, 10.0, 50)
+        expected_query = f"select least(width_bucket({col_name}, 0.0, 10.0, 50), 50) as bin, count(*) from {schema_name}.{table_name} where {col_name} is not null group by 1 order by 1"
+        self.assertEqual(test_query, expected_query)
+
+    def test_get_histogram_query_finite_only(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_histogram_query(schema_name, table_name, col_name, 0.0, 10.0, 50, finite_only=True)
+        expected_query = f"select least(width_bucket({col_name}, 0.0, 10.0, 50), 50) as bin, count(*) from {schema_name}.{table_name} where {col_name} not in ('NaN', 'Infinity', '-Infinity') group by 1 order by 1"
+        self.assertEqual(test_query, expected_query)
+
+    def test_get_finite_range_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_finite_range_query(schema_name, table_name, col_name)
+        expected_query = f"select min({col_name}), max({col_name}) from {schema_name}.{table_name} where {col_name} not in ('NaN', 'Infinity', '-Infinity')"
+        self.assertEqual(test_query, expected_query)
+
+    def test_get_bins_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_name = 'column'
+        test_query = get_bins_query(schema_name, table_name, col_name, -5, 0.25, "id > '10'")
+        expected_query = f"select floor(({col_name}::float8 - -5.0) / 0.25)::bigint, count(*) from {schema_name}.{table_name} where {col_name}::float8 not in ('NaN', 'Infinity', '-Infinity') and id > '10' group by 1"
+        self.assertEqual(test_query, expected_query)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
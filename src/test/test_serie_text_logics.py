@@ -52,8 +52,6 @@ class TestSerie(unittest.TestCase):
 
         text_data = TextColumn(schema_name, table_name, col_name, db=PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432'))
         text_data.set_data()
-        text_data.serie = pd.Series(text_data.serie)
-        text_data.serie.name = 'last_name'
 
         counts = result_serie.value_counts().to_frame()
         counts_perc = round(result_serie.value_counts(normalize=True).to_frame().head(20), 4)
@@ -62,7 +60,7 @@ class TestSerie(unittest.TestCase):
         counts_df['occurrence'] = counts.values
         counts_df['percentage'] = counts_perc.values
 
-        pd.testing.assert_series_equal(text_data.serie, result_serie)
+        self.assertTrue(text_data.serie.empty)
         self.assertEqual(text_data.n_unique, result_serie.nunique())
         self.assertEqual(text_data.n_missing, result_serie.isna().sum())
         self.assertEqual(text_data.n_mode, result_serie.mode()[0])
@@ -73,6 +71,7 @@ class TestSerie(unittest.TestCase):
         self.assertEqual(text_data.n_empty, result_serie.isna().sum())
         self.assertEqual(text_data.n_digit, sum(result_serie.str.isdigit() == True))
         pd.testing.assert_frame_equal(text_data.frequent, counts_df)
+        self.assertEqual(len(text_data.barchart.data), len(text_data.frequent))
 
 
     def test_empty(self):
@@ -96,6 +95,19 @@ class TestSerie(unittest.TestCase):
         data_1 = TextColumn(df)
         self.assertFalse(pd.isnull(data_1)) 
 
+    def test_frequent(self):
+        db = PostgresConnector(database='postgres', user='postgres', password='password', host='localhost', port='5432')
+        engine = setup_local()
+        result_serie = get_data_local(engine, 'employees')['name']
+        text_data = TextColumn('public', 'employees', 'name', db=db)
+        text_data.set_data()
+        counts = result_serie.value_counts()
+        self.assertEqual(text_data.frequent['occurrence'].tolist(), counts.head(20).tolist())
+        self.assertEqual(text_data.frequent['percentage'].tolist(), round(counts.head(20) / counts.sum(), 4).tolist())
+        approximate = TextColumn('public', 'employees', 'name', db=db, frequent_capacity=1000)
+        approximate.set_data()
+        pd.testing.assert_frame_equal(text_data.frequent, approximate.frequent)
+
     def test_summary(self):
         schema_name = 'public'
         table_name = 'employees'
@@ -68,5 +68,14 @@ class TestSerieDateQueries(unittest.TestCase):
         expected_query  = f"SELECT count(*) FROM {schema_name}.{table_name} where {col_name} is NULL"
         self.assertEqual(test_query, expected_query)
 
+    def test_get_profile_query(self):
+        schema_name = 'schema'
+        table_name = 'table'
+        col_names = ['column_a', 'column_b']
+        test_query = get_profile_query(schema_name, table_name, col_names)
+        columns_aggregates = [f"count(*) filter (where {col_name} is null), count(distinct {col_name}), mode() within group (order by {col_name}), count(*) filter (where {col_name} ~ '^[[:space:]]*$'), count(*) filter (where {col_name} ~ '^[[:lower:]]*$'), count(*) filter (where {col_name} ~ '^[[:upper:]]*$'), count(*) filter (where {col_name} ~ '^[[:alpha:]]*$'), count(*) filter (where {col_name} ~ '^[[:digit:]]*$')" for col_name in col_names]
+        expected_query = f"SELECT {', '.join(columns_aggregates)} FROM {schema_name}.{table_name}"
+        self.assertEqual(test_query, expected_query)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file